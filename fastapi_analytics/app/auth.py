@@ -3,13 +3,14 @@ Django Token cross-schema verification for FastAPI.
 
 Reads public.authtoken_token table to verify Django REST Framework tokens.
 Same cross-schema pattern used by FCM service (public.accounts_devicetoken).
+Lookups go through a per-worker token cache (app.services.token_cache).
 """
 from fastapi import Depends, Header, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 import logging
 
 from app.database import get_db
+from app.services.token_cache import token_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +22,8 @@ def get_current_user(
     """
     Verify Django Token and return user_id (integer).
 
-    Reads public.authtoken_token table cross-schema.
-    Same pattern as FCM service reading public.accounts_devicetoken.
+    Reads public.authtoken_token table cross-schema (cached per worker;
+    deleted tokens are evicted via NOTIFY).
 
     Usage:
         @router.get("/my-data")
@@ -37,15 +38,12 @@ def get_current_user(
 
     token_key = authorization[6:]  # Strip "Token " prefix
 
-    result = db.execute(
-        text("SELECT user_id FROM public.authtoken_token WHERE key = :token"),
-        {"token": token_key},
-    ).fetchone()
+    user_id = token_cache.resolve(db, token_key)
 
-    if not result:
+    if user_id is None:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    return result[0]
+    return user_id
 
 
 def get_optional_user(
@@ -68,9 +66,4 @@ def get_optional_user(
 
     token_key = authorization[6:]
 
-    result = db.execute(
-        text("SELECT user_id FROM public.authtoken_token WHERE key = :token"),
-        {"token": token_key},
-    ).fetchone()
-
-    return result[0] if result else None
+    return token_cache.resolve(db, token_key)
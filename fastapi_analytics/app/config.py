@@ -10,6 +10,26 @@ class Settings(BaseSettings):
     DESCRIPTION: str = "Read-only analytics API for HypeHere mobile app"
     FIREBASE_CREDENTIALS_PATH: str = "/opt/marketlens/firebase-service-account.json"
 
+    # Response caching (in-process LRU + optional shared Redis tier)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    RESPONSE_CACHE_TTL_SECONDS: int = 900
+    CACHE_REDIS_URL: str | None = None  # e.g. redis://localhost:6379/0
+    DATA_VERSION_REFRESH_SECONDS: float = 5.0  # How often workers reload analytics.data_versions
+    SEARCH_INDEX_MAX_AGE_SECONDS: float = 3600.0  # Ticker search index rebuild interval (popularity)
+    PORTFOLIO_PNL_MAX_USERS: int = 10000  # Per-worker real-time P&L books (/portfolio/summary)
+
+    # Django token → user_id cache (app.auth)
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 60.0  # 0 disables caching
+    AUTH_TOKEN_NEGATIVE_TTL_SECONDS: float = 10.0  # Unknown/invalid tokens (0 disables)
+    AUTH_TOKEN_NEGATIVE_CACHE_MAX_ENTRIES: int = 1000  # Separate LRU (random tokens can't evict valid ones)
+    AUTH_TOKEN_LISTEN: bool = True  # LISTEN authtoken_invalidated for immediate eviction
+
+    # Response compression (gzip always, brotli if the package is installed)
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+
     class Config:
         env_file = ".env"
 
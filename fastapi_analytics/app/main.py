@@ -4,6 +4,16 @@ from fastapi.staticfiles import StaticFiles
 from app.routers import scores, tickers, prices, internal_ingest, dashboard, charts, market, macro, earnings, news, events, portfolio, alerts
 from app.config import settings
 from app.schemas import HealthCheck
+from app.services.response_cache import all_cache_stats
+from app.services.latest_scores import latest_scores
+from app.services.leaderboards import leaderboards
+from app.services.portfolio_pnl import portfolio_pnl
+from app.services.search_index import search_index
+from app.services.ticker_metadata import ticker_metadata
+from app.services.token_cache import token_cache
+from app.services.treemap_snapshots import treemap_snapshots
+from app.utils.compression import CompressionMiddleware
+from app.utils.multilang import unpack_stats
 
 # Create FastAPI application
 app = FastAPI(
@@ -21,8 +31,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],  # CRUD for portfolio + existing
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],  # Conditional GET from the web dashboard
 )
 
+# gzip/brotli compression (Accept-Encoding, min size COMPRESSION_MIN_SIZE)
+app.add_middleware(CompressionMiddleware)
+
 # Mount static files (using /analytics-static to avoid conflict with Django static files)
 app.mount("/analytics-static", StaticFiles(directory="app/static"), name="static")
 
@@ -143,6 +157,23 @@ def health_check():
     }
 
 
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """
+    Response cache hit/miss statistics (per worker process)
+    """
+    stats = all_cache_stats()
+    stats["treemap_snapshots"] = treemap_snapshots.stats()
+    stats["leaderboards"] = leaderboards.stats()
+    stats["latest_scores"] = latest_scores.stats()
+    stats["search_index"] = search_index.stats()
+    stats["ticker_metadata"] = ticker_metadata.stats()
+    stats["multilang_unpack"] = unpack_stats()
+    stats["portfolio_pnl"] = portfolio_pnl.stats()
+    stats["auth_tokens"] = token_cache.stats()
+    return stats
+
+
 @app.on_event("startup")
 async def startup_event():
     """Execute on application startup"""
@@ -150,6 +181,9 @@ async def startup_event():
     print(f"📊 Read-only ticker scoring API")
     print(f"✅ Endpoints: /api/v1/scores, /api/v1/tickers")
 
+    if settings.AUTH_TOKEN_LISTEN:
+        token_cache.start_listener()
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -403,6 +403,14 @@ class MacroIndicator(Base):
     risk_level = Column(String(20))       # CRITICAL/WARNING/NORMAL (시장레이더)
     signal_message = Column(String)       # 한국어 설명 메시지
     liquidity_status = Column(String(20)) # EXPANDING/CONTRACTING/NEUTRAL (머니프린팅)
+    # Rolling-window stats (trailing 90d / 365d incl. this date, refreshed at ingest)
+    high_3m = Column(Float)
+    avg_3m = Column(Float)
+    low_3m = Column(Float)
+    high_1y = Column(Float)
+    avg_1y = Column(Float)
+    low_1y = Column(Float)
+    percentile_1y = Column(Float)         # 0–100, percent rank within the 1y window
     updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
 
 
@@ -835,3 +843,214 @@ class NotificationLog(Base):
     failure_count = Column(Integer, server_default=text('0'))
     error_detail = Column(Text)
     created_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class DataVersion(Base):
+    """
+    데이터 버전 카운터 (캐시 무효화용).
+
+    Ingest 핸들러가 데이터 변경 시 key별 version을 +1.
+    읽기 경로는 version을 캐시 키에 포함 → 버전이 바뀌면 자동 무효화.
+    """
+    __tablename__ = "data_versions"
+    __table_args__ = {'schema': 'analytics'}
+
+    key = Column(String(100), primary_key=True)  # "ticker:AAPL", "scores", "news" ...
+    version = Column(BigInteger, nullable=False, server_default=text('0'))
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TickerStaticSections(Base):
+    """
+    차트 응답의 정적 섹션 사전 렌더링 (ticker PK).
+
+    profile/key_metrics/financials/dividends/calendar/earnings_history/
+    defense_lines/recommendations/institutional_holders/classification을
+    scores ingest 시점에 JSON으로 직렬화해 저장 → /charts 에서 그대로 splice.
+    """
+    __tablename__ = "ticker_static_sections"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(50), primary_key=True)
+    body = Column(Text, nullable=False)  # JSON object (10 sections)
+    built_on = Column(Date, nullable=False)  # earnings_days_remaining 기준일
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TickerDailyWide(Base):
+    """
+    차트 일별 행 비정규화 테이블 (ticker + date PK).
+
+    ChartDataPoint의 모든 필드를 한 행에 저장 (prices/scores/indicators/targets/
+    institutions/shorts/ai_analysis 7개 테이블 병합 결과).
+    scores ingest 시 정규화 테이블과 함께 UPSERT, 과거 데이터는 backfill_daily_wide.py.
+    """
+    __tablename__ = "ticker_daily_wide"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(50), primary_key=True)
+    date = Column(Date, primary_key=True)
+    has_price = Column(Boolean, nullable=False, server_default=text('false'))
+
+    # ticker_prices
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
+    volume = Column(BigInteger)
+
+    # ticker_scores
+    score = Column(Float)
+    signal = Column(String(20))
+
+    # ticker_targets
+    target_price = Column(Float)
+    stop_loss = Column(Float)
+
+    # ticker_indicators
+    rsi = Column(Float)
+    mfi = Column(Float)
+    macd = Column(Float)
+    macd_signal = Column(Float)
+    macd_hist = Column(Float)
+    bb_width = Column(Float)
+    bb_upper = Column(Float)
+    bb_lower = Column(Float)
+    bb_middle = Column(Float)
+
+    # ticker_institutions
+    inst_ownership = Column(Float)
+    foreign_ownership = Column(Float)
+    insider_ownership = Column(Float)
+    inst_chg_1d = Column(Float)
+    inst_chg_5d = Column(Float)
+    foreign_chg_1d = Column(Float)
+    foreign_chg_5d = Column(Float)
+
+    # ticker_shorts
+    short_ratio = Column(Float)
+    short_percent_float = Column(Float)
+
+    # ticker_ai_analysis
+    ai_probability = Column(Float)
+    ai_summary = Column(String(4000))
+    ai_bullish_reasons = Column(JSONB)
+    ai_bearish_reasons = Column(JSONB)
+    ai_final_comment = Column(String(4000))
+    ai_analysis_ko = Column(Text)
+    ai_analysis_en = Column(Text)
+    ai_analysis_zh = Column(Text)
+    ai_analysis_ja = Column(Text)
+    ai_analysis_es = Column(Text)
+    ai_expert_prediction = Column(String(20))
+    ai_expert_key_factors = Column(JSONB)
+
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class DataWatermark(Base):
+    """
+    데이터셋별 최신 날짜 워터마크.
+
+    Ingest가 GREATEST(기존, 신규)로 갱신 → 읽기 경로는 MAX(date) 스캔 없이 "최신 날짜" 결정.
+    """
+    __tablename__ = "data_watermarks"
+    __table_args__ = {'schema': 'analytics'}
+
+    dataset = Column(String(50), primary_key=True)  # "prices", "scores", "indicators", "macro", ...
+    latest_date = Column(Date, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TickerNewsHourly(Base):
+    """
+    종목별 시간 단위 뉴스 언급 집계 (ticker_news 롤업).
+
+    ingest_news가 증분(delta)으로 갱신 → 멘션 버블은 원본 뉴스 대신 최대 72개 버킷만 합산.
+    """
+    __tablename__ = "ticker_news_hourly"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(10), primary_key=True)
+    hour_bucket = Column(TIMESTAMP, primary_key=True, index=True)  # date_trunc('hour', published_at)
+    mention_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(BigInteger, nullable=False, default=0)
+    bullish_count = Column(Integer, nullable=False, default=0)
+    bearish_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TickerNewsDaily(Base):
+    """
+    종목별 일별 뉴스 감성 카운터 (ticker_news 롤업, date = 뉴스 수집일).
+
+    ingest_news가 증분 UPSERT → 차트 감성 통계(7일/30일)와 /news/summary는 최대 30행 합산.
+    """
+    __tablename__ = "ticker_news_daily"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(10), primary_key=True)
+    date = Column(Date, primary_key=True)
+    article_count = Column(Integer, nullable=False, default=0)  # 전체 기사 수 (등급 무관)
+    bullish_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    bearish_count = Column(Integer, nullable=False, default=0)
+    sentiment_sum = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class TickerCalendarCurrent(Base):
+    """
+    종목별 최신 캘린더 스냅샷 (ticker_calendar의 ticker별 최신 date 행).
+
+    ingest_scores가 갱신 → 실적 일정 fallback은 next_earnings_date 인덱스 조회.
+    """
+    __tablename__ = "ticker_calendar_current"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(10), primary_key=True)
+    date = Column(Date, nullable=False)
+    next_earnings_date = Column(Date, index=True)
+    next_earnings_date_end = Column(Date)
+    earnings_confirmed = Column(Boolean, default=False)
+    d_day = Column(Integer)
+    ex_dividend_date = Column(Date)
+    dividend_date = Column(Date)
+    earnings_high = Column(Float)
+    earnings_low = Column(Float)
+    earnings_avg = Column(Float)
+    revenue_high = Column(Float)
+    revenue_low = Column(Float)
+    revenue_avg = Column(Float)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class StockClassificationCurrent(Base):
+    """
+    종목별 최신 Peter Lynch 분류 스냅샷 (stock_classifications의 ticker별 최신 date 행).
+
+    ingest_scores가 갱신 → /market/classifications/stocks는 (category, confidence) 인덱스 조회.
+    """
+    __tablename__ = "stock_classifications_current"
+    __table_args__ = {'schema': 'analytics'}
+
+    ticker = Column(String(10), primary_key=True)
+    date = Column(Date, nullable=False)
+    category = Column(String(20), nullable=False)
+    category_ko = Column(String(20), nullable=False)
+    category_en = Column(String(20), nullable=False)
+    confidence = Column(Float, default=0.0)
+    reason_ko = Column(Text)
+    reason_en = Column(Text)
+    metrics_json = Column(Text)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
+
+
+class ClassificationCount(Base):
+    """카테고리별 현재 분류 종목 수 카운터 (/market/classifications/summary)."""
+    __tablename__ = "classification_counts"
+    __table_args__ = {'schema': 'analytics'}
+
+    category = Column(String(20), primary_key=True)
+    ticker_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=text('CURRENT_TIMESTAMP'))
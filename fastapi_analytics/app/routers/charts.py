@@ -1,51 +1,71 @@
-import json
-
-from fastapi import APIRouter, Depends, Query, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import date, timedelta
 from app.database import get_db
 from app.models import (
     TickerPrice, TickerScore, TickerIndicator, TickerTarget,
     TickerTrendline, TickerInstitution, TickerShort, TickerAIAnalysis,
     TickerAnalystRating,
-    CompanyProfile, TickerKeyMetrics, TickerFinancials, TickerDividend,
-    TickerCalendar, TickerEarningsHistory,
-    TickerDefenseLine, TickerRecommendation, TickerInstitutionalHolder,
-    TickerNews, Ticker, StockClassification
+    TickerNews, Ticker,
 )
-from app.schemas import (
-    CompleteChartResponse, ChartDataPoint, TrendlineValue,
-    AnalystConsensus, AnalystRatingItem,
-    CompanyProfileResponse, KeyMetricsResponse, FinancialsResponse, DividendEntry,
-    CalendarResponse, EarningsHistoryItem,
-    DefenseLineResponse, RecommendationsResponse, InstitutionalHolderResponse,
-    NewsItemResponse, ClassificationResponse
+from app.schemas import CompleteChartResponse
+from app.services.chart_static import (
+    STATIC_SECTIONS, get_static_sections, select_static_sections, splice_static_sections,
 )
+from app.services.daily_wide import WIDE_COLUMNS, load_chart_points
+from app.services.data_versions import data_versions, ticker_key
+from app.services.http_cache import cache_validators, is_not_modified, not_modified
+from app.services.news_rollups import sentiment_counts
+from app.services.watermarks import watermarks
+from app.services.response_cache import cached_json_response, chart_cache
+from app.utils.columnar import FORMAT_PATTERN, to_columnar
+from app.utils.downsampling import ohlc_buckets
+from app.utils.multilang import LANG_ORDER, LANG_PATTERN, localize, localize_fields
 
 router = APIRouter()
 
-
-def _compute_urgency(d_day: int | None) -> str | None:
-    """Compute urgency level from D-Day value."""
-    if d_day is None:
+# Packed 'ko|||en|||...' fields of chart rows / news items (projected with lang=)
+_PACKED_ROW_FIELDS = ("ai_summary", "ai_final_comment")
+_PACKED_REASON_FIELDS = ("ai_bullish_reasons", "ai_bearish_reasons")
+_PACKED_NEWS_FIELDS = ("title", "ai_summary", "sentiment_label")
+
+# include= sections computed per request → CompleteChartResponse keys
+# (static sections are the ChartStaticSections fields, spliced from the stored blob)
+_DYNAMIC_SECTIONS = {
+    "trendlines": (
+        "high_slope", "high_intercept", "high_r_squared", "high_values",
+        "low_slope", "low_intercept", "low_r_squared", "low_values",
+    ),
+    "analyst": ("analyst_consensus", "analyst_ratings"),
+    "news": ("news",),
+    "news_sentiment_stats": ("news_sentiment_stats",),
+}
+CHART_SECTIONS = frozenset(_DYNAMIC_SECTIONS) | frozenset(STATIC_SECTIONS)
+
+
+def _parse_names(value: str | None, allowed, param: str) -> frozenset | None:
+    """Comma-separated names → frozenset (None = parameter not given); HTTP 400 on unknown names."""
+    if value is None:
         return None
-    if d_day <= 0:
-        return "imminent"   # D-Day or past
-    if d_day <= 3:
-        return "urgent"     # 1~3 days
-    if d_day <= 7:
-        return "soon"       # 4~7 days
-    if d_day <= 14:
-        return "upcoming"   # 8~14 days
-    return "scheduled"      # 15+ days
+    names = frozenset(n.strip() for n in value.split(",") if n.strip())
+    unknown = names - set(allowed)
+    if unknown:
+        raise HTTPException(400, f"Unknown {param}: {', '.join(sorted(unknown))}")
+    return names
 
 
 @router.get("/{ticker}", response_model=CompleteChartResponse)
 def get_complete_chart_data(
+    request: Request,
     ticker: str,
     from_date: date = Query(None, alias="from", description="Start date (default: 90 days ago)"),
     to_date: date = Query(None, alias="to", description="End date (default: latest available)"),
+    format: str = Query("rows", pattern=FORMAT_PATTERN, description="rows (default) | columnar: data as {date: [...], close: [...], ...}"),
+    max_points: int = Query(None, ge=3, le=1000, description="Merge data into at most N candles (default: all dates)"),
+    lang: str = Query(None, pattern=LANG_PATTERN, description="Project multilingual AI/news text to one language (en fallback); default: all languages"),
+    fields: str = Query(None, description="Comma-separated data row fields (e.g. open,high,low,close,volume); default: all"),
+    include: str = Query(None, description="Comma-separated sections (trendlines, analyst, news, news_sentiment_stats, profile, financials, ...); empty = data only; default: all"),
     db: Session = Depends(get_db)
 ):
     """
@@ -86,29 +106,125 @@ def get_complete_chart_data(
       "low_slope": 0.12, "low_intercept": 175.0
     }
     ```
+
+    **Columnar** (`format=columnar`): `data` becomes one array per field,
+    index-aligned with `date`. Fields that are null on every date are omitted.
+    ```json
+    "data": {"date": ["2026-01-15", ...], "close": [184.7, ...], "rsi": [67.3, ...]}
+    ```
+
+    **Downsampling** (`max_points=200`): consecutive dates are merged into
+    OHLC candles (open=first, high=max, low=min, close=last, volume=sum);
+    the other fields (score, rsi, ...) take the bucket's last date, which is
+    also the candle's `date`.
+
+    **Language** (`lang=ko`): packed AI summary/comment/reasons and news text
+    are projected to one language, and only `ai_analysis_<lang>` is returned
+    (en fallback) instead of all five `ai_analysis_*` fields.
+
+    **Sparse** (`fields=close,score&include=`): `data` rows carry only `date`
+    and the listed fields, and only the listed sections are returned (their
+    queries are skipped otherwise). Sections: trendlines, analyst, news,
+    news_sentiment_stats and the snapshot sections (profile, key_metrics,
+    financials, dividends, calendar, earnings_history, defense_lines,
+    recommendations, institutional_holders, classification).
+    ```
+    GET /api/v1/charts/AAPL?fields=open,high,low,close,volume&include=
+    ```
+    """
+    ticker = ticker.upper()
+    row_fields = _parse_names(fields, WIDE_COLUMNS, "fields")
+    sections = _parse_names(include, CHART_SECTIONS, "include")
+    if sections is None:
+        sections = CHART_SECTIONS
+
+    # Cache key: request params + per-ticker data version (bumped by scores/news ingest).
+    # Default ranges depend on the global latest date, so they also track the scores version.
+    # date.today() is included because calendar D-Day / sentiment windows roll daily.
+    version_keys = [ticker_key(ticker)] if to_date is not None else [ticker_key(ticker), "scores"]
+    version = ".".join(str(data_versions.get(k)) for k in version_keys)
+    sparse = (
+        f"{','.join(sorted(row_fields)) if row_fields is not None else '*'}"
+        f"|{','.join(sorted(sections)) if sections != CHART_SECTIONS else '*'}"
+    )
+    cache_key = f"{ticker}|{from_date}|{to_date}|{format}|{max_points}|{lang}|{sparse}|{date.today()}|v{version}"
+
+    # Conditional GET: unchanged data → 304 without touching the DB
+    validators = cache_validators("charts", version_keys, cache_key)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    body = chart_cache.get(cache_key)
+    if body is None:
+        chart = _build_complete_chart(db, ticker, from_date, to_date, row_fields, sections)
+        has_data = bool(chart["data"])
+        if lang is not None:
+            _localize_chart(chart, lang)
+        if max_points is not None:
+            chart["data"] = ohlc_buckets(chart["data"], max_points)
+        if format == "columnar":
+            chart["data"] = to_columnar(chart["data"])
+        static_sections = sections & STATIC_SECTIONS
+        if has_data and static_sections:
+            # Snapshot sections are pre-rendered at ingest time → splice the stored JSON
+            static_body = get_static_sections(db, ticker)
+            if static_sections != STATIC_SECTIONS:
+                static_body = select_static_sections(static_body, static_sections)
+            body = splice_static_sections(orjson.dumps(chart), static_body)
+        else:
+            body = orjson.dumps(chart)
+        chart_cache.set(cache_key, body)
+
+    # Precompressed variant stored next to the cache entry (middleware passes it through)
+    return cached_json_response(request, chart_cache, cache_key, body, validators)
+
+
+def _localize_chart(chart: dict, lang: str) -> None:
+    """Project packed multilingual fields of a built chart to one language (in place)."""
+    analysis_key = f"ai_analysis_{lang}"
+    other_keys = [f"ai_analysis_{code}" for code in LANG_ORDER if code != lang]
+    for row in chart["data"]:
+        localize_fields(row, _PACKED_ROW_FIELDS, lang)
+        for field in _PACKED_REASON_FIELDS:
+            if row.get(field):
+                row[field] = [localize(reason, lang) for reason in row[field]]
+        if not row.get(analysis_key) and "ai_analysis_en" in row:
+            row[analysis_key] = row["ai_analysis_en"]
+        for key in other_keys:
+            row.pop(key, None)
+    for item in chart.get("news") or []:
+        localize_fields(item, _PACKED_NEWS_FIELDS, lang)
+
+
+def _build_complete_chart(
+    db: Session, ticker: str, from_date: date | None, to_date: date | None,
+    row_fields: frozenset | None = None, sections: frozenset = CHART_SECTIONS,
+) -> dict:
+    """
+    Run the date-ranged chart queries and assemble the response dict (cache miss path).
+
+    Built straight from SQL rows (no pydantic objects) in CompleteChartResponse
+    field order. Static snapshot sections (profile, fundamentals, calendar, ...)
+    are omitted unless the chart is empty; the caller splices them in from
+    app.services.chart_static.
+
+    row_fields / sections (sparse requests): data rows only carry these
+    fields, and only these sections are queried and returned.
     """
     # Date range defaults
     if to_date is None:
         # ⭐ Phase 1: Check ALL tables for latest date (not just ticker_prices)
         # This prevents data loss when ticker_prices lags behind ticker_scores/indicators
-        latest_price = db.query(func.max(TickerPrice.date)).scalar()
-        latest_score = db.query(func.max(TickerScore.date)).scalar()
-        latest_indicator = db.query(func.max(TickerIndicator.date)).scalar()
+        # (resolved from ingest-maintained watermarks, no MAX(date) scans)
+        latest_price = watermarks.latest("prices")
+        latest_score = watermarks.latest("scores")
+        latest_indicator = watermarks.latest("indicators")
 
         # Get maximum date across all tables
         all_dates = [d for d in [latest_price, latest_score, latest_indicator] if d is not None]
         if not all_dates:
             # DB 전체가 비어있으면 빈 구조 반환 (404 금지)
-            return CompleteChartResponse(
-                ticker=ticker,
-                data=[],
-                high_slope=None,
-                high_intercept=None,
-                high_r_squared=None,
-                low_slope=None,
-                low_intercept=None,
-                low_r_squared=None,
-            )
+            return _empty_chart(ticker, sections)
 
         candidate_date = max(all_dates)
 
@@ -121,16 +237,7 @@ def get_complete_chart_data(
             # If weekend/holiday, find most recent trading day
             to_date = get_latest_trading_date(db, check_all_tables=True)
             if to_date is None:
-                return CompleteChartResponse(
-                    ticker=ticker,
-                    data=[],
-                    high_slope=None,
-                    high_intercept=None,
-                    high_r_squared=None,
-                    low_slope=None,
-                    low_intercept=None,
-                    low_r_squared=None,
-                )
+                return _empty_chart(ticker, sections)
 
     if from_date is None:
         from_date = to_date - timedelta(days=90)  # 3 months default
@@ -139,12 +246,201 @@ def get_complete_chart_data(
     if from_date > to_date:
         raise HTTPException(400, "from_date must be before to_date")
 
-    ticker = ticker.upper()
-
     # ========================================
     # Query all data sources
     # ========================================
 
+    # 1) Daily chart rows (price/score/indicators/targets/institutions/shorts/AI)
+    chart_data = _load_chart_points(db, ticker, from_date, to_date, row_fields)
+
+    if not chart_data:
+        # 특정 티커에 데이터 없으면 빈 구조 반환 (404 금지)
+        return _empty_chart(ticker, sections)
+
+    # 2) Latest trendline (optional)
+    trendline = None
+    if "trendlines" in sections:
+        trendline = db.query(TickerTrendline).filter(
+            TickerTrendline.ticker == ticker
+        ).order_by(TickerTrendline.date.desc()).first()
+
+    # 3) Latest analyst consensus (from ticker_targets where analyst data exists)
+    latest_analyst_target = None
+    if "analyst" in sections:
+        latest_analyst_target = db.query(TickerTarget).filter(
+            TickerTarget.ticker == ticker,
+            TickerTarget.analyst_target_mean.isnot(None),
+        ).order_by(TickerTarget.date.desc()).first()
+
+    # 4) Analyst ratings (from ticker_analyst_ratings, matching latest analyst date)
+    analyst_ratings_objs = []
+    if latest_analyst_target:
+        analyst_ratings_objs = db.query(TickerAnalystRating).filter(
+            TickerAnalystRating.ticker == ticker,
+            TickerAnalystRating.date == latest_analyst_target.date,
+        ).order_by(TickerAnalystRating.rating_date.desc()).all()
+
+    # 5) Latest news (5 articles) with sector from tickers table
+    news_rows = []
+    if "news" in sections:
+        news_rows = (
+            db.query(TickerNews, Ticker.sector)
+            .outerjoin(Ticker, TickerNews.ticker == Ticker.ticker)
+            .filter(TickerNews.ticker == ticker)
+            .order_by(TickerNews.published_at.desc())
+            .limit(5)
+            .all()
+        )
+
+    # 6) News sentiment stats (week / month)
+    today = date.today()
+    week_ago = today - timedelta(days=7)
+    month_ago = today - timedelta(days=30)
+
+    # Daily counters (ticker_news_daily): one read of ≤31 rows for both windows
+    daily_counts = {}
+    if "news_sentiment_stats" in sections:
+        daily_counts = sentiment_counts(db, ticker, month_ago)
+
+    def _count_sentiments(since_date):
+        counts = {"bullish": 0, "neutral": 0, "bearish": 0}
+        for day, day_counts in daily_counts.items():
+            if day >= since_date:
+                for grade in counts:
+                    counts[grade] += day_counts[grade]
+        return counts
+
+    news_sentiment_stats = {
+        "week": _count_sentiments(week_ago),
+        "month": _count_sentiments(month_ago),
+    }
+
+    # ========================================
+    # Return complete chart response
+    # ========================================
+    # Convert JSONB high_values/low_values to TrendlineValue dicts
+    high_values_list = None
+    low_values_list = None
+    if trendline:
+        if trendline.high_values:
+            high_values_list = [{"date": v["date"], "y": float(v["y"])} for v in trendline.high_values]
+        if trendline.low_values:
+            low_values_list = [{"date": v["date"], "y": float(v["y"])} for v in trendline.low_values]
+
+    # Build analyst consensus
+    analyst_consensus = None
+    if latest_analyst_target and latest_analyst_target.analyst_target_mean is not None:
+        analyst_consensus = {
+            "mean": latest_analyst_target.analyst_target_mean,
+            "high": latest_analyst_target.analyst_target_high,
+            "low": latest_analyst_target.analyst_target_low,
+            "count": latest_analyst_target.analyst_count,
+            "recommendation": latest_analyst_target.recommendation,
+        }
+
+    # Build analyst ratings list
+    analyst_ratings_list = [
+        {
+            "date": str(r.rating_date) if r.rating_date else None,
+            "status": r.status,
+            "firm": r.firm,
+            "rating": r.rating,
+            "target_from": r.target_from,
+            "target_to": r.target_to,
+        } for r in analyst_ratings_objs
+    ] or None
+
+    chart = {
+        "ticker": ticker,
+        "data": chart_data,
+
+        # Trendlines (latest calculation)
+        "high_slope": trendline.high_slope if trendline else None,
+        "high_intercept": trendline.high_intercept if trendline else None,
+        "high_r_squared": trendline.high_r_squared if trendline else None,
+        "high_values": high_values_list,
+        "low_slope": trendline.low_slope if trendline else None,
+        "low_intercept": trendline.low_intercept if trendline else None,
+        "low_r_squared": trendline.low_r_squared if trendline else None,
+        "low_values": low_values_list,
+
+        # Analyst data (latest snapshot)
+        "analyst_consensus": analyst_consensus,
+        "analyst_ratings": analyst_ratings_list,
+
+        # News (latest 5)
+        "news": [
+            {
+                "date": n.date,
+                "ticker": n.ticker,
+                "title": n.title,
+                "source": n.source,
+                "source_url": n.source_url,
+                "published_at": n.published_at,
+                "ai_summary": n.ai_summary,
+                "sentiment_score": n.sentiment_score,
+                "sentiment_grade": n.sentiment_grade,
+                "sentiment_label": n.sentiment_label,
+                "future_event": n.future_event,
+                "is_breaking": n.is_breaking or False,
+                "is_hot_topic": False,
+                "hot_topic_category": None,
+                "hot_topic_priority": None,
+                "ticker_name_ko": None,
+                "sector": news_sector,
+            } for n, news_sector in news_rows
+        ] or None,
+
+        # News sentiment stats
+        "news_sentiment_stats": news_sentiment_stats,
+    }
+
+    # Sparse include=: drop sections that were not requested (their queries were skipped)
+    for section, keys in _DYNAMIC_SECTIONS.items():
+        if section not in sections:
+            for key in keys:
+                del chart[key]
+    return chart
+
+
+def _empty_chart(ticker: str, sections: frozenset = CHART_SECTIONS) -> dict:
+    """빈 구조 (404 금지): every requested CompleteChartResponse field null, data empty."""
+    wanted = {"ticker", "data"}
+    for section in sections:
+        wanted.update(_DYNAMIC_SECTIONS.get(section, (section,)))
+    chart = {key: None for key in CompleteChartResponse.model_fields if key in wanted}
+    chart["ticker"] = ticker
+    chart["data"] = []
+    return chart
+
+
+def _load_chart_points(
+    db: Session, ticker: str, from_date: date, to_date: date,
+    row_fields: frozenset | None = None,
+) -> list[dict]:
+    """
+    Chart rows for the range: denormalized ticker_daily_wide first (one index
+    range scan), falling back to the 7-table merge when the range has not
+    been (fully) backfilled yet. Returns [] when there is no price data.
+
+    row_fields: only select/return these fields (plus date); default all.
+    """
+    chart_data = load_chart_points(db, ticker, from_date, to_date, row_fields)
+    if chart_data is not None:
+        return chart_data
+    chart_data = _load_chart_points_legacy(db, ticker, from_date, to_date)
+    if row_fields is not None:
+        chart_data = [
+            {k: v for k, v in row.items() if k == "date" or k in row_fields}
+            for row in chart_data
+        ]
+    return chart_data
+
+
+def _load_chart_points_legacy(
+    db: Session, ticker: str, from_date: date, to_date: date,
+) -> list[dict]:
+    """Merge prices/scores/indicators/targets/institutions/shorts/AI by date."""
     # 1) Prices (required)
     prices = db.query(TickerPrice).filter(
         TickerPrice.ticker == ticker,
@@ -153,17 +449,7 @@ def get_complete_chart_data(
     ).order_by(TickerPrice.date.asc()).all()
 
     if not prices:
-        # 특정 티커에 데이터 없으면 빈 구조 반환 (404 금지)
-        return CompleteChartResponse(
-            ticker=ticker,
-            data=[],
-            high_slope=None,
-            high_intercept=None,
-            high_r_squared=None,
-            low_slope=None,
-            low_intercept=None,
-            low_r_squared=None,
-        )
+        return []
 
     # 2) Scores (optional)
     scores = db.query(TickerScore).filter(
@@ -200,125 +486,13 @@ def get_complete_chart_data(
         TickerShort.date <= to_date
     ).all()
 
-    # 7) Latest trendline (optional)
-    trendline = db.query(TickerTrendline).filter(
-        TickerTrendline.ticker == ticker
-    ).order_by(TickerTrendline.date.desc()).first()
-
-    # 8) AI Analysis (optional)
+    # 7) AI Analysis (optional)
     ai_analyses = db.query(TickerAIAnalysis).filter(
         TickerAIAnalysis.ticker == ticker,
         TickerAIAnalysis.date >= from_date,
         TickerAIAnalysis.date <= to_date
     ).all()
 
-    # 9) Latest analyst consensus (from ticker_targets where analyst data exists)
-    latest_analyst_target = db.query(TickerTarget).filter(
-        TickerTarget.ticker == ticker,
-        TickerTarget.analyst_target_mean.isnot(None),
-    ).order_by(TickerTarget.date.desc()).first()
-
-    # 10) Analyst ratings (from ticker_analyst_ratings, matching latest analyst date)
-    analyst_ratings_objs = []
-    if latest_analyst_target:
-        analyst_ratings_objs = db.query(TickerAnalystRating).filter(
-            TickerAnalystRating.ticker == ticker,
-            TickerAnalystRating.date == latest_analyst_target.date,
-        ).order_by(TickerAnalystRating.rating_date.desc()).all()
-
-    # 11) Company Profile (ticker PK, non-time-series)
-    profile_obj = db.query(CompanyProfile).filter(
-        CompanyProfile.ticker == ticker
-    ).first()
-
-    # 12) Latest Key Metrics (most recent date)
-    metrics_obj = db.query(TickerKeyMetrics).filter(
-        TickerKeyMetrics.ticker == ticker
-    ).order_by(TickerKeyMetrics.date.desc()).first()
-
-    # 13) Financials (ticker PK, non-time-series)
-    financials_obj = db.query(TickerFinancials).filter(
-        TickerFinancials.ticker == ticker
-    ).first()
-
-    # 14) Recent Dividends (last 8 entries)
-    dividend_objs = db.query(TickerDividend).filter(
-        TickerDividend.ticker == ticker
-    ).order_by(TickerDividend.ex_date.desc()).limit(8).all()
-
-    # 15) Latest calendar (most recent upload)
-    calendar_obj = db.query(TickerCalendar).filter(
-        TickerCalendar.ticker == ticker
-    ).order_by(TickerCalendar.date.desc()).first()
-
-    # 16) Earnings history (last 8 quarters)
-    earnings_objs = db.query(TickerEarningsHistory).filter(
-        TickerEarningsHistory.ticker == ticker
-    ).order_by(TickerEarningsHistory.earnings_date.desc()).limit(8).all()
-
-    # 17) Latest defense lines (most recent upload)
-    latest_dl_date = db.query(func.max(TickerDefenseLine.date)).filter(
-        TickerDefenseLine.ticker == ticker
-    ).scalar()
-    defense_line_objs = []
-    if latest_dl_date:
-        defense_line_objs = db.query(TickerDefenseLine).filter(
-            TickerDefenseLine.ticker == ticker,
-            TickerDefenseLine.date == latest_dl_date,
-        ).order_by(TickerDefenseLine.period.asc()).all()
-
-    # 18) Latest recommendations (most recent upload)
-    recommendation_obj = db.query(TickerRecommendation).filter(
-        TickerRecommendation.ticker == ticker
-    ).order_by(TickerRecommendation.date.desc()).first()
-
-    # 19) Latest institutional holders (most recent upload)
-    latest_ih_date = db.query(func.max(TickerInstitutionalHolder.date)).filter(
-        TickerInstitutionalHolder.ticker == ticker
-    ).scalar()
-    institutional_holder_objs = []
-    if latest_ih_date:
-        institutional_holder_objs = db.query(TickerInstitutionalHolder).filter(
-            TickerInstitutionalHolder.ticker == ticker,
-            TickerInstitutionalHolder.date == latest_ih_date,
-        ).order_by(TickerInstitutionalHolder.pct_held.desc()).limit(20).all()
-
-    # 20) Latest news (5 articles) with sector from tickers table
-    news_rows = (
-        db.query(TickerNews, Ticker.sector)
-        .outerjoin(Ticker, TickerNews.ticker == Ticker.ticker)
-        .filter(TickerNews.ticker == ticker)
-        .order_by(TickerNews.published_at.desc())
-        .limit(5)
-        .all()
-    )
-
-    # 21) News sentiment stats (week / month)
-    today = date.today()
-    week_ago = today - timedelta(days=7)
-    month_ago = today - timedelta(days=30)
-
-    def _count_sentiments(since_date):
-        rows = db.query(TickerNews.sentiment_grade, func.count()).filter(
-            TickerNews.ticker == ticker,
-            TickerNews.date >= since_date,
-        ).group_by(TickerNews.sentiment_grade).all()
-        counts = {"bullish": 0, "neutral": 0, "bearish": 0}
-        for grade, cnt in rows:
-            if grade in counts:
-                counts[grade] = cnt
-        return counts
-
-    news_sentiment_stats = {
-        "week": _count_sentiments(week_ago),
-        "month": _count_sentiments(month_ago),
-    }
-
-    # 22) Latest classification (Peter Lynch)
-    classification_obj = db.query(StockClassification).filter(
-        StockClassification.ticker == ticker
-    ).order_by(StockClassification.date.desc()).first()
-
     # ========================================
     # Build lookup dictionaries by date
     # ========================================
@@ -331,9 +505,7 @@ def get_complete_chart_data(
     ai_dict = {ai.date: ai for ai in ai_analyses}
 
     # ========================================
-    # ⭐ Phase 2-Debug: Merge all data by date UNION
-    # (Temporary fix - allows displaying scores/indicators even without price data)
-    # TODO: Remove this after ticker_prices backfill is complete (use price-based loop)
+    # Merge all data by date UNION (scores/indicators shown even without price data)
     # ========================================
 
     # Collect ALL dates from all tables
@@ -359,7 +531,7 @@ def get_complete_chart_data(
         short_obj = short_dict.get(d)
         ai_obj = ai_dict.get(d)
 
-        chart_data.append(ChartDataPoint(
+        chart_data.append(dict(
             date=d,
 
             # Price (nullable - allows chart points without OHLCV)
@@ -418,184 +590,4 @@ def get_complete_chart_data(
             ai_expert_key_factors=ai_obj.expert_key_factors if ai_obj else None,
         ))
 
-    # ========================================
-    # Return complete chart response
-    # ========================================
-    # Convert JSONB high_values/low_values to TrendlineValue objects
-    high_values_list = None
-    low_values_list = None
-    if trendline:
-        if trendline.high_values:
-            high_values_list = [TrendlineValue(**v) for v in trendline.high_values]
-        if trendline.low_values:
-            low_values_list = [TrendlineValue(**v) for v in trendline.low_values]
-
-    # Build analyst consensus
-    analyst_consensus = None
-    if latest_analyst_target and latest_analyst_target.analyst_target_mean is not None:
-        analyst_consensus = AnalystConsensus(
-            mean=latest_analyst_target.analyst_target_mean,
-            high=latest_analyst_target.analyst_target_high,
-            low=latest_analyst_target.analyst_target_low,
-            count=latest_analyst_target.analyst_count,
-            recommendation=latest_analyst_target.recommendation,
-        )
-
-    # Build analyst ratings list
-    analyst_ratings_list = [
-        AnalystRatingItem(
-            date=str(r.rating_date) if r.rating_date else None,
-            status=r.status,
-            firm=r.firm,
-            rating=r.rating,
-            target_from=r.target_from,
-            target_to=r.target_to,
-        ) for r in analyst_ratings_objs
-    ] or None
-
-    return CompleteChartResponse(
-        ticker=ticker,
-        data=chart_data,
-
-        # Trendlines (latest calculation)
-        high_slope=trendline.high_slope if trendline else None,
-        high_intercept=trendline.high_intercept if trendline else None,
-        high_r_squared=trendline.high_r_squared if trendline else None,
-        high_values=high_values_list,
-        low_slope=trendline.low_slope if trendline else None,
-        low_intercept=trendline.low_intercept if trendline else None,
-        low_r_squared=trendline.low_r_squared if trendline else None,
-        low_values=low_values_list,
-
-        # Analyst data (latest snapshot)
-        analyst_consensus=analyst_consensus,
-        analyst_ratings=analyst_ratings_list,
-
-        # Fundamentals (latest snapshot)
-        profile=CompanyProfileResponse(
-            long_name=profile_obj.long_name,
-            industry=profile_obj.industry,
-            website=profile_obj.website,
-            country=profile_obj.country,
-            employees=profile_obj.employees,
-            summary=profile_obj.summary,
-        ) if profile_obj else None,
-        key_metrics=KeyMetricsResponse(
-            market_cap=metrics_obj.market_cap,
-            pe=metrics_obj.pe,
-            forward_pe=metrics_obj.forward_pe,
-            peg=metrics_obj.peg,
-            pb=metrics_obj.pb,
-            ps=metrics_obj.ps,
-            ev_revenue=metrics_obj.ev_revenue,
-            ev_ebitda=metrics_obj.ev_ebitda,
-            profit_margin=metrics_obj.profit_margin,
-            operating_margin=metrics_obj.operating_margin,
-            gross_margin=metrics_obj.gross_margin,
-            roe=metrics_obj.roe,
-            roa=metrics_obj.roa,
-            debt_to_equity=metrics_obj.debt_to_equity,
-            current_ratio=metrics_obj.current_ratio,
-            beta=metrics_obj.beta,
-            dividend_yield=metrics_obj.dividend_yield,
-            payout_ratio=metrics_obj.payout_ratio,
-            earnings_growth=metrics_obj.earnings_growth,
-            revenue_growth=metrics_obj.revenue_growth,
-        ) if metrics_obj else None,
-        financials=FinancialsResponse(
-            latest_quarter=financials_obj.latest_quarter,
-            income=financials_obj.income,
-            balance_sheet=financials_obj.balance_sheet,
-            cash_flow=financials_obj.cash_flow,
-        ) if financials_obj else None,
-        dividends=[
-            DividendEntry(ex_date=str(d.ex_date), amount=d.amount)
-            for d in dividend_objs
-        ] or None,
-        calendar=CalendarResponse(
-            next_earnings_date=str(calendar_obj.next_earnings_date) if calendar_obj.next_earnings_date else None,
-            next_earnings_date_end=str(calendar_obj.next_earnings_date_end) if calendar_obj.next_earnings_date_end else None,
-            earnings_confirmed=calendar_obj.earnings_confirmed,
-            d_day=calendar_obj.d_day,
-            urgency=_compute_urgency(calendar_obj.d_day),
-            earnings_days_remaining=(calendar_obj.next_earnings_date - date.today()).days if calendar_obj.next_earnings_date else None,
-            ex_dividend_date=str(calendar_obj.ex_dividend_date) if calendar_obj.ex_dividend_date else None,
-            dividend_date=str(calendar_obj.dividend_date) if calendar_obj.dividend_date else None,
-            earnings_estimate={
-                "high": calendar_obj.earnings_high,
-                "low": calendar_obj.earnings_low,
-                "avg": calendar_obj.earnings_avg,
-            } if calendar_obj.earnings_avg else None,
-            revenue_estimate={
-                "high": calendar_obj.revenue_high,
-                "low": calendar_obj.revenue_low,
-                "avg": calendar_obj.revenue_avg,
-            } if calendar_obj.revenue_avg else None,
-        ) if calendar_obj else None,
-        earnings_history=[
-            EarningsHistoryItem(
-                date=str(e.earnings_date),
-                eps_estimate=e.eps_estimate,
-                reported_eps=e.reported_eps,
-                surprise_pct=e.surprise_pct,
-            ) for e in reversed(earnings_objs)
-        ] or None,
-
-        # Phase 2: New data sources
-        defense_lines=[
-            DefenseLineResponse(
-                period=dl.period,
-                price=dl.price,
-                label=dl.label,
-                distance_pct=dl.distance_pct,
-            ) for dl in defense_line_objs
-        ] or None,
-        recommendations=RecommendationsResponse(
-            strong_buy=recommendation_obj.strong_buy,
-            buy=recommendation_obj.buy,
-            hold=recommendation_obj.hold,
-            sell=recommendation_obj.sell,
-            strong_sell=recommendation_obj.strong_sell,
-            consensus_score=recommendation_obj.consensus_score,
-        ) if recommendation_obj else None,
-        institutional_holders=[
-            InstitutionalHolderResponse(
-                holder=ih.holder,
-                pct_held=ih.pct_held,
-                pct_change=ih.pct_change,
-            ) for ih in institutional_holder_objs
-        ] or None,
-
-        # News (latest 5)
-        news=[
-            NewsItemResponse(
-                date=n.date,
-                ticker=n.ticker,
-                title=n.title,
-                source=n.source,
-                source_url=n.source_url,
-                published_at=n.published_at,
-                ai_summary=n.ai_summary,
-                sentiment_score=n.sentiment_score,
-                sentiment_grade=n.sentiment_grade,
-                sentiment_label=n.sentiment_label,
-                future_event=n.future_event,
-                is_breaking=n.is_breaking or False,
-                sector=news_sector,
-            ) for n, news_sector in news_rows
-        ] or None,
-
-        # News sentiment stats
-        news_sentiment_stats=news_sentiment_stats,
-
-        # Classification (Peter Lynch)
-        classification=ClassificationResponse(
-            category=classification_obj.category,
-            category_ko=classification_obj.category_ko,
-            category_en=classification_obj.category_en,
-            confidence=classification_obj.confidence,
-            reason_ko=classification_obj.reason_ko,
-            reason_en=classification_obj.reason_en,
-            metrics=json.loads(classification_obj.metrics_json) if classification_obj.metrics_json else None,
-        ) if classification_obj else None,
-    )
+    return chart_data
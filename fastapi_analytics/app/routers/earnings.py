@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import date, timedelta
 from collections import defaultdict
 
 from app.database import get_db
-from app.models import EarningsWeekEvent, TickerCalendar, Ticker
+from app.models import EarningsWeekEvent, TickerCalendarCurrent, Ticker
 from app.schemas import EarningsUpcomingResponse, EarningsWeekEventResponse
 
 router = APIRouter()
@@ -20,7 +19,7 @@ def get_upcoming_earnings(
     이번 주 실적 발표 일정 조회.
 
     날짜별 그룹핑하여 반환. Flutter 앱 캘린더 화면용.
-    EarningsWeekEvent 우선 조회, 비어 있으면 TickerCalendar fallback.
+    EarningsWeekEvent 우선 조회, 비어 있으면 ticker_calendar_current fallback.
     """
     today = date.today()
     end_date = today + timedelta(days=days)
@@ -62,24 +61,15 @@ def get_upcoming_earnings(
             by_date=dict(by_date),
         )
 
-    # Fallback: TickerCalendar (scores ingest에서 자동 수집된 데이터)
-    # 최신 date 기준으로 ticker별 최신 next_earnings_date 조회
-    latest_date_sub = db.query(
-        TickerCalendar.ticker,
-        func.max(TickerCalendar.date).label("max_date"),
-    ).group_by(TickerCalendar.ticker).subquery()
-
-    rows = db.query(TickerCalendar, Ticker).join(
-        latest_date_sub,
-        (TickerCalendar.ticker == latest_date_sub.c.ticker) &
-        (TickerCalendar.date == latest_date_sub.c.max_date),
-    ).outerjoin(
-        Ticker, TickerCalendar.ticker == Ticker.ticker,
+    # Fallback: ticker_calendar_current (scores ingest가 갱신하는 ticker별 최신 캘린더)
+    # next_earnings_date 인덱스 범위 조회 — ticker_calendar 전체 GROUP BY 불필요
+    rows = db.query(TickerCalendarCurrent, Ticker).outerjoin(
+        Ticker, TickerCalendarCurrent.ticker == Ticker.ticker,
     ).filter(
-        TickerCalendar.next_earnings_date >= today,
-        TickerCalendar.next_earnings_date <= end_date,
+        TickerCalendarCurrent.next_earnings_date >= today,
+        TickerCalendarCurrent.next_earnings_date <= end_date,
     ).order_by(
-        TickerCalendar.next_earnings_date.asc(),
+        TickerCalendarCurrent.next_earnings_date.asc(),
     ).all()
 
     by_date = defaultdict(list)
@@ -1,34 +1,28 @@
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 from collections import defaultdict
+from datetime import date
 import logging
 
 from app.database import get_db
 from app.models import MarketCalendarEvent, EarningsWeekEvent
-from app.schemas import MarketCalendarEventResponse, MarketCalendarResponse
+from app.schemas import MarketCalendarResponse
+from app.services.data_versions import data_versions
+from app.services.http_cache import cache_validators, is_not_modified, not_modified
+from app.services.response_cache import cached_json_response, calendar_cache
+from app.utils.multilang import LANG_ORDER, unpack_multilang
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# 다국어 언패킹 순서: ko=0, en=1, zh=2, ja=3, es=4
-LANG_ORDER = ["ko", "en", "zh", "ja", "es"]
-
-
-def unpack_multilang(packed: str, lang: str) -> str:
-    """'ko|||en|||zh|||ja|||es' → 해당 언어 문자열, 없으면 en fallback"""
-    parts = packed.split("|||")
-    idx = LANG_ORDER.index(lang) if lang in LANG_ORDER else 1  # default en
-    if idx < len(parts) and parts[idx].strip():
-        return parts[idx].strip()
-    return parts[1].strip() if len(parts) > 1 else parts[0].strip()  # en fallback
-
-
 IMPORTANCE_ORDER = {"high": 0, "medium": 1, "low": 2}
 
 
 @router.get("/calendar", response_model=MarketCalendarResponse)
 def get_event_calendar(
+    request: Request,
     year: int = Query(..., ge=2020, le=2040),
     month: int = Query(..., ge=1, le=12),
     lang: str = Query("en", max_length=5),
@@ -39,14 +33,38 @@ def get_event_calendar(
 
     market_calendar + earnings_week_events 합산하여 by_date 그룹핑 반환.
     title/description는 lang 파라미터로 언패킹.
+    (year, month, lang)별 렌더링된 응답을 "calendar" 데이터 버전으로 캐시
+    (/ingest/calendar, /ingest/earnings-week 시 무효화).
     """
+    # 미지원 언어는 en과 동일한 응답 → 같은 캐시 항목 사용
+    if lang not in LANG_ORDER:
+        lang = "en"
+
+    validators = cache_validators("calendar", ["calendar"], year, month, lang)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    cache_key = f"{year}-{month:02d}|{lang}|v{data_versions.get('calendar')}"
+    body = calendar_cache.get(cache_key)
+    if body is None:
+        body = orjson.dumps(_build_calendar(db, year, month, lang))
+        calendar_cache.set(cache_key, body)
+
+    return cached_json_response(request, calendar_cache, cache_key, body, validators)
+
+
+def _build_calendar(db: Session, year: int, month: int, lang: str) -> dict:
+    """MarketCalendarResponse body for one month and language."""
+    # 월 범위 [1일, 다음 달 1일) — event_date / earnings_date 인덱스 range scan
+    month_start = date(year, month, 1)
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+
     # 1) market_calendar에서 해당 월 이벤트 쿼리
-    from sqlalchemy import extract
     events = (
         db.query(MarketCalendarEvent)
         .filter(
-            extract("year", MarketCalendarEvent.event_date) == year,
-            extract("month", MarketCalendarEvent.event_date) == month,
+            MarketCalendarEvent.event_date >= month_start,
+            MarketCalendarEvent.event_date < next_month,
         )
         .all()
     )
@@ -55,22 +73,22 @@ def get_event_calendar(
 
     for ev in events:
         date_str = ev.event_date.strftime("%Y-%m-%d")
-        by_date[date_str].append(MarketCalendarEventResponse(
-            id=ev.id,
-            date=date_str,
-            event_type=ev.event_type,
-            title=unpack_multilang(ev.title, lang),
-            description=unpack_multilang(ev.description, lang) if ev.description else None,
-            ticker=ev.ticker,
-            importance=ev.importance or "medium",
-        ))
+        by_date[date_str].append({
+            "id": ev.id,
+            "date": date_str,
+            "event_type": ev.event_type,
+            "title": unpack_multilang(ev.title, lang),
+            "description": unpack_multilang(ev.description, lang) if ev.description else None,
+            "ticker": ev.ticker,
+            "importance": ev.importance or "medium",
+        })
 
     # 2) earnings_week_events에서 해당 월 실적도 합산
     earnings = (
         db.query(EarningsWeekEvent)
         .filter(
-            extract("year", EarningsWeekEvent.earnings_date) == year,
-            extract("month", EarningsWeekEvent.earnings_date) == month,
+            EarningsWeekEvent.earnings_date >= month_start,
+            EarningsWeekEvent.earnings_date < next_month,
         )
         .all()
     )
@@ -83,25 +101,25 @@ def get_event_calendar(
         else:
             title = f"{earn.name_en or earn.ticker} ({earn.ticker})"
 
-        by_date[date_str].append(MarketCalendarEventResponse(
-            id=f"earn_{earn.ticker}_{date_str}",
-            date=date_str,
-            event_type="earnings",
-            title=title,
-            description=None,
-            ticker=earn.ticker,
-            importance="high" if (earn.score and earn.score >= 70) else "medium",
-        ))
+        by_date[date_str].append({
+            "id": f"earn_{earn.ticker}_{date_str}",
+            "date": date_str,
+            "event_type": "earnings",
+            "title": title,
+            "description": None,
+            "ticker": earn.ticker,
+            "importance": "high" if (earn.score and earn.score >= 70) else "medium",
+        })
 
     # 3) importance DESC 정렬
     for date_str in by_date:
-        by_date[date_str].sort(key=lambda e: IMPORTANCE_ORDER.get(e.importance, 1))
+        by_date[date_str].sort(key=lambda e: IMPORTANCE_ORDER.get(e["importance"], 1))
 
     total = sum(len(v) for v in by_date.values())
 
-    return MarketCalendarResponse(
-        year=year,
-        month=month,
-        total_count=total,
-        by_date=dict(by_date),
-    )
+    return {
+        "year": year,
+        "month": month,
+        "total_count": total,
+        "by_date": dict(by_date),
+    }
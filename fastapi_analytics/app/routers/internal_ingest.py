@@ -39,6 +39,18 @@ from app.schemas import (
 )
 from app.config import settings
 from app.utils.trading_calendar import is_trading_day
+from app.services.chart_static import rebuild_static_sections
+from app.services.current_snapshots import refresh_current_calendar, refresh_current_classifications
+from app.services.daily_wide import refresh_daily_wide
+from app.services.data_versions import data_versions, ticker_key, scores_date_key
+from app.services.latest_scores import latest_scores
+from app.services.leaderboards import leaderboards
+from app.services.macro_stats import refresh_macro_stats
+from app.services.news_rollups import NewsRollupDeltas, cleanup_rollups
+from app.services.portfolio_pnl import portfolio_pnl
+from app.services.search_index import search_index
+from app.services.treemap_snapshots import treemap_snapshots
+from app.services.watermarks import watermarks
 from app.services.fcm_service import (
     process_score_notifications,
     process_news_notifications,
@@ -207,6 +219,16 @@ def ingest_macro_indicators(payload: MacroIngestPayload, db: Session = Depends(g
                     ))
                 chart_points += 1
 
+    # ==========================================
+    # 4) 90일/1년 통계 (해당 날짜 이후 1년 내 행 재계산, 데이터와 같은 트랜잭션)
+    # ==========================================
+    db.flush()  # text() 쿼리는 autoflush 안 됨 → 위에서 추가한 행을 통계에 반영
+    refresh_macro_stats(
+        db,
+        list(payload.indicators or {}) + list(payload.signals or {}),
+        ingest_date,
+    )
+
     db.commit()
 
     # 3년 cleanup
@@ -220,6 +242,17 @@ def ingest_macro_indicators(payload: MacroIngestPayload, db: Session = Depends(g
     ))
     db.commit()
 
+    # 캐시 무효화 (ETag / 응답 캐시) + 최신일 워터마크
+    try:
+        data_versions.bump(db, ["macro"])
+        watermarks.advance(db, {
+            "macro": ingest_date if payload.indicators else None,
+            "macro_signals": ingest_date if payload.signals else None,
+        })
+    except Exception as e:
+        logger.error(f"Data version bump failed (macro): {e}")
+        db.rollback()
+
     return {"status": "ok", "upserted": upserted, "chart_points": chart_points}
 
 
@@ -265,6 +298,14 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
     """
     items = payload.items
     upserted = 0
+    ingested_tickers = set()
+    ingested_dates = set()
+    indicator_dates = set()  # 워터마크: 지표가 저장된 날짜
+    trading_value_dates = set()  # 워터마크: trading_value가 채워진 날짜 (treemap)
+    static_tickers = set()  # 차트 정적 섹션 입력이 포함된 종목
+    calendar_tickers = set()  # ticker_calendar_current 갱신 대상
+    classification_tickers = set()  # stock_classifications_current 갱신 대상
+    ticker_meta_changed = False  # 검색 인덱스 재생성 필요 여부
 
     for item in items:
         # Determine payload type (extended nested vs simple flat)
@@ -400,6 +441,15 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
             )
 
             if ticker_obj:
+                # 검색 인덱스 무효화는 실제 값이 바뀐 경우만
+                if (
+                    (name_en and name_en != ticker_obj.name)
+                    or (name_ko and name_ko != (ticker_obj.extra_data or {}).get('name_ko'))
+                    or (sector is not None and sector != ticker_obj.sector)
+                    or (sub_industry is not None and sub_industry != ticker_obj.sub_industry)
+                ):
+                    ticker_meta_changed = True
+
                 # Update existing ticker metadata
                 if name_en:
                     ticker_obj.name = name_en
@@ -418,6 +468,7 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
                     ticker_obj.sub_industry = sub_industry
             else:
                 # Insert new ticker metadata
+                ticker_meta_changed = True
                 metadata = {'name_ko': name_ko} if name_ko else None
                 ticker_obj = Ticker(
                     ticker=ticker,
@@ -506,6 +557,7 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
                     mfi=mfi,
                 )
                 db.add(indicator_obj)
+            indicator_dates.add(score_date)
 
         # ==========================================
         # 4) UPSERT to ticker_ai_analysis (AI predictions)
@@ -1054,6 +1106,7 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
             earn_est = cal.earnings_estimate or {}
             rev_est = cal.revenue_estimate or {}
 
+            calendar_tickers.add(ticker)
             cal_obj = db.query(TickerCalendar).filter(
                 TickerCalendar.ticker == ticker,
                 TickerCalendar.date == score_date,
@@ -1118,6 +1171,7 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
         if is_extended and hasattr(item, 'classification') and item.classification:
             import json as _json
             cls = item.classification
+            classification_tickers.add(ticker)
             cls_obj = db.query(StockClassification).filter(
                 StockClassification.ticker == ticker,
                 StockClassification.date == score_date,
@@ -1144,9 +1198,90 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
                 ))
 
         upserted += 1
-
+        ingested_tickers.add(ticker.upper())
+        ingested_dates.add(score_date)
+        if trading_value is not None:
+            trading_value_dates.add(score_date)
+        if is_extended and (
+            item.fundamentals or item.calendar or item.earnings_history
+            or item.institutional_holders or item.classification
+            or (item.strategy and (item.strategy.defense_lines or item.strategy.recommendations))
+        ):
+            static_tickers.add(ticker.upper())
+
+    # 최신 스냅샷 테이블 + 분류 카운터 + 차트 일별 비정규화 행 (원본 행과 같은 트랜잭션)
+    db.flush()
+    refresh_current_calendar(db, calendar_tickers)
+    refresh_current_classifications(db, classification_tickers)
+    if ingested_dates:
+        refresh_daily_wide(db, ingested_tickers, min(ingested_dates), max(ingested_dates))
     db.commit()
 
+    # ----------------------------
+    # 차트 정적 섹션 재생성 (profile/fundamentals/calendar/... 입력이 바뀐 종목)
+    # ----------------------------
+    try:
+        rebuilt = rebuild_static_sections(db, static_tickers)
+        logger.info(f"Rebuilt chart static sections for {rebuilt} tickers")
+    except Exception as e:
+        logger.error(f"Chart static sections rebuild failed: {e}")
+        db.rollback()
+
+    # ----------------------------
+    # 캐시 무효화: 종목별 + 날짜별 + 전체 scores 데이터 버전 증가
+    # ----------------------------
+    # 신규 분석 종목 또는 메타데이터 변경 → "tickers" (검색 인덱스)
+    ticker_keys = ["tickers"] if ticker_meta_changed or search_index.unknown(ingested_tickers) else []
+    scores_version = None  # 이 수집이 만든 "scores" 버전 (증분 갱신 가능 여부 판단)
+    try:
+        scores_version = data_versions.bump(
+            db,
+            [ticker_key(t) for t in ingested_tickers]
+            + [scores_date_key(d) for d in ingested_dates]
+            + ["scores"] + ticker_keys,
+        )["scores"]
+    except Exception as e:
+        logger.error(f"Data version bump failed (scores): {e}")
+        db.rollback()
+
+    # ----------------------------
+    # 최신일 워터마크 전진 (MAX(date) 스캔 대체)
+    # ----------------------------
+    if ingested_dates:
+        try:
+            watermarks.advance(db, {
+                "prices": max(ingested_dates),
+                "scores": max(ingested_dates),
+                "indicators": max(indicator_dates) if indicator_dates else None,
+                "prices_trading_value": max(trading_value_dates) if trading_value_dates else None,
+            })
+        except Exception as e:
+            logger.error(f"Watermark advance failed (scores): {e}")
+            db.rollback()
+
+    # ----------------------------
+    # 트리맵 스냅샷 (date × index × exclude_etf) + 점수 리더보드 + 종목별 최신 점수 맵
+    # ----------------------------
+    if ingested_dates:
+        try:
+            treemap_snapshots.materialize(db, max(ingested_dates))
+            leaderboards.materialize(db, max(ingested_dates))
+            latest_scores.refresh(db)
+        except Exception as e:
+            logger.error(f"Treemap snapshot / leaderboard / latest score build failed: {e}")
+            db.rollback()
+
+    # ----------------------------
+    # 실시간 P&L 캐시: 수집 종목 보유 사용자만 일괄 재평가
+    # ----------------------------
+    if ingested_tickers:
+        try:
+            revalued = portfolio_pnl.revalue(db, ingested_tickers, scores_version)
+            logger.info(f"Revalued real-time P&L for {revalued} cached users")
+        except Exception as e:
+            logger.error(f"Portfolio P&L revaluation failed: {e}")
+            db.rollback()
+
     # ----------------------------
     # FCM 알림: score ≥80 or ≤20
     # ----------------------------
@@ -1197,6 +1332,12 @@ def ingest_scores(payload: IngestPayload, db: Session = Depends(get_db)):
     db.execute(text("DELETE FROM analytics.ticker_recommendations WHERE date < CURRENT_DATE - INTERVAL '3 years'"))
     db.execute(text("DELETE FROM analytics.ticker_institutional_holders WHERE date < CURRENT_DATE - INTERVAL '3 years'"))
     db.execute(text("DELETE FROM analytics.stock_classifications WHERE date < CURRENT_DATE - INTERVAL '3 years'"))
+    db.execute(text("DELETE FROM analytics.ticker_daily_wide WHERE date < CURRENT_DATE - INTERVAL '3 years'"))
+    # 삭제된 날짜의 "scores:<date>" 버전 키 (ISO 날짜 → 문자열 비교)
+    db.execute(text(
+        "DELETE FROM analytics.data_versions WHERE key LIKE 'scores:%' "
+        "AND key < 'scores:' || TO_CHAR(CURRENT_DATE - INTERVAL '3 years', 'YYYY-MM-DD')"
+    ))
     db.commit()
 
     return {
@@ -1261,6 +1402,13 @@ def ingest_earnings_week(payload: EarningsWeekIngestPayload, db: Session = Depen
 
     db.commit()
 
+    # 캐시 무효화 (ETag / 응답 캐시)
+    try:
+        data_versions.bump(db, ["calendar"])
+    except Exception as e:
+        logger.error(f"Data version bump failed (earnings week): {e}")
+        db.rollback()
+
     return {
         "status": "ok",
         "date": payload.date,
@@ -1343,6 +1491,14 @@ def ingest_market_indices(payload: MarketIndicesIngestPayload, db: Session = Dep
     ))
     db.commit()
 
+    # 캐시 무효화 (ETag / 응답 캐시)
+    try:
+        data_versions.bump(db, ["indices"])
+        watermarks.advance(db, {"indices": ingest_date})
+    except Exception as e:
+        logger.error(f"Data version bump failed (market indices): {e}")
+        db.rollback()
+
     return {"status": "ok", "upserted": upserted, "chart_points": chart_points}
 
 
@@ -1357,10 +1513,12 @@ def ingest_news(payload: NewsIngestPayload, db: Session = Depends(get_db)):
 
     - title_hash = md5(lower(trim(title))) 로 중복 제거
     - UPSERT: (ticker, date, title_hash) 기준
+    - 시간별 멘션 집계(ticker_news_hourly) / 일별 감성 카운터(ticker_news_daily) 증분 갱신 (같은 트랜잭션)
     - 3년 자동 cleanup
     """
     upserted = 0
     seen = set()  # 배치 내 중복 방지
+    rollup = NewsRollupDeltas()
 
     for item in payload.items:
         title_hash = hashlib.md5(item.title.lower().strip().encode("utf-8")).hexdigest()
@@ -1377,7 +1535,10 @@ def ingest_news(payload: NewsIngestPayload, db: Session = Depends(get_db)):
 
         future_event_dict = item.future_event.model_dump() if item.future_event else None
 
+        ticker = item.ticker.upper()
         if obj:
+            # 기존 기사의 집계 기여분 제거 후 새 값으로 다시 반영
+            rollup.add(ticker, obj.date, obj.published_at, obj.sentiment_score, obj.sentiment_grade, sign=-1)
             obj.title = item.title
             obj.source = item.source
             obj.source_url = item.source_url
@@ -1411,10 +1572,20 @@ def ingest_news(payload: NewsIngestPayload, db: Session = Depends(get_db)):
                 hot_topic_category=item.hot_topic_category,
                 hot_topic_priority=item.hot_topic_priority,
             ))
+        rollup.add(ticker, item.date, item.published_at, item.sentiment_score, item.sentiment_grade)
         upserted += 1
 
+    rollup.apply(db)
     db.commit()
 
+    # 캐시 무효화: 차트 응답에 뉴스/감성 통계 포함 → 종목별 버전 증가
+    try:
+        news_tickers = {item.ticker.upper() for item in payload.items}
+        data_versions.bump(db, [ticker_key(t) for t in news_tickers] + ["news"])
+    except Exception as e:
+        logger.error(f"Data version bump failed (news): {e}")
+        db.rollback()
+
     # ----------------------------
     # FCM 알림: bullish/bearish 뉴스
     # ----------------------------
@@ -1454,11 +1625,12 @@ def ingest_news(payload: NewsIngestPayload, db: Session = Depends(get_db)):
         logger.error(f"FCM bullish surge error: {e}")
     db.commit()
 
-    # 3년 cleanup
+    # 3년 cleanup (+ 만료된 시간별 집계 버킷)
     db.execute(text(
         "DELETE FROM analytics.ticker_news "
         "WHERE date < CURRENT_DATE - INTERVAL '3 years'"
     ))
+    cleanup_rollups(db)
     db.commit()
 
     return NewsIngestResponse(upserted=upserted, total=len(payload.items))
@@ -1579,6 +1751,13 @@ def ingest_calendar(payload: MarketCalendarIngestPayload, db: Session = Depends(
 
     db.commit()
 
+    # 캐시 무효화 (ETag / 응답 캐시)
+    try:
+        data_versions.bump(db, ["calendar"])
+    except Exception as e:
+        logger.error(f"Data version bump failed (calendar): {e}")
+        db.rollback()
+
     return {"status": "ok", "upserted": upserted}
 
 
@@ -1762,6 +1941,9 @@ def ingest_portfolio_summary(
 
     db.commit()
 
+    # 실시간 P&L 캐시 무효화 (AI 요약/periods/trade_history 변경)
+    portfolio_pnl.invalidate(db, [item.user_id for item in payload.items])
+
     # 3년 cleanup
     db.execute(text(
         "DELETE FROM analytics.portfolio_summary "
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import date as DateType, timedelta
-from typing import Optional, List, Dict, Tuple
+from typing import Optional
 
 from app.database import get_db
 from app.models import MacroIndicator, MacroChartData
+from app.services.data_versions import data_versions
+from app.services.http_cache import cache_validators, is_not_modified, not_modified
+from app.services.response_cache import cached_json_response, macro_chart_cache
+from app.services.watermarks import watermarks
+from app.utils.downsampling import lttb_indices
+from app.utils.resampling import AGG_PATTERN, FREQ_PATTERN, align_series, resample
 from app.schemas import (
     MacroIndicatorsResponse, MacroIndicatorResponse,
     MacroSignalsResponse, MacroSignalResponse,
@@ -21,58 +27,51 @@ INDICATOR_ORDER = ["FEDFUNDS", "DGS10", "DGS2", "T10Y2Y", "VIXCLS", "CPIAUCSL",
 # Signal codes (시장레이더/머니프린팅)
 SIGNAL_CODES = {"yield_curve", "m2_liquidity"}
 
+# /charts/multi: max series per request, max lookback (chart data retention: 3 years)
+MULTI_CHART_MAX_SERIES = 10
+MULTI_CHART_MAX_DAYS = 3 * 366
 
-def _compute_3m_stats(
-    db: Session, indicator_codes: List[str], is_signal: bool, target_date: DateType,
-) -> Dict[str, Tuple[Optional[float], Optional[float], Optional[float]]]:
-    """Compute 90-day high/avg/low per indicator_code.
 
-    Returns dict: {code: (high_3m, avg_3m, low_3m)}
-    """
-    from_date = target_date - timedelta(days=90)
-    source_filter = (
-        MacroIndicator.source == 'SIGNAL' if is_signal
-        else MacroIndicator.source != 'SIGNAL'
-    )
+def _window_stats(r: MacroIndicator) -> dict:
+    """Rolling-window stats stored on the row at ingest (app/services/macro_stats.py)."""
+    return {
+        "high_3m": r.high_3m, "avg_3m": r.avg_3m, "low_3m": r.low_3m,
+        "high_1y": r.high_1y, "avg_1y": r.avg_1y, "low_1y": r.low_1y,
+        "percentile_1y": r.percentile_1y,
+    }
 
-    rows = (
-        db.query(
-            MacroIndicator.indicator_code,
-            func.max(MacroIndicator.value),
-            func.avg(MacroIndicator.value),
-            func.min(MacroIndicator.value),
-        )
-        .filter(
-            MacroIndicator.indicator_code.in_(indicator_codes),
-            MacroIndicator.date >= from_date,
-            MacroIndicator.date <= target_date,
-            source_filter,
-        )
-        .group_by(MacroIndicator.indicator_code)
-        .all()
-    )
 
-    result = {}
-    for code, high, avg, low in rows:
-        result[code] = (
-            round(high, 4) if high is not None else None,
-            round(float(avg), 4) if avg is not None else None,
-            round(low, 4) if low is not None else None,
-        )
-    return result
+def _indicator_response(r: MacroIndicator) -> MacroIndicatorResponse:
+    return MacroIndicatorResponse(
+        indicator_code=r.indicator_code,
+        indicator_name=r.indicator_name,
+        value=r.value,
+        observation_date=str(r.observation_date) if r.observation_date else None,
+        previous_value=r.previous_value,
+        change_pct=r.change_pct,
+        risk_level=r.risk_level,
+        liquidity_status=r.liquidity_status,
+        signal_message=r.signal_message,
+        **_window_stats(r),
+    )
 
 
 @router.get("/indicators", response_model=MacroIndicatorsResponse)
 def get_macro_indicators(
+    request: Request,
+    response: Response,
     date: Optional[DateType] = Query(None, description="Date (default: latest)"),
     db: Session = Depends(get_db),
 ):
     """거시경제 지표 조회 (date=None → 최신)"""
+    validators = cache_validators("macro_indicators", ["macro"], date)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response.headers.update(validators)
+
     target_date = date
     if target_date is None:
-        target_date = db.query(func.max(MacroIndicator.date)).filter(
-            MacroIndicator.source != 'SIGNAL'
-        ).scalar()
+        target_date = watermarks.latest("macro")
     if target_date is None:
         return MacroIndicatorsResponse(date="", indicators=[])
 
@@ -88,43 +87,28 @@ def get_macro_indicators(
         if r.indicator_code not in INDICATOR_ORDER:
             sorted_rows.append(r)
 
-    # 3-month stats
-    codes = [r.indicator_code for r in sorted_rows]
-    stats_3m = _compute_3m_stats(db, codes, is_signal=False, target_date=target_date)
-
     return MacroIndicatorsResponse(
         date=str(target_date),
-        indicators=[
-            MacroIndicatorResponse(
-                indicator_code=r.indicator_code,
-                indicator_name=r.indicator_name,
-                value=r.value,
-                observation_date=str(r.observation_date) if r.observation_date else None,
-                previous_value=r.previous_value,
-                change_pct=r.change_pct,
-                risk_level=r.risk_level,
-                liquidity_status=r.liquidity_status,
-                signal_message=r.signal_message,
-                high_3m=stats_3m.get(r.indicator_code, (None, None, None))[0],
-                avg_3m=stats_3m.get(r.indicator_code, (None, None, None))[1],
-                low_3m=stats_3m.get(r.indicator_code, (None, None, None))[2],
-            )
-            for r in sorted_rows
-        ],
+        indicators=[_indicator_response(r) for r in sorted_rows],
     )
 
 
 @router.get("/signals", response_model=MacroSignalsResponse)
 def get_macro_signals(
+    request: Request,
+    response: Response,
     date: Optional[DateType] = Query(None, description="Date (default: latest)"),
     db: Session = Depends(get_db),
 ):
     """시장레이더/머니프린팅 신호 조회 (date=None → 최신)"""
+    validators = cache_validators("macro_signals", ["macro"], date)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response.headers.update(validators)
+
     target_date = date
     if target_date is None:
-        target_date = db.query(func.max(MacroIndicator.date)).filter(
-            MacroIndicator.source == 'SIGNAL'
-        ).scalar()
+        target_date = watermarks.latest("macro_signals")
     if target_date is None:
         return MacroSignalsResponse(date="", signals=[])
 
@@ -133,10 +117,6 @@ def get_macro_signals(
         MacroIndicator.source == 'SIGNAL',
     ).all()
 
-    # 3-month stats
-    codes = [r.indicator_code for r in rows]
-    stats_3m = _compute_3m_stats(db, codes, is_signal=True, target_date=target_date)
-
     return MacroSignalsResponse(
         date=str(target_date),
         signals=[
@@ -147,9 +127,7 @@ def get_macro_signals(
                 liquidity_status=r.liquidity_status,
                 message=r.signal_message,
                 date=str(r.date),
-                high_3m=stats_3m.get(r.indicator_code, (None, None, None))[0],
-                avg_3m=stats_3m.get(r.indicator_code, (None, None, None))[1],
-                low_3m=stats_3m.get(r.indicator_code, (None, None, None))[2],
+                **_window_stats(r),
             )
             for r in rows
         ],
@@ -158,11 +136,19 @@ def get_macro_signals(
 
 @router.get("/charts", response_model=MacroChartResponse)
 def get_macro_chart(
+    request: Request,
+    response: Response,
     series: str = Query(..., description="Series ID (e.g., t10y2y, m2_growth)"),
     days: int = Query(365, description="Number of days of data (default: 365)"),
+    max_points: Optional[int] = Query(None, ge=3, le=1000, description="LTTB-downsample to N points (default: all)"),
     db: Session = Depends(get_db),
 ):
-    """매크로 차트 시계열 데이터 조회"""
+    """매크로 차트 시계열 데이터 조회 (max_points: 장기 구간 LTTB 다운샘플링)"""
+    validators = cache_validators("macro_charts", ["macro"], series, days, max_points, DateType.today())
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response.headers.update(validators)
+
     from_date = DateType.today() - timedelta(days=days)
 
     rows = db.query(MacroChartData).filter(
@@ -170,6 +156,10 @@ def get_macro_chart(
         MacroChartData.date >= from_date,
     ).order_by(MacroChartData.date.asc()).all()
 
+    if max_points is not None:
+        keep = lttb_indices([r.date.toordinal() for r in rows], [r.value for r in rows], max_points)
+        rows = [rows[i] for i in keep]
+
     return MacroChartResponse(
         series_id=series,
         count=len(rows),
@@ -183,6 +173,81 @@ def get_macro_chart(
     )
 
 
+@router.get("/charts/multi")
+def get_macro_charts_multi(
+    request: Request,
+    series: str = Query(..., description="Comma-separated series IDs (e.g., t10y2y,m2_growth)"),
+    freq: str = Query("D", pattern=FREQ_PATTERN, description="D (daily) | W (weekly, Monday label) | M (monthly, 1st label)"),
+    agg: str = Query("last", pattern=AGG_PATTERN, description="last | mean value per period"),
+    days: int = Query(365, ge=1, le=MULTI_CHART_MAX_DAYS, description="Number of days of data (default: 365)"),
+    db: Session = Depends(get_db),
+):
+    """
+    여러 매크로 시계열을 공통 날짜 인덱스로 정렬해 한 번에 반환 (columnar).
+
+    Example:
+    ```
+    GET /api/v1/macro/charts/multi?series=t10y2y,m2_growth&freq=W
+    ```
+
+    Response:
+    ```json
+    {
+      "freq": "W", "agg": "last", "count": 2,
+      "data": {
+        "date": ["2026-01-05", "2026-01-12"],
+        "t10y2y": [0.42, 0.45],
+        "m2_growth": [null, 3.1]
+      }
+    }
+    ```
+    A series without a value in a period has null there. Unknown series
+    return all-null columns (빈 구조, 404 금지). "date" cannot be requested
+    as a series (it is the index column).
+    """
+    series_ids = list(dict.fromkeys(s.strip() for s in series.split(",") if s.strip()))
+    if not series_ids:
+        raise HTTPException(400, "series is required")
+    if len(series_ids) > MULTI_CHART_MAX_SERIES:
+        raise HTTPException(400, f"At most {MULTI_CHART_MAX_SERIES} series per request")
+    if "date" in series_ids:
+        raise HTTPException(400, "'date' is reserved for the date index")
+
+    today = DateType.today()
+    validators = cache_validators("macro_charts_multi", ["macro"], *series_ids, freq, agg, days, today)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
+    cache_key = f"{','.join(series_ids)}|{freq}|{agg}|{days}|{today}|v{data_versions.get('macro')}"
+    body = macro_chart_cache.get(cache_key)
+    if body is None:
+        rows = db.query(
+            MacroChartData.series_id, MacroChartData.date, MacroChartData.value,
+        ).filter(
+            MacroChartData.series_id.in_(series_ids),
+            MacroChartData.date >= today - timedelta(days=days),
+        ).order_by(MacroChartData.series_id, MacroChartData.date).all()
+
+        by_series = {series_id: ([], []) for series_id in series_ids}
+        for r in rows:
+            by_series[r.series_id][0].append(r.date)
+            by_series[r.series_id][1].append(r.value)
+
+        index, columns = align_series({
+            series_id: resample(dates, values, freq, agg)
+            for series_id, (dates, values) in by_series.items()
+        })
+        body = orjson.dumps({
+            "freq": freq,
+            "agg": agg,
+            "count": len(index),
+            "data": {"date": index, **columns},
+        })
+        macro_chart_cache.set(cache_key, body)
+
+    return cached_json_response(request, macro_chart_cache, cache_key, body, validators)
+
+
 @router.get("/history/{indicator_code}", response_model=MacroHistoryResponse)
 def get_macro_history(
     indicator_code: str,
@@ -198,31 +263,8 @@ def get_macro_history(
         .all()
     )
 
-    # 3-month stats (based on latest date)
-    stats_3m: dict = {}
-    if rows:
-        is_signal = rows[0].source == 'SIGNAL'
-        stats_3m = _compute_3m_stats(
-            db, [indicator_code], is_signal=is_signal, target_date=rows[0].date,
-        )
-
-    entries = [
-        MacroIndicatorResponse(
-            indicator_code=r.indicator_code,
-            indicator_name=r.indicator_name,
-            value=r.value,
-            observation_date=str(r.observation_date) if r.observation_date else None,
-            previous_value=r.previous_value,
-            change_pct=r.change_pct,
-            risk_level=r.risk_level,
-            liquidity_status=r.liquidity_status,
-            signal_message=r.signal_message,
-            high_3m=stats_3m.get(r.indicator_code, (None, None, None))[0],
-            avg_3m=stats_3m.get(r.indicator_code, (None, None, None))[1],
-            low_3m=stats_3m.get(r.indicator_code, (None, None, None))[2],
-        )
-        for r in rows
-    ]
+    # Each entry reports the stats of its own date
+    entries = [_indicator_response(r) for r in rows]
 
     return MacroHistoryResponse(
         indicator_code=indicator_code,
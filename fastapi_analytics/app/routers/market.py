@@ -1,42 +1,32 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from datetime import date
+from sqlalchemy import text
+from datetime import date, timedelta
 from typing import Optional
 from collections import defaultdict
 
+import orjson
+
 from app.database import get_db
-from app.models import TickerPrice, Ticker, TickerScore, MarketIndex, MarketIndexChart, StockMembership, StockClassification
+from app.models import MarketIndex, MarketIndexChart, ClassificationCount
+from app.services.data_versions import data_versions, scores_date_key
+from app.services.http_cache import cache_validators, is_not_modified, not_modified
+from app.services.response_cache import cached_json_response, indices_cache
+from app.services.treemap_snapshots import treemap_snapshots
+from app.services.watermarks import watermarks
+from app.utils.downsampling import lttb_indices
 from app.schemas import (
-    TreemapResponse, TreemapSector, TreemapItem,
-    MarketIndicesResponse, MarketIndexResponse, IndexChartPoint,
-    ClassificationResponse,
+    TreemapResponse,
+    MarketIndicesResponse,
 )
 
 router = APIRouter()
 
-# ETF name detection keywords (for tickers with NULL sector)
-_ETF_NAME_KEYWORDS = (
-    'ETF', 'FUND', 'TRUST',
-    'PROSHARES', 'DIREXION', 'ISHARES', 'SPDR',
-    'VANGUARD', 'VANECK', 'GLOBAL X', 'KRANESHARES',
-    'STATE STREET', 'INVESCO', 'SCHWAB', 'AMPLIFY', 'JPMORGAN',
-)
-
-
-def _detect_sector(sector: str | None, name: str | None) -> str:
-    # Always check ETF keywords in name first (even if sector exists)
-    if name:
-        name_upper = name.upper()
-        if any(kw in name_upper for kw in _ETF_NAME_KEYWORDS):
-            return "ETF"
-    if sector:
-        return sector
-    return "Unknown"
-
 
 @router.get("/treemap", response_model=TreemapResponse)
 def get_treemap(
+    request: Request,
     target_date: Optional[date] = Query(None, alias="date", description="Target date (default: latest available)"),
     sector: Optional[str] = Query(None, description="Filter by sector name"),
     index: Optional[str] = Query(None, description="Filter by index: SP500, DOW30, NASDAQ100"),
@@ -51,131 +41,41 @@ def get_treemap(
     Returns tickers grouped by GICS sector with change_pct and trading_value
     for Flutter treemap chart rendering.
     """
+    # Conditional GET (scores ingest bumps "scores" and "scores:<date>")
+    validators = cache_validators(
+        "treemap", [scores_date_key(target_date) if target_date else "scores"],
+        target_date, sector, index, classification, limit, exclude_etf,
+    )
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
     # Determine target date: use provided or find latest available
     if target_date is None:
-        latest = (
-            db.query(func.max(TickerPrice.date))
-            .filter(TickerPrice.trading_value.isnot(None))
-            .scalar()
-        )
+        latest = watermarks.latest("prices_trading_value")
         if latest is None:
             # Fallback: latest date with any price data
-            latest = db.query(func.max(TickerPrice.date)).scalar()
+            latest = watermarks.latest("prices")
         if latest is None:
-            return TreemapResponse(date=date.today(), total_tickers=0, sectors=[])
+            return ORJSONResponse({"date": date.today(), "total_tickers": 0, "sectors": []}, headers=validators)
         target_date = latest
 
-    # Query: ticker_prices LEFT JOIN tickers LEFT JOIN ticker_scores
-    query = (
-        db.query(
-            TickerPrice.ticker,
-            TickerPrice.close,
-            TickerPrice.volume,
-            TickerPrice.change_pct,
-            TickerPrice.trading_value,
-            Ticker.name,
-            Ticker.extra_data,
-            Ticker.sector,
-            Ticker.sub_industry,
-            TickerScore.score,
-            TickerScore.signal,
-        )
-        .outerjoin(Ticker, TickerPrice.ticker == Ticker.ticker)
-        .outerjoin(
-            TickerScore,
-            (TickerPrice.ticker == TickerScore.ticker) & (TickerPrice.date == TickerScore.date),
-        )
-        .filter(TickerPrice.date == target_date)
-    )
+    # Slice the (date, index, exclude_etf) snapshot instead of re-querying
+    snapshot = treemap_snapshots.get(db, target_date, index, exclude_etf)
+    view_key = (sector, classification, limit)
+    body = snapshot.view(*view_key)
+    return cached_json_response(request, snapshot, view_key, body, validators)
 
-    # Optional sector filter
-    if sector:
-        query = query.filter(Ticker.sector == sector)
-
-    # Optional index filter
-    if index:
-        query = query.join(
-            StockMembership,
-            (TickerPrice.ticker == StockMembership.ticker) &
-            (StockMembership.index_code == index)
-        )
-
-    # Optional classification filter (Peter Lynch)
-    if classification:
-        # Subquery: latest classification per ticker
-        cls_subq = (
-            db.query(
-                StockClassification.ticker,
-                func.max(StockClassification.date).label("max_date"),
-            )
-            .group_by(StockClassification.ticker)
-            .subquery()
-        )
-        query = query.join(
-            StockClassification,
-            (TickerPrice.ticker == StockClassification.ticker),
-        ).join(
-            cls_subq,
-            (StockClassification.ticker == cls_subq.c.ticker) &
-            (StockClassification.date == cls_subq.c.max_date),
-        ).filter(StockClassification.category == classification.upper())
-
-    # Order by trading_value DESC, limit results
-    query = query.order_by(desc(TickerPrice.trading_value)).limit(limit)
-
-    rows = query.all()
-
-    # Group by sector in Python
-    sector_map = defaultdict(list)
-    for row in rows:
-        sector_name = _detect_sector(row.sector, row.name)
-        if exclude_etf and sector_name == "ETF":
-            continue
-        name_ko = (row.extra_data or {}).get('name_ko') if row.extra_data else None
-        sector_map[sector_name].append(
-            TreemapItem(
-                ticker=row.ticker,
-                name=row.name,
-                name_ko=name_ko,
-                sector=sector_name,
-                sub_industry=row.sub_industry,
-                change_pct=row.change_pct,
-                trading_value=row.trading_value,
-                close=row.close,
-                volume=row.volume,
-                score=row.score,
-                signal=row.signal,
-            )
-        )
-
-    # Build sector summaries
-    sectors = []
-    for sector_name, items in sorted(sector_map.items()):
-        change_values = [i.change_pct for i in items if i.change_pct is not None]
-        trading_values = [i.trading_value for i in items if i.trading_value is not None]
-
-        sectors.append(
-            TreemapSector(
-                sector=sector_name,
-                ticker_count=len(items),
-                avg_change_pct=sum(change_values) / len(change_values) if change_values else None,
-                total_trading_value=sum(trading_values) if trading_values else None,
-                items=items,
-            )
-        )
 
-    total_tickers = sum(s.ticker_count for s in sectors)
-
-    return TreemapResponse(
-        date=target_date,
-        total_tickers=total_tickers,
-        sectors=sectors,
-    )
+# Sparkline ranges (days back from the target date)
+_INDEX_CHART_RANGES = {"1m": 31, "3m": 92, "6m": 183, "1y": 366, "2y": 731, "3y": 1096, "all": None}
 
 
 @router.get("/indices", response_model=MarketIndicesResponse)
 def get_market_indices(
+    request: Request,
     target_date: Optional[date] = Query(None, alias="date", description="Target date (default: latest)"),
+    points: Optional[int] = Query(None, ge=3, le=1000, description="Sparkline points per index (LTTB downsampling; default: all)"),
+    chart_range: str = Query("all", alias="range", pattern="^(1m|3m|6m|1y|2y|3y|all)$", description="Sparkline range"),
     db: Session = Depends(get_db),
 ):
     """
@@ -183,39 +83,75 @@ def get_market_indices(
 
     SPY (S&P 500), QQQ (NASDAQ 100), DIA (Dow Jones)의
     종가, 전일대비 변동률, 스파크라인 차트 데이터를 반환.
+
+    - range: 스파크라인 기간 (1m/3m/6m/1y/2y/3y/all)
+    - points: 지수별 최대 포인트 수 (LTTB로 형태 보존 다운샘플링, 스파크라인은 ~60 권장)
+    - 지수 데이터 버전별 응답 캐시
     """
+    validators = cache_validators("indices", ["indices"], target_date, points, chart_range)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
     # 날짜 결정 (미지정 시 최신)
     if target_date is None:
-        target_date = db.query(func.max(MarketIndex.date)).scalar()
+        target_date = watermarks.latest("indices")
     if target_date is None:
-        return MarketIndicesResponse(date=str(date.today()), indices=[])
+        return ORJSONResponse({"date": str(date.today()), "indices": []}, headers=validators)
+
+    cache_key = f"{target_date}|{points}|{chart_range}|v{data_versions.get('indices')}"
+    body = indices_cache.get(cache_key)
+    if body is None:
+        body = orjson.dumps(_build_market_indices(db, target_date, points, chart_range))
+        indices_cache.set(cache_key, body)
+
+    return cached_json_response(request, indices_cache, cache_key, body, validators)
+
 
+def _build_market_indices(db: Session, target_date: date, points: Optional[int], chart_range: str) -> dict:
+    """Index rows of a date + all sparklines in one query, downsampled per index."""
     # 해당 날짜의 지수 데이터 조회
     rows = db.query(MarketIndex).filter(
         MarketIndex.date == target_date,
     ).order_by(MarketIndex.code).all()
 
     if not rows:
-        return MarketIndicesResponse(date=str(target_date), indices=[])
+        return {"date": str(target_date), "indices": []}
+
+    # 전체 지수 차트 데이터 단일 조회 (지수별 N+1 쿼리 제거)
+    chart_query = db.query(
+        MarketIndexChart.code, MarketIndexChart.date, MarketIndexChart.close,
+    ).filter(
+        MarketIndexChart.code.in_([row.code for row in rows]),
+    )
+    days = _INDEX_CHART_RANGES[chart_range]
+    if days is not None:
+        chart_query = chart_query.filter(MarketIndexChart.date >= target_date - timedelta(days=days))
+
+    charts = defaultdict(list)
+    for c in chart_query.order_by(MarketIndexChart.code, MarketIndexChart.date).all():
+        charts[c.code].append(c)
 
-    # 각 지수별 차트 데이터 조회
     indices = []
     for row in rows:
-        chart_rows = db.query(MarketIndexChart).filter(
-            MarketIndexChart.code == row.code,
-        ).order_by(MarketIndexChart.date).all()
-
-        indices.append(MarketIndexResponse(
-            code=row.code, name=row.name,
-            close=row.close, prev_close=row.prev_close,
-            change=row.change, change_pct=row.change_pct,
-            open=row.open, high=row.high, low=row.low,
-            volume=row.volume,
-            chart=[IndexChartPoint(date=str(c.date), close=c.close)
-                   for c in chart_rows],
-        ))
+        chart_rows = charts.get(row.code, [])
+        if points is not None:
+            keep = lttb_indices(
+                [c.date.toordinal() for c in chart_rows],
+                [c.close for c in chart_rows],
+                points,
+            )
+            chart_rows = [chart_rows[i] for i in keep]
+
+        indices.append({
+            "code": row.code, "name": row.name,
+            "close": row.close, "prev_close": row.prev_close,
+            "change": row.change, "change_pct": row.change_pct,
+            "open": row.open, "high": row.high, "low": row.low,
+            "volume": row.volume,
+            "chart": [{"date": str(c.date), "close": c.close} for c in chart_rows],
+        })
 
-    return MarketIndicesResponse(date=str(target_date), indices=indices)
+    return {"date": str(target_date), "indices": indices}
 
 
 @router.get("/classifications/summary")
@@ -225,31 +161,13 @@ def get_classification_summary(
     """
     카테고리별 종목 수 요약 (Peter Lynch 6-category).
 
+    classification_counts 카운터 (scores ingest가 분류 이동분만 반영) 조회.
+
     Returns: {"FAST_GROWER": 120, "STALWART": 95, ...}
     """
-    from sqlalchemy import distinct
-
-    # Get latest date per ticker (subquery)
-    from sqlalchemy.orm import aliased
-    subq = (
-        db.query(
-            StockClassification.ticker,
-            func.max(StockClassification.date).label("max_date"),
-        )
-        .group_by(StockClassification.ticker)
-        .subquery()
-    )
-
-    rows = (
-        db.query(StockClassification.category, func.count())
-        .join(
-            subq,
-            (StockClassification.ticker == subq.c.ticker) &
-            (StockClassification.date == subq.c.max_date),
-        )
-        .group_by(StockClassification.category)
-        .all()
-    )
+    rows = db.query(ClassificationCount.category, ClassificationCount.ticker_count).filter(
+        ClassificationCount.ticker_count > 0,
+    ).all()
 
     return {category: count for category, count in rows}
 
@@ -263,89 +181,38 @@ def get_stocks_by_classification(
     """
     특정 분류의 종목 목록 조회.
 
+    stock_classifications_current (category, confidence) 인덱스로 상위 N개만 읽고,
+    점수/가격은 해당 종목별 최신 1행만 LATERAL 조회 (전체 테이블 GROUP BY 없음).
+
     Returns: list of {ticker, name, name_ko, category_ko, category_en, confidence, score, change_pct}
     """
-    # Latest classification per ticker
-    subq = (
-        db.query(
-            StockClassification.ticker,
-            func.max(StockClassification.date).label("max_date"),
-        )
-        .group_by(StockClassification.ticker)
-        .subquery()
-    )
-
-    # Latest score per ticker (independent of classification date)
-    score_subq = (
-        db.query(
-            TickerScore.ticker,
-            func.max(TickerScore.date).label("max_date"),
-        )
-        .group_by(TickerScore.ticker)
-        .subquery()
-    )
-
-    # Latest price per ticker (independent of classification date)
-    price_subq = (
-        db.query(
-            TickerPrice.ticker,
-            func.max(TickerPrice.date).label("max_date"),
-        )
-        .group_by(TickerPrice.ticker)
-        .subquery()
-    )
-
-    rows = (
-        db.query(
-            StockClassification.ticker,
-            StockClassification.category,
-            StockClassification.category_ko,
-            StockClassification.category_en,
-            StockClassification.confidence,
-            Ticker.name,
-            Ticker.extra_data,
-            TickerScore.score,
-            TickerScore.signal,
-            TickerPrice.change_pct,
-            TickerPrice.close,
-        )
-        .join(
-            subq,
-            (StockClassification.ticker == subq.c.ticker) &
-            (StockClassification.date == subq.c.max_date),
-        )
-        .outerjoin(Ticker, StockClassification.ticker == Ticker.ticker)
-        .outerjoin(
-            score_subq,
-            StockClassification.ticker == score_subq.c.ticker,
-        )
-        .outerjoin(
-            TickerScore,
-            (StockClassification.ticker == TickerScore.ticker) &
-            (TickerScore.date == score_subq.c.max_date),
-        )
-        .outerjoin(
-            price_subq,
-            StockClassification.ticker == price_subq.c.ticker,
-        )
-        .outerjoin(
-            TickerPrice,
-            (StockClassification.ticker == TickerPrice.ticker) &
-            (TickerPrice.date == price_subq.c.max_date),
-        )
-        .filter(StockClassification.category == category.upper())
-        .order_by(desc(StockClassification.confidence))
-        .limit(limit)
-        .all()
-    )
+    rows = db.execute(text("""
+        SELECT c.ticker, c.category, c.category_ko, c.category_en, c.confidence,
+               t.name, t.metadata->>'name_ko' AS name_ko,
+               s.score, s.signal, p.change_pct, p.close
+        FROM analytics.stock_classifications_current c
+        LEFT JOIN analytics.tickers t ON t.ticker = c.ticker
+        LEFT JOIN LATERAL (
+            SELECT score, signal FROM analytics.ticker_scores
+            WHERE ticker = c.ticker
+            ORDER BY date DESC LIMIT 1
+        ) s ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT change_pct, close FROM analytics.ticker_prices
+            WHERE ticker = c.ticker
+            ORDER BY date DESC LIMIT 1
+        ) p ON TRUE
+        WHERE c.category = :category
+        ORDER BY c.confidence DESC
+        LIMIT :limit
+    """), {"category": category.upper(), "limit": limit}).fetchall()
 
     results = []
     for row in rows:
-        name_ko = (row.extra_data or {}).get('name_ko') if row.extra_data else None
         results.append({
             "ticker": row.ticker,
             "name": row.name,
-            "name_ko": name_ko,
+            "name_ko": row.name_ko,
             "category": row.category,
             "category_ko": row.category_ko,
             "category_en": row.category_en,
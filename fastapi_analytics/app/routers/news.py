@@ -1,32 +1,65 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, tuple_, or_, and_, text
 from datetime import date, datetime, timedelta
 from typing import Optional
 from app.database import get_db
-from app.models import TickerNews, Ticker
+from app.models import TickerNews, TickerNewsDaily, Ticker
 from app.schemas import (
     NewsListResponse, NewsItemResponse, NewsSummaryResponse,
     TickerMentionBubbleResponse, TickerMentionItem,
     NewsSectorsResponse,
 )
+from app.services.news_rollups import hour_bucket
+from app.services.ticker_metadata import ticker_metadata
+from app.utils.multilang import LANG_PATTERN, localize
+from app.utils.pagination import encode_cursor, decode_cursor, parse_cursor_datetime, estimate_count
 
 router = APIRouter()
 
 
-def _news_row_to_response(r, extra_data, sector) -> NewsItemResponse:
-    """Convert a TickerNews row + joined metadata to NewsItemResponse."""
+def _after_cursor(query, cursor: Optional[str]):
+    """Keyset filter for ORDER BY published_at DESC, id DESC."""
+    if not cursor:
+        return query
+    published_at, news_id = decode_cursor(cursor, 2)
+    return query.filter(
+        tuple_(TickerNews.published_at, TickerNews.id)
+        < tuple_(parse_cursor_datetime(published_at), int(news_id))
+    )
+
+
+def _page_total(db: Session, count_query, page_len: int, cursor: Optional[str],
+                has_more: bool, include_total: bool):
+    """
+    (total, is_estimate) for a page.
+
+    Exact COUNT(*) only when requested or free (single first page);
+    otherwise the planner estimate, so deep pages cost the same as page 1.
+    """
+    if include_total:
+        return count_query.count(), False
+    if not cursor and not has_more:
+        return page_len, False
+    estimate = estimate_count(db, count_query)
+    if estimate is None:
+        return page_len, True
+    return max(estimate, page_len), True
+
+
+def _news_row_to_response(r, extra_data, sector, lang: Optional[str] = None) -> NewsItemResponse:
+    """Convert a TickerNews row + joined metadata to NewsItemResponse (lang: project packed text)."""
     return NewsItemResponse(
         date=r.date,
         ticker=r.ticker,
-        title=r.title,
+        title=localize(r.title, lang),
         source=r.source,
         source_url=r.source_url,
         published_at=r.published_at,
-        ai_summary=r.ai_summary,
+        ai_summary=localize(r.ai_summary, lang),
         sentiment_score=r.sentiment_score,
         sentiment_grade=r.sentiment_grade,
-        sentiment_label=r.sentiment_label,
+        sentiment_label=localize(r.sentiment_label, lang),
         future_event=r.future_event,
         is_breaking=r.is_breaking or False,
         is_hot_topic=r.is_hot_topic or False,
@@ -40,19 +73,23 @@ def _news_row_to_response(r, extra_data, sector) -> NewsItemResponse:
 @router.get("/latest", response_model=NewsListResponse)
 def get_latest_news(
     limit: int = Query(3, ge=1, le=50, description="Max items"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Exact total (COUNT); default is a planner estimate"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor (ignored when cursor is set)"),
     tickers: Optional[str] = Query(None, description="Comma-separated ticker filter (e.g. AAPL,TSLA,MARKET)"),
     sentiment: Optional[str] = Query(None, description="Comma-separated sentiment filter (e.g. bullish,bearish)"),
     sectors: Optional[str] = Query(None, description="Comma-separated sector filter (e.g. Technology,Healthcare)"),
     is_breaking: Optional[bool] = Query(None, description="Filter breaking news only"),
     exclude_market: Optional[bool] = Query(None, description="Exclude MARKET ticker (for Biz category)"),
+    lang: Optional[str] = Query(None, pattern=LANG_PATTERN, description="Project multilingual text to one language (ko/en/zh/ja/es, en fallback); default: packed"),
     db: Session = Depends(get_db),
 ):
     """
     전체 종목 최신 AI 요약 뉴스 조회 (대시보드용).
 
     - 필터 파라미터: tickers, sentiment, sectors, is_breaking
-    - 정렬: published_at DESC
+    - 정렬: published_at DESC, id DESC
+    - 페이지네이션: cursor (keyset), total은 기본 추정치 (include_total=true 시 정확한 값)
     - Ticker JOIN으로 한글 회사명(name_ko) 포함
     - 빈 데이터 시 빈 구조 반환 (404 아님)
     """
@@ -83,28 +120,36 @@ def get_latest_news(
     if exclude_market:
         base_query = base_query.filter(TickerNews.ticker != 'MARKET')
 
-    total = base_query.count()
-
-    rows = (
-        base_query
-        .order_by(TickerNews.published_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    page_query = (
+        _after_cursor(base_query, cursor)
+        .order_by(TickerNews.published_at.desc(), TickerNews.id.desc())
     )
+    if offset and not cursor:
+        page_query = page_query.offset(offset)
+    rows = page_query.limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    total, total_is_estimate = _page_total(db, base_query, offset + len(rows), cursor, has_more, include_total)
 
-    items = [_news_row_to_response(r, extra_data, sector) for r, extra_data, sector in rows]
+    items = [_news_row_to_response(r, extra_data, sector, lang) for r, extra_data, sector in rows]
+    next_cursor = encode_cursor(rows[-1][0].published_at, rows[-1][0].id) if has_more else None
 
-    return NewsListResponse(items=items, total=total)
+    return NewsListResponse(
+        items=items, total=total, total_is_estimate=total_is_estimate, next_cursor=next_cursor,
+    )
 
 
 @router.get("/hot-topics", response_model=NewsListResponse)
 def get_hot_topics(
     limit: int = Query(5, ge=1, le=20, description="Max items"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Exact total (COUNT); default is a planner estimate"),
+    lang: Optional[str] = Query(None, pattern=LANG_PATTERN, description="Project multilingual text to one language (ko/en/zh/ja/es, en fallback); default: packed"),
     db: Session = Depends(get_db),
 ):
     """
-    Hot topic 뉴스 조회 (최근 48시간, priority ASC → published_at DESC).
+    Hot topic 뉴스 조회 (최근 48시간, priority ASC → published_at DESC → id DESC).
 
     - is_hot_topic=True인 뉴스만 반환
     - 토스트 오버레이 표시용
@@ -121,21 +166,47 @@ def get_hot_topics(
         )
     )
 
-    total = base_query.count()
+    page_query = base_query
+    if cursor:
+        # Keyset for priority ASC NULLS LAST, (published_at, id) DESC
+        priority, published_at, news_id = decode_cursor(cursor, 3)
+        after_key = (
+            tuple_(TickerNews.published_at, TickerNews.id)
+            < tuple_(parse_cursor_datetime(published_at), int(news_id))
+        )
+        if priority is None:
+            page_query = page_query.filter(TickerNews.hot_topic_priority.is_(None), after_key)
+        else:
+            page_query = page_query.filter(or_(
+                TickerNews.hot_topic_priority > int(priority),
+                TickerNews.hot_topic_priority.is_(None),
+                and_(TickerNews.hot_topic_priority == int(priority), after_key),
+            ))
 
     rows = (
-        base_query
+        page_query
         .order_by(
             TickerNews.hot_topic_priority.asc().nullslast(),
             TickerNews.published_at.desc(),
+            TickerNews.id.desc(),
         )
-        .limit(limit)
+        .limit(limit + 1)
         .all()
     )
 
-    items = [_news_row_to_response(r, extra_data, sector) for r, extra_data, sector in rows]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    total, total_is_estimate = _page_total(db, base_query, len(rows), cursor, has_more, include_total)
 
-    return NewsListResponse(items=items, total=total)
+    items = [_news_row_to_response(r, extra_data, sector, lang) for r, extra_data, sector in rows]
+    next_cursor = None
+    if has_more:
+        last = rows[-1][0]
+        next_cursor = encode_cursor(last.hot_topic_priority, last.published_at, last.id)
+
+    return NewsListResponse(
+        items=items, total=total, total_is_estimate=total_is_estimate, next_cursor=next_cursor,
+    )
 
 
 @router.get("/mention-bubble", response_model=TickerMentionBubbleResponse)
@@ -149,67 +220,57 @@ def get_mention_bubble(
     """
     최근 N시간 내 가장 많이 언급된 종목 버블 데이터.
 
-    - GROUP BY ticker, COUNT(*), AVG(sentiment_score)
-    - Ticker 메타데이터 JOIN (name_ko, sector)
+    - 시간별 집계(ticker_news_hourly)에서 종목당 최대 N개 버킷 합산 (시간 단위 정밀도)
+    - 섹터/한글명은 캐시된 Ticker 메타데이터 사용 (JOIN 없음)
     - sectors/tickers 필터 지원 (카테고리별 버블 연동)
     - 빈 데이터 시 빈 구조 반환 (404 아님)
     """
-    cutoff = datetime.utcnow() - timedelta(hours=hours)
+    start_bucket = hour_bucket(datetime.utcnow() - timedelta(hours=hours))
 
-    bubble_query = (
-        db.query(
-            TickerNews.ticker,
-            func.count().label('cnt'),
-            func.avg(TickerNews.sentiment_score).label('avg_score'),
-        )
-        .filter(TickerNews.published_at >= cutoff)
-        .filter(TickerNews.ticker != 'MARKET')
-    )
+    conditions = ["hour_bucket >= :start", "ticker != 'MARKET'"]
+    params = {"start": start_bucket, "limit": limit}
 
     # Ticker filter (watchlist)
+    ticker_list = None
     if tickers:
-        ticker_list = [t.strip().upper() for t in tickers.split(",") if t.strip()]
-        if ticker_list:
-            bubble_query = bubble_query.filter(TickerNews.ticker.in_(ticker_list))
+        ticker_list = [t.strip().upper() for t in tickers.split(",") if t.strip()] or None
 
-    # Sector filter (join Ticker table)
+    # Sector filter (cached metadata → ticker set)
     if sectors:
         sector_list = [s.strip() for s in sectors.split(",") if s.strip()]
         if sector_list:
-            bubble_query = (
-                bubble_query
-                .join(Ticker, TickerNews.ticker == Ticker.ticker)
-                .filter(Ticker.sector.in_(sector_list))
-            )
-
-    rows = (
-        bubble_query
-        .group_by(TickerNews.ticker)
-        .order_by(func.count().desc())
-        .limit(limit)
-        .all()
-    )
+            sector_tickers = set(ticker_metadata.tickers_in_sectors(db, sector_list))
+            ticker_list = [t for t in ticker_list if t in sector_tickers] if ticker_list else list(sector_tickers)
+            if not ticker_list:
+                return TickerMentionBubbleResponse(items=[], period_hours=hours)
+
+    if ticker_list is not None:
+        conditions.append("ticker = ANY(:tickers)")
+        params["tickers"] = ticker_list
+
+    rows = db.execute(text(f"""
+        SELECT ticker, SUM(mention_count) AS cnt, SUM(sentiment_sum) AS score_sum
+        FROM analytics.ticker_news_hourly
+        WHERE {" AND ".join(conditions)}
+        GROUP BY ticker
+        HAVING SUM(mention_count) > 0
+        ORDER BY cnt DESC
+        LIMIT :limit
+    """), params).fetchall()
 
     if not rows:
         return TickerMentionBubbleResponse(items=[], period_hours=hours)
 
-    # Ticker metadata JOIN (name_ko, sector)
-    tickers = [r.ticker for r in rows]
-    meta = {
-        t.ticker: t
-        for t in db.query(Ticker).filter(Ticker.ticker.in_(tickers)).all()
-    }
-
     items = []
     for r in rows:
-        t_meta = meta.get(r.ticker)
-        avg = float(r.avg_score) if r.avg_score is not None else 0.0
+        t_meta = ticker_metadata.get(db, r.ticker)
+        avg = float(r.score_sum) / r.cnt
         dominant = "bullish" if avg > 10 else ("bearish" if avg < -10 else "neutral")
         items.append(TickerMentionItem(
             ticker=r.ticker,
             mention_count=r.cnt,
-            name_ko=(t_meta.extra_data or {}).get('name_ko') if t_meta and t_meta.extra_data else None,
-            sector=t_meta.sector if t_meta else None,
+            name_ko=t_meta["name_ko"] if t_meta else None,
+            sector=t_meta["sector"] if t_meta else None,
             dominant_sentiment=dominant,
             avg_sentiment_score=round(avg, 1),
         ))
@@ -223,13 +284,17 @@ def get_news(
     from_date: date = Query(None, alias="from", description="Start date"),
     to_date: date = Query(None, alias="to", description="End date"),
     limit: int = Query(20, ge=1, le=100, description="Max items"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Exact total (COUNT); default is a planner estimate"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor (ignored when cursor is set)"),
+    lang: Optional[str] = Query(None, pattern=LANG_PATTERN, description="Project multilingual text to one language (ko/en/zh/ja/es, en fallback); default: packed"),
     db: Session = Depends(get_db),
 ):
     """
     종목별 뉴스 목록 조회.
 
-    - 정렬: published_at DESC
+    - 정렬: published_at DESC, id DESC
+    - 페이지네이션: cursor (keyset), total은 기본 추정치 (include_total=true 시 정확한 값)
     - Ticker JOIN으로 한글 회사명(name_ko) 포함
     - 빈 데이터 시 빈 구조 반환 (404 아님)
     """
@@ -242,45 +307,29 @@ def get_news(
     if to_date:
         base_query = base_query.filter(TickerNews.date <= to_date)
 
-    total = base_query.count()
-
     # Ticker JOIN for name_ko and sector
     ticker_meta = db.query(Ticker.extra_data, Ticker.sector).filter(Ticker.ticker == ticker).first()
-    name_ko = (ticker_meta[0] or {}).get('name_ko') if ticker_meta else None
     ticker_sector = ticker_meta[1] if ticker_meta else None
 
-    rows = (
-        base_query
-        .order_by(TickerNews.published_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    page_query = (
+        _after_cursor(base_query, cursor)
+        .order_by(TickerNews.published_at.desc(), TickerNews.id.desc())
     )
+    if offset and not cursor:
+        page_query = page_query.offset(offset)
+    rows = page_query.limit(limit + 1).all()
 
-    items = [
-        NewsItemResponse(
-            date=r.date,
-            ticker=r.ticker,
-            title=r.title,
-            source=r.source,
-            source_url=r.source_url,
-            published_at=r.published_at,
-            ai_summary=r.ai_summary,
-            sentiment_score=r.sentiment_score,
-            sentiment_grade=r.sentiment_grade,
-            sentiment_label=r.sentiment_label,
-            future_event=r.future_event,
-            is_breaking=r.is_breaking or False,
-            is_hot_topic=r.is_hot_topic or False,
-            hot_topic_category=r.hot_topic_category,
-            hot_topic_priority=r.hot_topic_priority,
-            ticker_name_ko=name_ko,
-            sector=ticker_sector,
-        )
-        for r in rows
-    ]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    total, total_is_estimate = _page_total(db, base_query, offset + len(rows), cursor, has_more, include_total)
 
-    return NewsListResponse(items=items, total=total)
+    extra_data = ticker_meta[0] if ticker_meta else None
+    items = [_news_row_to_response(r, extra_data, ticker_sector, lang) for r in rows]
+    next_cursor = encode_cursor(rows[-1].published_at, rows[-1].id) if has_more else None
+
+    return NewsListResponse(
+        items=items, total=total, total_is_estimate=total_is_estimate, next_cursor=next_cursor,
+    )
 
 
 @router.get("/summary", response_model=NewsSummaryResponse)
@@ -293,35 +342,37 @@ def get_news_summary(
     종목별 뉴스 감성 요약.
 
     - bullish / neutral / bearish 건수 + 평균 점수
+    - 일별 감성 카운터(ticker_news_daily) 1행 조회
     - 빈 데이터 시 빈 구조 반환 (404 아님)
     """
     ticker = ticker.upper()
 
     if target_date is None:
-        target_date = db.query(func.max(TickerNews.date)).filter(
-            TickerNews.ticker == ticker
+        target_date = db.query(func.max(TickerNewsDaily.date)).filter(
+            TickerNewsDaily.ticker == ticker
         ).scalar()
 
     if target_date is None:
         return NewsSummaryResponse(ticker=ticker)
 
-    rows = db.query(TickerNews).filter(
-        TickerNews.ticker == ticker,
-        TickerNews.date == target_date,
-    ).all()
+    row = db.query(TickerNewsDaily).filter(
+        TickerNewsDaily.ticker == ticker,
+        TickerNewsDaily.date == target_date,
+    ).first()
 
-    if not rows:
+    total = row.article_count if row else 0  # 등급 외(기타) 기사 포함 전체 건수
+    if total <= 0:
         return NewsSummaryResponse(ticker=ticker, date=target_date)
 
-    bullish = sum(1 for r in rows if r.sentiment_grade == "bullish")
-    neutral = sum(1 for r in rows if r.sentiment_grade == "neutral")
-    bearish = sum(1 for r in rows if r.sentiment_grade == "bearish")
-    avg_score = round(sum(r.sentiment_score for r in rows) / len(rows), 1)
+    bullish = row.bullish_count
+    neutral = row.neutral_count
+    bearish = row.bearish_count
+    avg_score = round(row.sentiment_sum / total, 1)
 
     return NewsSummaryResponse(
         ticker=ticker,
         date=target_date,
-        total_articles=len(rows),
+        total_articles=total,
         bullish=bullish,
         neutral=neutral,
         bearish=bearish,
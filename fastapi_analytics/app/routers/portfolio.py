@@ -27,6 +27,8 @@ from app.schemas import (
     ExchangeRateResponse,
     AnalysisStatusResponse,
 )
+from app.services.portfolio_pnl import portfolio_pnl
+from app.utils.multilang import LANG_PATTERN, localize
 
 # Time remaining templates for instant advice (multilingual |||‑packed)
 _INSTANT_ADVICE_TEMPLATES = {
@@ -251,6 +253,7 @@ def add_or_update_holding(
         db.add(obj)
 
     db.commit()
+    portfolio_pnl.invalidate(db, [user_id])
 
     # Fetch enriched data (price, score) via LATERAL JOIN
     enriched = db.execute(text("""
@@ -369,6 +372,8 @@ def delete_holding(
         UserPortfolio.type == 'HOLDING',
     ).delete()
     db.commit()
+    if deleted:
+        portfolio_pnl.invalidate(db, [user_id])
     return {"deleted": deleted}
 
 
@@ -542,6 +547,7 @@ def add_transaction(
             logger.warning(f"SELL realized_pnl skip: holding not found or avg_price is None "
                            f"(user={user_id}, ticker={body.ticker})")
 
+    portfolio_pnl.invalidate(db, [user_id])
     return txn
 
 
@@ -573,6 +579,8 @@ def delete_transaction(
         UserTransaction.user_id == user_id,
     ).delete()
     db.commit()
+    if deleted:
+        portfolio_pnl.invalidate(db, [user_id])
     return {"deleted": deleted}
 
 
@@ -611,13 +619,28 @@ def get_analysis_status(
 # Portfolio Advice (AI 의견 조회)
 # ============================================================
 
+def _localize_reasons(reasons: Optional[dict], lang: Optional[str]) -> Optional[dict]:
+    """reasons {"bullish": [...], "bearish": [...]} with each entry projected to lang (copy)."""
+    if not reasons or lang is None:
+        return reasons
+    localized = dict(reasons)
+    for side in ("bullish", "bearish"):
+        if isinstance(localized.get(side), list):
+            localized[side] = [
+                localize(reason, lang) if isinstance(reason, str) else reason
+                for reason in localized[side]
+            ]
+    return localized
+
+
 @router.get("/advice", response_model=List[PortfolioAdviceResponse])
 def get_advice(
     target_date: Optional[date] = Query(None, alias="date", description="조회일 (기본: 최신)"),
+    lang: Optional[str] = Query(None, pattern=LANG_PATTERN, description="다국어 텍스트 단일 언어 투영 (ko/en/zh/ja/es, en fallback; 기본: 패킹 원본)"),
     user_id: int = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """내 종목 AI 의견 조회"""
+    """내 종목 AI 의견 조회 (lang 지정 시 summary/target_action/reasons 해당 언어만)"""
     if target_date:
         rows = db.query(PortfolioAdvice).filter(
             PortfolioAdvice.user_id == user_id,
@@ -643,8 +666,8 @@ def get_advice(
 
     return [PortfolioAdviceResponse(
         ticker=r.ticker, date=r.date, signal=r.signal,
-        confidence=r.confidence, summary=r.summary,
-        reasons=r.reasons, target_action=r.target_action,
+        confidence=r.confidence, summary=localize(r.summary, lang),
+        reasons=_localize_reasons(r.reasons, lang), target_action=localize(r.target_action, lang),
     ) for r in rows]
 
 
@@ -665,86 +688,9 @@ def get_summary(
             PortfolioSummary.date == target_date,
         ).first()
     else:
-        # ── 실시간 계산 (target_date 없을 때) ──
-
-        # 1) 보유 종목 + 최신 가격 조회
-        holdings_rows = db.execute(text("""
-            SELECT p.ticker, p.shares, p.avg_price,
-                   tp.close AS current_price, tp.change_pct
-            FROM analytics.user_portfolios p
-            LEFT JOIN LATERAL (
-                SELECT close, change_pct FROM analytics.ticker_prices
-                WHERE ticker = p.ticker ORDER BY date DESC LIMIT 1
-            ) tp ON true
-            WHERE p.user_id = :uid AND p.type = 'HOLDING'
-              AND COALESCE(p.shares, 0) > 0
-        """), {"uid": user_id}).fetchall()
-
-        # 2) 실시간 P&L 계산
-        total_value = 0.0
-        total_cost = 0.0
-        day_pnl = 0.0
-        holdings_detail = []
-
-        for h in holdings_rows:
-            price = h.current_price or 0
-            shares = h.shares or 0
-            avg = h.avg_price or 0
-            cv = price * shares
-            cb = avg * shares
-
-            total_value += cv
-            total_cost += cb
-
-            if h.change_pct and price:
-                prev = price / (1 + h.change_pct / 100)
-                day_pnl += (price - prev) * shares
-
-            holdings_detail.append({
-                "ticker": h.ticker, "shares": shares,
-                "avg_price": avg, "current_price": price,
-                "pnl": round(cv - cb, 2),
-                "pnl_pct": round((cv - cb) / cb * 100, 2) if cb > 0 else 0,
-            })
-
-        total_pnl = total_value - total_cost
-        total_pnl_pct = (total_pnl / total_cost * 100) if total_cost > 0 else 0
-        day_pnl_pct = (day_pnl / (total_value - day_pnl) * 100) if (total_value - day_pnl) > 0 else 0
-
-        # 3) 누적 실현손익 — user_transactions가 원본 (더 신뢰)
-        realized_sum = db.execute(text(
-            "SELECT COALESCE(SUM(realized_pnl), 0) "
-            "FROM analytics.user_transactions "
-            "WHERE user_id = :uid AND type = 'SELL' AND realized_pnl IS NOT NULL"
-        ), {"uid": user_id}).scalar() or 0
-
-        # 4) AI 데이터 보충 (맥미니가 넣은 최신 레코드)
-        ai_row = db.query(PortfolioSummary).filter(
-            PortfolioSummary.user_id == user_id,
-            PortfolioSummary.ai_summary.isnot(None),
-            PortfolioSummary.ai_summary != '',
-        ).order_by(PortfolioSummary.date.desc()).first()
-
-        latest_row = db.query(PortfolioSummary).filter(
-            PortfolioSummary.user_id == user_id,
-        ).order_by(PortfolioSummary.date.desc()).first()
-
-        # 5) 응답 조립
-        return PortfolioSummaryResponse(
-            date=date.today(),
-            total_value=round(total_value, 2),
-            total_cost=round(total_cost, 2),
-            total_pnl=round(total_pnl, 2),
-            total_pnl_pct=round(total_pnl_pct, 2),
-            day_pnl=round(day_pnl, 2),
-            day_pnl_pct=round(day_pnl_pct, 2),
-            holdings_detail=holdings_detail or None,
-            realized_pnl=round(realized_sum, 2),
-            ai_summary=ai_row.ai_summary if ai_row else None,
-            ai_recommendations=ai_row.ai_recommendations if ai_row else None,
-            periods=latest_row.periods if latest_row else None,
-            trade_history=latest_row.trade_history if latest_row else None,
-        )
+        # ── 실시간 P&L (target_date 없을 때) ──
+        # 사용자별 캐시: 보유/거래 변경 시 무효화, 가격 수집 시 보유자만 재평가
+        return PortfolioSummaryResponse(date=date.today(), **portfolio_pnl.summary(db, user_id))
 
     if not row:
         # Return empty summary (never 404)
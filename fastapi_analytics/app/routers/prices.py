@@ -1,11 +1,15 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from datetime import date, timedelta
-from typing import List
+from typing import List, Optional
 from app.database import get_db
-from app.models import TickerPrice
+from app.models import TickerPrice, TickerDailyWide
 from app.schemas import TickerPriceListResponse, ClosePriceResponse
+from app.utils.columnar import FORMAT_PATTERN, to_columnar
+from app.utils.downsampling import ohlc_buckets
+from app.services.daily_wide import wide_range_complete
+from app.services.watermarks import watermarks
 
 router = APIRouter()
 
@@ -15,6 +19,8 @@ def get_ticker_prices(
     ticker: str,
     from_date: date = Query(None, alias="from", description="Start date (default: 30 days ago)"),
     to_date: date = Query(None, alias="to", description="End date (default: today)"),
+    format: str = Query("rows", pattern=FORMAT_PATTERN, description="rows (default) | columnar: {date: [...], ...} arrays"),
+    max_points: Optional[int] = Query(None, ge=3, le=1000, description="Merge into at most N OHLC candles (default: all rows)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -28,8 +34,12 @@ def get_ticker_prices(
     Example:
     ```
     GET /api/v1/prices/AAPL?from=2026-01-01&to=2026-02-06
+    GET /api/v1/prices/AAPL?from=2023-01-01&max_points=200
     ```
 
+    `max_points`: consecutive days are merged into candles (open=first,
+    high=max, low=min, close=last, volume=sum, date=last day of the bucket).
+
     Response:
     ```json
     {
@@ -50,7 +60,7 @@ def get_ticker_prices(
     # Default date range: last 30 days
     if to_date is None:
         # Use latest available date instead of today (fallback for missing data)
-        latest_date = db.query(func.max(TickerPrice.date)).scalar()
+        latest_date = watermarks.latest("prices")
         if latest_date is None:
             raise HTTPException(404, "No price data available in database")
         to_date = latest_date
@@ -62,12 +72,21 @@ def get_ticker_prices(
     if from_date > to_date:
         raise HTTPException(400, "from_date must be before to_date")
 
-    # Query prices
-    prices = db.query(TickerPrice).filter(
-        TickerPrice.ticker == ticker.upper(),
-        TickerPrice.date >= from_date,
-        TickerPrice.date <= to_date
-    ).order_by(TickerPrice.date.asc()).all()
+    # Query prices (denormalized ticker_daily_wide: one (ticker, date) range scan)
+    prices = db.query(TickerDailyWide).filter(
+        TickerDailyWide.ticker == ticker.upper(),
+        TickerDailyWide.date >= from_date,
+        TickerDailyWide.date <= to_date,
+        TickerDailyWide.has_price.is_(True),
+    ).order_by(TickerDailyWide.date.asc()).all()
+
+    if not wide_range_complete(db, ticker.upper(), from_date, prices[0].date if prices else None):
+        # Fallback: range not (fully) backfilled into ticker_daily_wide yet
+        prices = db.query(TickerPrice).filter(
+            TickerPrice.ticker == ticker.upper(),
+            TickerPrice.date >= from_date,
+            TickerPrice.date <= to_date
+        ).order_by(TickerPrice.date.asc()).all()
 
     if not prices:
         raise HTTPException(
@@ -75,6 +94,17 @@ def get_ticker_prices(
             f"No price data found for ticker '{ticker}' in date range {from_date} to {to_date}"
         )
 
+    if format == "columnar" or max_points is not None:
+        rows = [{f: getattr(r, f) for f in ("date", "open", "high", "low", "close", "volume")} for r in prices]
+        if max_points is not None:
+            rows = ohlc_buckets(rows, max_points)
+        if format != "columnar":
+            return {"ticker": ticker.upper(), "prices": rows}
+        return ORJSONResponse({
+            "ticker": ticker.upper(),
+            "prices": to_columnar(rows),
+        })
+
     return {
         "ticker": ticker.upper(),
         "prices": prices
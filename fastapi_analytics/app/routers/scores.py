@@ -1,45 +1,34 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_
+from sqlalchemy import func, and_
 from datetime import date, timedelta
 from typing import List, Optional
 from app.database import get_db
 from app.models import TickerScore, Ticker, StockMembership, TickerPrice
-from app.schemas import TickerScoreListResponse, TopTickerResponse
+from app.schemas import TickerScoreListResponse, TopTickerResponse, BatchScoresRequest, BatchScoresResponse
 from app.utils.trading_calendar import get_latest_trading_date
+from app.utils.columnar import FORMAT_PATTERN, to_columnar
+from app.utils.downsampling import lttb_indices
+from app.utils.signals import translate_signal
+from app.services.data_versions import scores_date_key
+from app.services.http_cache import cache_validators, is_not_modified, not_modified
+from app.services.latest_scores import latest_scores
+from app.services.leaderboards import leaderboards
 
 router = APIRouter()
 
 
-# Signal translation mapping (Korean → English)
-SIGNAL_MAPPING = {
-    "🔥강력매수": "BUY",
-    "매수권고": "BUY",
-    "보유": "HOLD",
-    "중립": "HOLD",
-    "매도권고": "SELL",
-    "🔥강력매도": "SELL",
-}
-
-
-def translate_signal(korean_signal: str | None) -> str | None:
-    """
-    Translate Korean signals to English codes for API response.
-
-    Internal logic codes (stable):
-    - "BUY": Strong buy signal
-    - "SELL": Strong sell signal
-    - "HOLD": Neutral or hold signal
-
-    Args:
-        korean_signal: Korean signal from Mac mini DB (e.g., "🔥강력매수")
-
-    Returns:
-        English code: "BUY", "SELL", "HOLD", or None
-    """
-    if korean_signal is None:
-        return None
-    return SIGNAL_MAPPING.get(korean_signal, "HOLD")
+def _insight_entry(entry: dict) -> dict:
+    """Leaderboard entry without price fields (/insights response shape)."""
+    return {
+        "ticker": entry["ticker"],
+        "score": entry["score"],
+        "signal": entry["signal"],
+        "name": entry["name"],
+        "name_ko": entry["name_ko"],
+        "membership": entry["membership"],
+    }
 
 
 @router.get("/top", response_model=List[TopTickerResponse])
@@ -68,64 +57,12 @@ def get_top_scores(
         latest_date = get_latest_trading_date(db)
         if latest_date is None:
             # DB 전체가 비어있으면 빈 배열 반환 (404 금지)
-            return []
+            return ORJSONResponse([])
         target_date = latest_date
 
-    # Join with ticker metadata for names + price data
-    query = db.query(
-        TickerScore.ticker,
-        TickerScore.score,
-        TickerScore.signal,
-        Ticker.name,
-        Ticker.extra_data,  # JSONB metadata (contains name_ko)
-        TickerPrice.close,
-        TickerPrice.change_pct,
-    ).outerjoin(
-        Ticker,
-        TickerScore.ticker == Ticker.ticker
-    ).outerjoin(
-        TickerPrice,
-        (TickerScore.ticker == TickerPrice.ticker) & (TickerScore.date == TickerPrice.date)
-    ).filter(
-        TickerScore.date == target_date
-    )
-
-    # Optional index filter
-    if index:
-        query = query.join(
-            StockMembership,
-            (TickerScore.ticker == StockMembership.ticker) &
-            (StockMembership.index_code == index)
-        )
-
-    results = query.order_by(
-        desc(TickerScore.score)
-    ).limit(limit).all()
-
-    # Batch-fetch memberships for all result tickers
-    result_tickers = [r.ticker for r in results]
-    memberships_rows = db.query(
-        StockMembership.ticker, StockMembership.index_code
-    ).filter(StockMembership.ticker.in_(result_tickers)).all() if result_tickers else []
-
-    membership_map: dict[str, list[str]] = {}
-    for m in memberships_rows:
-        membership_map.setdefault(m.ticker, []).append(m.index_code)
-
     # 결과 없어도 빈 배열 반환 (404 금지)
-    return [
-        {
-            "ticker": r.ticker,
-            "score": r.score,
-            "signal": translate_signal(r.signal),  # Korean → English translation
-            "name": r.name,
-            "name_ko": r.extra_data.get("name_ko") if r.extra_data else None,
-            "membership": membership_map.get(r.ticker),
-            "close": r.close,
-            "change_pct": r.change_pct,
-        }
-        for r in results
-    ]
+    # Prebuilt leaderboard slice; entries already match TopTickerResponse → orjson directly
+    return ORJSONResponse(leaderboards.get(db, target_date).top(limit, index))
 
 
 @router.get("/batch", response_model=List[TopTickerResponse])
@@ -226,8 +163,43 @@ def get_batch_scores(
     ]
 
 
+@router.post("/batch", response_model=BatchScoresResponse)
+def post_batch_scores(
+    payload: BatchScoresRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Batch scores for large watchlists (up to 1000 tickers in a JSON body).
+
+    **워치리스트용** ⭐
+    - GET /batch와 같은 항목 형식, URL 길이 제한 없음
+    - 날짜 미지정 시 종목별 최신 점수 (메모리 맵 O(1) 조회)
+    - 점수 데이터가 없는 종목은 missing으로 명시
+
+    Example:
+    ```
+    POST /api/v1/scores/batch
+    {"tickers": ["AAPL", "TSLA", "MSFT"]}
+    ```
+    """
+    # 중복 제거 (요청 순서 유지)
+    ticker_list = list(dict.fromkeys(t.strip().upper() for t in payload.tickers if t.strip()))
+
+    if payload.date is not None:
+        # 명시적 날짜 → 해당 날짜 리더보드의 종목 맵
+        by_ticker = leaderboards.get(db, payload.date).by_ticker
+        items = [by_ticker[t] for t in ticker_list if t in by_ticker]
+        missing = [t for t in ticker_list if t not in by_ticker]
+    else:
+        items, missing = latest_scores.lookup(db, ticker_list)
+
+    return ORJSONResponse({"items": items, "missing": missing})
+
+
 @router.get("/insights")
 def get_market_insights(
+    request: Request,
+    response: Response,
     target_date: date = Query(None, alias="date", description="Date (default: today)"),
     top: int = Query(5, ge=1, le=500, description="Number of top movers (max 500)"),
     bottom: int = Query(5, ge=1, le=500, description="Number of bottom movers (max 500)"),
@@ -242,6 +214,14 @@ def get_market_insights(
     - 약세 종목 (점수 낮은 순)
     - index 파라미터로 지수별 필터링 가능
     """
+    validators = cache_validators(
+        "insights", [scores_date_key(target_date) if target_date else "scores"],
+        target_date, top, bottom, index,
+    )
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    response.headers.update(validators)
+
     if target_date is None:
         # Use latest trading day instead of raw MAX(date) to skip weekends/holidays
         latest_date = get_latest_trading_date(db)
@@ -250,63 +230,14 @@ def get_market_insights(
             return {"date": None, "top_movers": [], "bottom_movers": []}
         target_date = latest_date
 
-    # Base query builder
-    def _build_base_query():
-        q = db.query(
-            TickerScore.ticker,
-            TickerScore.score,
-            TickerScore.signal,
-            Ticker.name,
-            Ticker.extra_data  # JSONB metadata (contains name_ko)
-        ).outerjoin(
-            Ticker,
-            TickerScore.ticker == Ticker.ticker
-        ).filter(
-            TickerScore.date == target_date
-        )
-        if index:
-            q = q.join(
-                StockMembership,
-                (TickerScore.ticker == StockMembership.ticker) &
-                (StockMembership.index_code == index)
-            )
-        return q
-
-    # Query top movers (highest scores)
-    top_results = _build_base_query().order_by(
-        desc(TickerScore.score)
-    ).limit(top).all()
-
-    # Query bottom movers (lowest scores)
-    bottom_results = _build_base_query().order_by(
-        TickerScore.score.asc()
-    ).limit(bottom).all()
-
-    # Batch-fetch memberships
-    all_tickers = list({r.ticker for r in top_results} | {r.ticker for r in bottom_results})
-    memberships_rows = db.query(
-        StockMembership.ticker, StockMembership.index_code
-    ).filter(StockMembership.ticker.in_(all_tickers)).all() if all_tickers else []
-
-    membership_map: dict[str, list[str]] = {}
-    for m in memberships_rows:
-        membership_map.setdefault(m.ticker, []).append(m.index_code)
-
-    def _format_result(r):
-        return {
-            "ticker": r.ticker,
-            "score": r.score,
-            "signal": translate_signal(r.signal),
-            "name": r.name,
-            "name_ko": r.extra_data.get("name_ko") if r.extra_data else None,
-            "membership": membership_map.get(r.ticker),
-        }
+    # Prebuilt leaderboard slices (score DESC / ASC)
+    boards = leaderboards.get(db, target_date)
 
     # 결과 없어도 빈 배열 반환 (404 금지)
     return {
         "date": str(target_date),
-        "top_movers": [_format_result(r) for r in top_results],
-        "bottom_movers": [_format_result(r) for r in bottom_results],
+        "top_movers": [_insight_entry(e) for e in boards.top(top, index)],
+        "bottom_movers": [_insight_entry(e) for e in boards.bottom(bottom, index)],
     }
 
 
@@ -315,6 +246,8 @@ def get_ticker_scores(
     ticker: str,
     from_date: date = Query(None, alias="from", description="Start date (default: 30 days ago)"),
     to_date: date = Query(None, alias="to", description="End date (default: today)"),
+    format: str = Query("rows", pattern=FORMAT_PATTERN, description="rows (default) | columnar: {date: [...], ...} arrays"),
+    max_points: Optional[int] = Query(None, ge=3, le=1000, description="LTTB-downsample the score line to N points (default: all)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -328,6 +261,7 @@ def get_ticker_scores(
     Example:
     ```
     GET /api/v1/scores/AAPL?from=2026-01-01&to=2026-02-02
+    GET /api/v1/scores/AAPL?from=2023-01-01&max_points=200
     ```
 
     Response:
@@ -364,6 +298,18 @@ def get_ticker_scores(
             f"No scores found for ticker '{ticker}' in date range {from_date} to {to_date}"
         )
 
+    # Long ranges: keep the points that preserve the line's shape (peaks/troughs)
+    if max_points is not None:
+        keep = lttb_indices([s.date.toordinal() for s in scores], [s.score for s in scores], max_points)
+        scores = [scores[i] for i in keep]
+
+    if format == "columnar":
+        rows = [{f: getattr(r, f) for f in ("date", "score", "signal")} for r in scores]
+        return ORJSONResponse({
+            "ticker": ticker.upper(),
+            "scores": to_columnar(rows),
+        })
+
     return {
         "ticker": ticker.upper(),
         "scores": scores
@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, distinct
 from typing import List
 from app.database import get_db
-from app.models import Ticker, TickerScore
+from app.models import Ticker
 from app.schemas import TickerMetadata
+from app.services.search_index import search_index
 
 router = APIRouter()
 
@@ -22,6 +23,9 @@ def search_tickers(
     - 심볼 또는 이름으로 검색
     - **실제 분석 대상 종목 기준** (TickerScore 테이블)
     - 메타데이터는 Ticker 테이블과 LEFT JOIN
+    - 한글명/초성 검색 지원 (예: "애플", "ㅅㅅㅈㅈ")
+    - 정렬: 심볼 일치 > 심볼 접두어 > 이름 접두어 > 부분 일치, 같은 순위는 인기순
+    - 메모리 검색 인덱스 사용 (DB 조회 없음)
 
     Example:
     ```
@@ -39,37 +43,9 @@ def search_tickers(
     ]
     ```
     """
-    # Search from actual analyzed tickers (TickerScore) with metadata (Ticker)
-    # LEFT JOIN으로 TickerScore에 있는 모든 ticker를 검색하되
-    # Ticker 테이블에 메타데이터가 있으면 함께 반환
-    results = db.query(
-        TickerScore.ticker,
-        Ticker.name,
-        Ticker.category,
-        Ticker.extra_data  # JSONB metadata (contains name_ko)
-    ).outerjoin(
-        Ticker,
-        TickerScore.ticker == Ticker.ticker
-    ).filter(
-        or_(
-            TickerScore.ticker.ilike(f"%{q}%"),
-            Ticker.name.ilike(f"%{q}%"),
-            Ticker.extra_data['name_ko'].astext.ilike(f"%{q}%")  # Korean name search
-        )
-    ).distinct(
-        TickerScore.ticker
-    ).limit(limit).all()
-
     # 검색 결과 0개도 정상 응답 (200 OK + 빈 배열)
-    return [
-        {
-            "ticker": r.ticker,
-            "name": r.name,
-            "name_ko": r.extra_data.get("name_ko") if r.extra_data else None,
-            "category": r.category
-        }
-        for r in results
-    ]
+    # Records already match TickerMetadata → orjson directly
+    return ORJSONResponse(search_index.search(db, q, limit))
 
 
 @router.get("/{ticker}", response_model=TickerMetadata)
@@ -38,6 +38,18 @@ class TopTickerResponse(BaseModel):
         from_attributes = True
 
 
+class BatchScoresRequest(BaseModel):
+    """Watchlist batch lookup (POST /scores/batch)"""
+    tickers: List[str] = Field(..., min_length=1, max_length=1000, description="Ticker symbols (max 1000)")
+    date: Optional[Date] = Field(None, description="Date (default: latest per ticker)")
+
+
+class BatchScoresResponse(BaseModel):
+    """Batch lookup result with explicit misses"""
+    items: List[TopTickerResponse] = Field(..., description="Resolved tickers (request order)")
+    missing: List[str] = Field(..., description="Requested tickers without score data")
+
+
 # ============================================================
 # Ticker Metadata Schemas (⭐ 검색/메타)
 # ============================================================
@@ -295,6 +307,10 @@ class MacroIndicatorResponse(BaseModel):
     high_3m: Optional[float] = None
     avg_3m: Optional[float] = None
     low_3m: Optional[float] = None
+    high_1y: Optional[float] = None
+    avg_1y: Optional[float] = None
+    low_1y: Optional[float] = None
+    percentile_1y: Optional[float] = None
 
 
 class MacroIndicatorsResponse(BaseModel):
@@ -321,6 +337,10 @@ class MacroSignalResponse(BaseModel):
     high_3m: Optional[float] = None
     avg_3m: Optional[float] = None
     low_3m: Optional[float] = None
+    high_1y: Optional[float] = None
+    avg_1y: Optional[float] = None
+    low_1y: Optional[float] = None
+    percentile_1y: Optional[float] = None
 
 
 class MacroSignalsResponse(BaseModel):
@@ -556,6 +576,25 @@ class CompleteChartResponse(BaseModel):
     classification: Optional[ClassificationResponse] = Field(None, description="Stock classification (Peter Lynch 6-category)")
 
 
+class ChartStaticSections(BaseModel):
+    """
+    Slow-changing snapshot sections of CompleteChartResponse.
+
+    Pre-rendered per ticker at ingest time (analytics.ticker_static_sections)
+    and spliced into the chart response as-is.
+    """
+    profile: Optional[CompanyProfileResponse] = None
+    key_metrics: Optional[KeyMetricsResponse] = None
+    financials: Optional[FinancialsResponse] = None
+    dividends: Optional[List[DividendEntry]] = None
+    calendar: Optional[CalendarResponse] = None
+    earnings_history: Optional[List[EarningsHistoryItem]] = None
+    defense_lines: Optional[List[DefenseLineResponse]] = None
+    recommendations: Optional[RecommendationsResponse] = None
+    institutional_holders: Optional[List[InstitutionalHolderResponse]] = None
+    classification: Optional[ClassificationResponse] = None
+
+
 # ============================================================
 # Internal Ingest Schemas (Mac mini → FastAPI)
 # ============================================================
@@ -967,6 +1006,8 @@ class NewsListResponse(BaseModel):
     """News list API response"""
     items: List[NewsItemResponse] = Field(default_factory=list)
     total: int = 0
+    total_is_estimate: bool = False  # planner estimate unless include_total=true
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page (None = last page)
 
 
 class NewsSummaryResponse(BaseModel):
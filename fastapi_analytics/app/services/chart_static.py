@@ -0,0 +1,295 @@
+"""
+Pre-rendered static sections of the chart response.
+
+About half of CompleteChartResponse is slow-changing snapshot data that
+needs 12 lookups per ticker. Scores ingest rebuilds it per ticker and stores
+the serialized JSON object in analytics.ticker_static_sections; the charts
+endpoint splices that blob into the response and only queries the
+date-ranged series live.
+
+calendar.earnings_days_remaining is relative to today; for a blob built on
+an earlier day it is recomputed from next_earnings_date when the blob is
+read (the stored blob itself is left unchanged — reads never write).
+"""
+import json
+import logging
+from datetime import date
+from typing import Iterable
+
+import orjson
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.models import (
+    CompanyProfile, TickerKeyMetrics, TickerFinancials, TickerDividend,
+    TickerCalendar, TickerEarningsHistory,
+    TickerDefenseLine, TickerRecommendation, TickerInstitutionalHolder,
+    StockClassification,
+)
+from app.schemas import (
+    ChartStaticSections,
+    CompanyProfileResponse, KeyMetricsResponse, FinancialsResponse, DividendEntry,
+    CalendarResponse, EarningsHistoryItem,
+    DefenseLineResponse, RecommendationsResponse, InstitutionalHolderResponse,
+    ClassificationResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+STATIC_SECTIONS = set(ChartStaticSections.model_fields)
+
+
+def compute_urgency(d_day: int | None) -> str | None:
+    """Compute urgency level from D-Day value."""
+    if d_day is None:
+        return None
+    if d_day <= 0:
+        return "imminent"   # D-Day or past
+    if d_day <= 3:
+        return "urgent"     # 1~3 days
+    if d_day <= 7:
+        return "soon"       # 4~7 days
+    if d_day <= 14:
+        return "upcoming"   # 8~14 days
+    return "scheduled"      # 15+ days
+
+
+def build_static_sections(db: Session, ticker: str) -> ChartStaticSections:
+    """Run the 12 snapshot queries for one ticker and assemble the sections."""
+    # 1) Company Profile (ticker PK, non-time-series)
+    profile_obj = db.query(CompanyProfile).filter(
+        CompanyProfile.ticker == ticker
+    ).first()
+
+    # 2) Latest Key Metrics (most recent date)
+    metrics_obj = db.query(TickerKeyMetrics).filter(
+        TickerKeyMetrics.ticker == ticker
+    ).order_by(TickerKeyMetrics.date.desc()).first()
+
+    # 3) Financials (ticker PK, non-time-series)
+    financials_obj = db.query(TickerFinancials).filter(
+        TickerFinancials.ticker == ticker
+    ).first()
+
+    # 4) Recent Dividends (last 8 entries)
+    dividend_objs = db.query(TickerDividend).filter(
+        TickerDividend.ticker == ticker
+    ).order_by(TickerDividend.ex_date.desc()).limit(8).all()
+
+    # 5) Latest calendar (most recent upload)
+    calendar_obj = db.query(TickerCalendar).filter(
+        TickerCalendar.ticker == ticker
+    ).order_by(TickerCalendar.date.desc()).first()
+
+    # 6) Earnings history (last 8 quarters)
+    earnings_objs = db.query(TickerEarningsHistory).filter(
+        TickerEarningsHistory.ticker == ticker
+    ).order_by(TickerEarningsHistory.earnings_date.desc()).limit(8).all()
+
+    # 7) Latest defense lines (most recent upload)
+    latest_dl_date = db.query(func.max(TickerDefenseLine.date)).filter(
+        TickerDefenseLine.ticker == ticker
+    ).scalar()
+    defense_line_objs = []
+    if latest_dl_date:
+        defense_line_objs = db.query(TickerDefenseLine).filter(
+            TickerDefenseLine.ticker == ticker,
+            TickerDefenseLine.date == latest_dl_date,
+        ).order_by(TickerDefenseLine.period.asc()).all()
+
+    # 8) Latest recommendations (most recent upload)
+    recommendation_obj = db.query(TickerRecommendation).filter(
+        TickerRecommendation.ticker == ticker
+    ).order_by(TickerRecommendation.date.desc()).first()
+
+    # 9) Latest institutional holders (most recent upload)
+    latest_ih_date = db.query(func.max(TickerInstitutionalHolder.date)).filter(
+        TickerInstitutionalHolder.ticker == ticker
+    ).scalar()
+    institutional_holder_objs = []
+    if latest_ih_date:
+        institutional_holder_objs = db.query(TickerInstitutionalHolder).filter(
+            TickerInstitutionalHolder.ticker == ticker,
+            TickerInstitutionalHolder.date == latest_ih_date,
+        ).order_by(TickerInstitutionalHolder.pct_held.desc()).limit(20).all()
+
+    # 10) Latest classification (Peter Lynch)
+    classification_obj = db.query(StockClassification).filter(
+        StockClassification.ticker == ticker
+    ).order_by(StockClassification.date.desc()).first()
+
+    return ChartStaticSections(
+        profile=CompanyProfileResponse(
+            long_name=profile_obj.long_name,
+            industry=profile_obj.industry,
+            website=profile_obj.website,
+            country=profile_obj.country,
+            employees=profile_obj.employees,
+            summary=profile_obj.summary,
+        ) if profile_obj else None,
+        key_metrics=KeyMetricsResponse(
+            market_cap=metrics_obj.market_cap,
+            pe=metrics_obj.pe,
+            forward_pe=metrics_obj.forward_pe,
+            peg=metrics_obj.peg,
+            pb=metrics_obj.pb,
+            ps=metrics_obj.ps,
+            ev_revenue=metrics_obj.ev_revenue,
+            ev_ebitda=metrics_obj.ev_ebitda,
+            profit_margin=metrics_obj.profit_margin,
+            operating_margin=metrics_obj.operating_margin,
+            gross_margin=metrics_obj.gross_margin,
+            roe=metrics_obj.roe,
+            roa=metrics_obj.roa,
+            debt_to_equity=metrics_obj.debt_to_equity,
+            current_ratio=metrics_obj.current_ratio,
+            beta=metrics_obj.beta,
+            dividend_yield=metrics_obj.dividend_yield,
+            payout_ratio=metrics_obj.payout_ratio,
+            earnings_growth=metrics_obj.earnings_growth,
+            revenue_growth=metrics_obj.revenue_growth,
+        ) if metrics_obj else None,
+        financials=FinancialsResponse(
+            latest_quarter=financials_obj.latest_quarter,
+            income=financials_obj.income,
+            balance_sheet=financials_obj.balance_sheet,
+            cash_flow=financials_obj.cash_flow,
+        ) if financials_obj else None,
+        dividends=[
+            DividendEntry(ex_date=str(d.ex_date), amount=d.amount)
+            for d in dividend_objs
+        ] or None,
+        calendar=CalendarResponse(
+            next_earnings_date=str(calendar_obj.next_earnings_date) if calendar_obj.next_earnings_date else None,
+            next_earnings_date_end=str(calendar_obj.next_earnings_date_end) if calendar_obj.next_earnings_date_end else None,
+            earnings_confirmed=calendar_obj.earnings_confirmed,
+            d_day=calendar_obj.d_day,
+            urgency=compute_urgency(calendar_obj.d_day),
+            earnings_days_remaining=(calendar_obj.next_earnings_date - date.today()).days if calendar_obj.next_earnings_date else None,
+            ex_dividend_date=str(calendar_obj.ex_dividend_date) if calendar_obj.ex_dividend_date else None,
+            dividend_date=str(calendar_obj.dividend_date) if calendar_obj.dividend_date else None,
+            earnings_estimate={
+                "high": calendar_obj.earnings_high,
+                "low": calendar_obj.earnings_low,
+                "avg": calendar_obj.earnings_avg,
+            } if calendar_obj.earnings_avg else None,
+            revenue_estimate={
+                "high": calendar_obj.revenue_high,
+                "low": calendar_obj.revenue_low,
+                "avg": calendar_obj.revenue_avg,
+            } if calendar_obj.revenue_avg else None,
+        ) if calendar_obj else None,
+        earnings_history=[
+            EarningsHistoryItem(
+                date=str(e.earnings_date),
+                eps_estimate=e.eps_estimate,
+                reported_eps=e.reported_eps,
+                surprise_pct=e.surprise_pct,
+            ) for e in reversed(earnings_objs)
+        ] or None,
+        defense_lines=[
+            DefenseLineResponse(
+                period=dl.period,
+                price=dl.price,
+                label=dl.label,
+                distance_pct=dl.distance_pct,
+            ) for dl in defense_line_objs
+        ] or None,
+        recommendations=RecommendationsResponse(
+            strong_buy=recommendation_obj.strong_buy,
+            buy=recommendation_obj.buy,
+            hold=recommendation_obj.hold,
+            sell=recommendation_obj.sell,
+            strong_sell=recommendation_obj.strong_sell,
+            consensus_score=recommendation_obj.consensus_score,
+        ) if recommendation_obj else None,
+        institutional_holders=[
+            InstitutionalHolderResponse(
+                holder=ih.holder,
+                pct_held=ih.pct_held,
+                pct_change=ih.pct_change,
+            ) for ih in institutional_holder_objs
+        ] or None,
+        classification=ClassificationResponse(
+            category=classification_obj.category,
+            category_ko=classification_obj.category_ko,
+            category_en=classification_obj.category_en,
+            confidence=classification_obj.confidence,
+            reason_ko=classification_obj.reason_ko,
+            reason_en=classification_obj.reason_en,
+            metrics=json.loads(classification_obj.metrics_json) if classification_obj.metrics_json else None,
+        ) if classification_obj else None,
+    )
+
+
+def _store(db: Session, ticker: str, body: str) -> None:
+    db.execute(text("""
+        INSERT INTO analytics.ticker_static_sections (ticker, body, built_on, updated_at)
+        VALUES (:ticker, :body, CURRENT_DATE, NOW())
+        ON CONFLICT (ticker) DO UPDATE SET
+            body = EXCLUDED.body,
+            built_on = EXCLUDED.built_on,
+            updated_at = NOW()
+    """), {"ticker": ticker, "body": body})
+
+
+def rebuild_static_sections(db: Session, tickers: Iterable[str]) -> int:
+    """
+    Rebuild and store the static sections for the given tickers (ingest path).
+
+    Commits once at the end. Returns the number of tickers rebuilt.
+    """
+    count = 0
+    for ticker in sorted({t.upper() for t in tickers}):
+        _store(db, ticker, build_static_sections(db, ticker).model_dump_json())
+        count += 1
+    db.commit()
+    return count
+
+
+def _with_days_remaining(static_body: bytes) -> bytes:
+    """Recompute calendar.earnings_days_remaining against today."""
+    sections = orjson.loads(static_body)
+    calendar = sections.get("calendar")
+    if not calendar or not calendar.get("next_earnings_date"):
+        return static_body
+    next_earnings = date.fromisoformat(calendar["next_earnings_date"])
+    calendar["earnings_days_remaining"] = (next_earnings - date.today()).days
+    return orjson.dumps(sections)
+
+
+def get_static_sections(db: Session, ticker: str) -> bytes:
+    """
+    Serialized static sections for a ticker (JSON object bytes).
+
+    Builds and stores the blob only when it is missing (ticker never ingested
+    since the table was added); a blob built on an earlier day is served as
+    stored with earnings_days_remaining recomputed.
+    """
+    row = db.execute(text("""
+        SELECT body, built_on FROM analytics.ticker_static_sections
+        WHERE ticker = :ticker
+    """), {"ticker": ticker}).first()
+    if row is not None:
+        body = row.body.encode("utf-8")
+        return body if row.built_on == date.today() else _with_days_remaining(body)
+
+    body = build_static_sections(db, ticker).model_dump_json()
+    try:
+        _store(db, ticker, body)
+        db.commit()
+    except Exception as e:
+        logger.warning(f"Static sections store failed for {ticker}: {e}")
+        db.rollback()
+    return body.encode("utf-8")
+
+
+def select_static_sections(static_body: bytes, sections: Iterable[str]) -> bytes:
+    """Subset of a serialized static sections object (sparse include=)."""
+    wanted = set(sections)
+    return orjson.dumps({k: v for k, v in orjson.loads(static_body).items() if k in wanted})
+
+
+def splice_static_sections(dynamic_body: bytes, static_body: bytes) -> bytes:
+    """Merge two serialized JSON objects: {...dynamic, ...static}."""
+    return dynamic_body[:-1] + b"," + static_body[1:]
@@ -0,0 +1,116 @@
+"""
+Current (latest-date) snapshots of per-ticker history tables.
+
+ticker_calendar and stock_classifications keep one row per (ticker, date)
+for years, but read paths only want each ticker's latest row. ingest_scores
+copies the latest row of every ticker it touched into
+
+- analytics.ticker_calendar_current         (ticker PK, idx next_earnings_date)
+- analytics.stock_classifications_current   (ticker PK, idx category, confidence)
+
+and keeps analytics.classification_counts (category → tickers currently in
+it) in step by applying the old → new category moves as counter deltas,
+in the same transaction as the ingested rows.
+
+Concurrent ingests touching the same ticker must not both count its move:
+first-time tickers are claimed with INSERT ... DO NOTHING (only the
+inserting transaction counts +1), and the old categories of existing rows
+are read with SELECT ... FOR UPDATE, so each move is counted by exactly
+one transaction.
+"""
+from collections import Counter
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+_CALENDAR_COLUMNS = [
+    "next_earnings_date", "next_earnings_date_end", "earnings_confirmed", "d_day",
+    "ex_dividend_date", "dividend_date",
+    "earnings_high", "earnings_low", "earnings_avg",
+    "revenue_high", "revenue_low", "revenue_avg",
+]
+_CLASSIFICATION_COLUMNS = [
+    "category", "category_ko", "category_en", "confidence",
+    "reason_ko", "reason_en", "metrics_json",
+]
+
+
+def _upsert_latest_sql(source: str, target: str, columns: list, update: bool = True) -> str:
+    """
+    Latest source row per ticker → target; an older date never replaces a newer one.
+
+    update=False only inserts tickers without a target row (ON CONFLICT DO NOTHING).
+    """
+    column_list = ", ".join(columns)
+    conflict = f"""DO UPDATE SET
+            date = EXCLUDED.date,
+            {", ".join(f"{c} = EXCLUDED.{c}" for c in columns)},
+            updated_at = NOW()
+        WHERE EXCLUDED.date >= analytics.{target}.date""" if update else "DO NOTHING"
+    return f"""
+        INSERT INTO analytics.{target} (ticker, date, {column_list}, updated_at)
+        SELECT DISTINCT ON (ticker) ticker, date, {column_list}, NOW()
+        FROM analytics.{source}
+        WHERE ticker = ANY(:tickers)
+        ORDER BY ticker, date DESC
+        ON CONFLICT (ticker) {conflict}
+    """
+
+
+_CALENDAR_SQL = _upsert_latest_sql("ticker_calendar", "ticker_calendar_current", _CALENDAR_COLUMNS)
+_CLASSIFICATION_INSERT_SQL = (
+    _upsert_latest_sql("stock_classifications", "stock_classifications_current", _CLASSIFICATION_COLUMNS,
+                       update=False)
+    + "    RETURNING ticker, category"
+)
+_CLASSIFICATION_SQL = (
+    _upsert_latest_sql("stock_classifications", "stock_classifications_current", _CLASSIFICATION_COLUMNS)
+    + "    RETURNING ticker, category"
+)
+
+
+def refresh_current_calendar(db: Session, tickers: Iterable[str]) -> None:
+    """Re-point ticker_calendar_current at each ticker's latest calendar row (caller commits)."""
+    tickers = sorted(set(tickers))
+    if tickers:
+        db.execute(text(_CALENDAR_SQL), {"tickers": tickers})
+
+
+def refresh_current_classifications(db: Session, tickers: Iterable[str]) -> None:
+    """Re-point stock_classifications_current and adjust category counters (caller commits)."""
+    tickers = sorted(set(tickers))
+    if not tickers:
+        return
+
+    deltas = Counter()
+
+    # 1) 신규 종목: 실제로 INSERT한 트랜잭션만 +1 (동시 INSERT는 유니크 충돌 대기 후 DO NOTHING)
+    for _, category in db.execute(text(_CLASSIFICATION_INSERT_SQL), {"tickers": tickers}).fetchall():
+        deltas[category] += 1
+
+    # 2) 기존 행 잠금 후 이전 분류 확인 (동시 수집은 커밋까지 대기 → 이동을 한 번만 반영)
+    previous = dict(db.execute(text("""
+        SELECT ticker, category FROM analytics.stock_classifications_current
+        WHERE ticker = ANY(:tickers)
+        ORDER BY ticker
+        FOR UPDATE
+    """), {"tickers": tickers}).fetchall())
+
+    # 3) 최신 행으로 갱신 → 분류 이동분만 카운터 반영
+    current = dict(db.execute(text(_CLASSIFICATION_SQL), {"tickers": tickers}).fetchall())
+    for ticker, category in current.items():
+        old_category = previous.get(ticker)
+        if old_category is not None and old_category != category:
+            deltas[category] += 1
+            deltas[old_category] -= 1
+
+    rows = [{"category": c, "delta": d} for c, d in deltas.items() if d]
+    if rows:
+        db.execute(text("""
+            INSERT INTO analytics.classification_counts (category, ticker_count, updated_at)
+            VALUES (:category, :delta, NOW())
+            ON CONFLICT (category) DO UPDATE SET
+                ticker_count = analytics.classification_counts.ticker_count + EXCLUDED.ticker_count,
+                updated_at = NOW()
+        """), rows)
@@ -0,0 +1,166 @@
+"""
+Denormalized daily chart rows (analytics.ticker_daily_wide).
+
+One row per (ticker, date) with every ChartDataPoint field, rebuilt from the
+7 normalized tables (prices, scores, indicators, targets, institutions,
+shorts, ai_analysis). Scores ingest refreshes the touched (ticker, date)
+range; backfill_daily_wide.py fills history.
+"""
+from datetime import date
+from typing import Iterable, List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Source table alias → (wide column, source column) pairs
+_SOURCES = {
+    "p": ("analytics.ticker_prices", [
+        ("open", "open"), ("high", "high"), ("low", "low"),
+        ("close", "close"), ("volume", "volume"),
+    ]),
+    "s": ("analytics.ticker_scores", [
+        ("score", "score"), ("signal", "signal"),
+    ]),
+    "t": ("analytics.ticker_targets", [
+        ("target_price", "target_price"), ("stop_loss", "stop_loss"),
+    ]),
+    "i": ("analytics.ticker_indicators", [
+        ("rsi", "rsi"), ("mfi", "mfi"),
+        ("macd", "macd"), ("macd_signal", "macd_signal"), ("macd_hist", "macd_hist"),
+        ("bb_width", "bb_width"), ("bb_upper", "bb_upper"),
+        ("bb_lower", "bb_lower"), ("bb_middle", "bb_middle"),
+    ]),
+    "n": ("analytics.ticker_institutions", [
+        ("inst_ownership", "inst_ownership"),
+        ("foreign_ownership", "foreign_ownership"),
+        ("insider_ownership", "insider_ownership"),
+        ("inst_chg_1d", "inst_chg_1d"), ("inst_chg_5d", "inst_chg_5d"),
+        ("foreign_chg_1d", "foreign_chg_1d"), ("foreign_chg_5d", "foreign_chg_5d"),
+    ]),
+    "sh": ("analytics.ticker_shorts", [
+        ("short_ratio", "short_ratio"), ("short_percent_float", "short_percent_float"),
+    ]),
+    "a": ("analytics.ticker_ai_analysis", [
+        ("ai_probability", "probability"),
+        ("ai_summary", "summary"),
+        ("ai_bullish_reasons", "bullish_reasons"),
+        ("ai_bearish_reasons", "bearish_reasons"),
+        ("ai_final_comment", "final_comment"),
+        ("ai_analysis_ko", "analysis_ko"),
+        ("ai_analysis_en", "analysis_en"),
+        ("ai_analysis_zh", "analysis_zh"),
+        ("ai_analysis_ja", "analysis_ja"),
+        ("ai_analysis_es", "analysis_es"),
+        ("ai_expert_prediction", "expert_prediction"),
+        ("ai_expert_key_factors", "expert_key_factors"),
+    ]),
+}
+
+WIDE_COLUMNS = [wide for _, cols in _SOURCES.values() for wide, _ in cols]
+
+_keys_sql = "\n        UNION\n".join(
+    f"        SELECT ticker, date FROM {table}\n"
+    f"        WHERE ticker = ANY(:tickers) AND date BETWEEN :from_date AND :to_date"
+    for table, _ in _SOURCES.values()
+)
+_joins_sql = "\n".join(
+    f"    LEFT JOIN {table} {alias} ON {alias}.ticker = k.ticker AND {alias}.date = k.date"
+    for alias, (table, _) in _SOURCES.items()
+)
+_select_sql = ",\n        ".join(
+    f"{alias}.{src} AS {wide}"
+    for alias, (_, cols) in _SOURCES.items() for wide, src in cols
+)
+
+_REFRESH_SQL = f"""
+    WITH keys AS (
+{_keys_sql}
+    )
+    INSERT INTO analytics.ticker_daily_wide (
+        ticker, date, has_price, {", ".join(WIDE_COLUMNS)}, updated_at
+    )
+    SELECT
+        k.ticker, k.date, p.ticker IS NOT NULL,
+        {_select_sql},
+        NOW()
+    FROM keys k
+{_joins_sql}
+    ON CONFLICT (ticker, date) DO UPDATE SET
+        has_price = EXCLUDED.has_price,
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in WIDE_COLUMNS)},
+        updated_at = NOW()
+"""
+
+
+def refresh_daily_wide(
+    db: Session, tickers: Iterable[str], from_date: date, to_date: date,
+) -> int:
+    """
+    Re-derive wide rows for tickers within [from_date, to_date] from the
+    normalized tables (UPSERT, no commit). Returns the number of rows written.
+    """
+    tickers = sorted(set(tickers))
+    if not tickers:
+        return 0
+    result = db.execute(text(_REFRESH_SQL), {
+        "tickers": tickers,
+        "from_date": from_date,
+        "to_date": to_date,
+    })
+    return result.rowcount
+
+
+def wide_range_complete(db: Session, ticker: str, from_date: date, first_wide: date | None) -> bool:
+    """
+    Whether ticker_daily_wide covers a range starting at from_date, given
+    the first wide row found in it (None = no wide rows).
+
+    False when there are no wide rows, or ticker_prices has rows before the
+    first wide row (only recent dates ingested since deploy).
+    """
+    if first_wide is None:
+        return False
+    if first_wide <= from_date:
+        return True
+    return db.execute(text("""
+        SELECT 1 FROM analytics.ticker_prices
+        WHERE ticker = :ticker AND date >= :from_date AND date < :first_wide
+        LIMIT 1
+    """), {"ticker": ticker, "from_date": from_date, "first_wide": first_wide}).first() is None
+
+
+def load_chart_points(
+    db: Session, ticker: str, from_date: date, to_date: date,
+    columns: Sequence[str] | None = None,
+) -> List[dict] | None:
+    """
+    Chart rows (ChartDataPoint-shaped dicts) for a ticker/range from the wide
+    table (one index range scan).
+
+    Args:
+        columns: Subset of WIDE_COLUMNS to select (default: all); rows then
+            only carry "date" and these keys
+
+    Returns None when the range is not (fully) backfilled yet — no wide rows
+    at all, or ticker_prices has rows before the first wide row of the range
+    (only recent dates ingested since deploy) — so the caller can fall back
+    to the normalized-table merge. Returns [] when rows exist but none has a
+    price, matching the legacy "prices required" rule.
+    """
+    columns = WIDE_COLUMNS if columns is None else [c for c in WIDE_COLUMNS if c in set(columns)]
+    select_columns = "".join(f", {c}" for c in columns)
+    rows = db.execute(text(f"""
+        SELECT date, has_price{select_columns}
+        FROM analytics.ticker_daily_wide
+        WHERE ticker = :ticker AND date BETWEEN :from_date AND :to_date
+        ORDER BY date ASC
+    """), {"ticker": ticker, "from_date": from_date, "to_date": to_date}).mappings().all()
+
+    if not wide_range_complete(db, ticker, from_date, rows[0]["date"] if rows else None):
+        return None  # 범위 (앞부분) 미백필 → 레거시 병합으로 전체 범위 조회
+    if not any(r["has_price"] for r in rows):
+        return []
+    return [
+        {"date": r["date"], **{c: r[c] for c in columns}}
+        for r in rows
+    ]
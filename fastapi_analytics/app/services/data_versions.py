@@ -0,0 +1,180 @@
+"""
+Data version registry.
+
+Ingest handlers bump a version key whenever the data behind it changes.
+Read paths fold the current version into their cache keys and ETags, so a
+bump invalidates every cached response built from the old data without
+having to enumerate them.
+
+Keys:
+- "ticker:<T>"        per-ticker chart data (scores + news ingest)
+- "scores"            latest scores/prices/classifications (any scores ingest)
+- "scores:<date>"     scores/prices for one trading date
+- "tickers"           ticker metadata / scored ticker universe (search index)
+- "news"              ticker_news
+- "macro"             macro_indicators + macro_chart_data
+- "indices"           market_indices + market_index_chart
+- "calendar"          market_calendar + earnings_week_events
+- "portfolio:<id>"    one user's holdings / transactions / uploaded P&L summary
+
+Versions are stored in analytics.data_versions so all uvicorn workers see
+the same counters. Each worker keeps an in-memory snapshot of the table,
+refreshed at most every DATA_VERSION_REFRESH_SECONDS with only the rows
+bumped since the previous refresh, so lookups on the request path normally
+cost no query at all. "scores:<date>" keys are pruned together with the
+3-year scores cleanup.
+"""
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Re-read window for bumps whose transaction started before the last refresh
+_REFRESH_OVERLAP_SECONDS = 60.0
+
+
+def ticker_key(ticker: str) -> str:
+    """Version key for everything served per ticker (charts, news stats)."""
+    return f"ticker:{ticker.upper()}"
+
+
+def scores_date_key(d: date) -> str:
+    """Version key for scores/prices of a single trading date."""
+    return f"scores:{d.isoformat()}"
+
+
+def portfolio_key(user_id: int) -> str:
+    """Version key for one user's portfolio (real-time P&L cache)."""
+    return f"portfolio:{user_id}"
+
+
+class DataVersionRegistry:
+    """Cross-worker version counters with a periodically refreshed local snapshot."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._versions: Dict[str, int] = {}
+        self._updated_at: Dict[str, float] = {}  # key → epoch seconds (Last-Modified)
+        self._loaded_at = 0.0
+        self._since: Optional[float] = None  # DB clock at the last successful refresh
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def get(self, key: str) -> int:
+        """Current version of a key (0 if it was never bumped)."""
+        self._maybe_refresh()
+        return self._versions.get(key, 0)
+
+    def with_prefix(self, prefix: str) -> Dict[str, int]:
+        """Snapshot versions of every key starting with prefix (e.g. "ticker:")."""
+        self._maybe_refresh()
+        with self._lock:
+            return {k: v for k, v in self._versions.items() if k.startswith(prefix)}
+
+    def fetch(self, db: Session, key: str) -> int:
+        """
+        Current version of a key read from the table, bypassing the snapshot.
+
+        For per-user keys where a read must see that user's own write made
+        on another worker (one PK lookup).
+        """
+        version = db.execute(
+            text("SELECT version FROM analytics.data_versions WHERE key = :key"),
+            {"key": key},
+        ).scalar()
+        return version or 0
+
+    def updated_at(self, key: str) -> Optional[float]:
+        """Epoch seconds of the last bump of a key (None if never bumped)."""
+        self._maybe_refresh()
+        return self._updated_at.get(key)
+
+    def bump(self, db: Session, keys: Iterable[str]) -> Dict[str, int]:
+        """
+        Increment the given keys and commit.
+
+        Call after the ingest transaction itself has been committed so that
+        readers never pair a new version with old rows.
+
+        Returns:
+            {key: version produced by this bump}
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return {}
+
+        rows = db.execute(text("""
+            INSERT INTO analytics.data_versions (key, version, updated_at)
+            SELECT k, 1, NOW() FROM unnest(CAST(:keys AS text[])) AS k
+            ON CONFLICT (key) DO UPDATE SET
+                version = analytics.data_versions.version + 1,
+                updated_at = NOW()
+            RETURNING key, version, EXTRACT(EPOCH FROM CAST(updated_at AS timestamptz))
+        """), {"keys": keys}).fetchall()
+        db.commit()
+
+        # This worker sees its own bumps immediately
+        with self._lock:
+            for key, version, updated_at in rows:
+                self._versions[key] = version
+                self._updated_at[key] = float(updated_at)
+        return {key: version for key, version, _ in rows}
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        # One thread reloads; the others keep serving the current snapshot
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            # Set first so a failing DB is not retried on every request
+            self._loaded_at = time.monotonic()
+            self._refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> None:
+        """Merge rows bumped since the last refresh into the snapshot (full load the first time)."""
+        db = SessionLocal()
+        try:
+            now = db.execute(text("SELECT EXTRACT(EPOCH FROM NOW())")).scalar()
+            if self._since is None:
+                rows = db.execute(text("""
+                    SELECT key, version, EXTRACT(EPOCH FROM CAST(updated_at AS timestamptz))
+                    FROM analytics.data_versions
+                """)).fetchall()
+            else:
+                # updated_at is the bumping transaction's start time, so re-read
+                # an overlap window for bumps that committed after the last read
+                rows = db.execute(text("""
+                    SELECT key, version, EXTRACT(EPOCH FROM CAST(updated_at AS timestamptz))
+                    FROM analytics.data_versions
+                    WHERE updated_at > TO_TIMESTAMP(:since)
+                """), {"since": self._since - _REFRESH_OVERLAP_SECONDS}).fetchall()
+        except Exception as e:
+            logger.warning(f"Data version refresh failed (keeping last snapshot): {e}")
+            return
+        finally:
+            db.close()
+
+        with self._lock:
+            for key, version, updated_at in rows:
+                # Never move back past a bump this worker made itself
+                if version >= self._versions.get(key, 0):
+                    self._versions[key] = version
+                    if updated_at is not None:
+                        self._updated_at[key] = float(updated_at)
+        self._since = float(now)
+
+data_versions = DataVersionRegistry(settings.DATA_VERSION_REFRESH_SECONDS)
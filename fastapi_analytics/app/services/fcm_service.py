@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models import NotificationLog
+from app.services.watermarks import watermarks
 
 logger = logging.getLogger(__name__)
 
@@ -766,6 +767,11 @@ def process_daily_summary_notification(db: Session, today: date):
 
 def _get_last_trading_date(db: Session, up_to: date = None):
     """DB에 실제 데이터가 있는 가장 최근 거래일 반환 (타임존 무관)"""
+    # scores 워터마크가 up_to 이하이면 MAX(date) 스캔 불필요
+    latest = watermarks.latest("scores")
+    if latest is not None and (up_to is None or latest <= up_to):
+        return latest
+
     if up_to:
         result = db.execute(text("""
             SELECT MAX(date) FROM analytics.ticker_scores
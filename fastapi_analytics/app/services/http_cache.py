@@ -0,0 +1,77 @@
+"""
+Conditional GET support (ETag / Last-Modified) driven by data versions.
+
+The ETag of a response is a hash of the endpoint scope, its request
+parameters and the current version of every dataset it reads. Since the
+versions come from the in-memory snapshot in app.services.data_versions,
+an If-None-Match hit is answered with 304 before any query runs.
+
+Usage in a router:
+
+    validators = cache_validators("treemap", ["scores"], target_date, index)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    ...
+    response.headers.update(validators)
+"""
+import hashlib
+from email.utils import formatdate
+from typing import Dict, Iterable
+
+from fastapi import Request, Response
+
+from app.services.data_versions import data_versions
+from app.utils.compression import strip_encoded_etag
+
+# Clients must revalidate, but may keep the body for conditional requests
+CACHE_CONTROL = "no-cache"
+
+
+def cache_validators(scope: str, keys: Iterable[str], *params) -> Dict[str, str]:
+    """
+    Build ETag / Last-Modified / Cache-Control headers for a response.
+
+    Args:
+        scope: Endpoint identifier (e.g. "treemap")
+        keys: Data version keys the response is derived from
+        *params: Request parameters that change the response body
+    """
+    keys = list(keys)
+    versions = ",".join(f"{k}={data_versions.get(k)}" for k in keys)
+    digest = hashlib.sha1(
+        f"{scope}|{'|'.join(map(str, params))}|{versions}".encode("utf-8")
+    ).hexdigest()
+
+    headers = {"ETag": f'"{digest}"', "Cache-Control": CACHE_CONTROL}
+
+    updated = [ts for ts in (data_versions.updated_at(k) for k in keys) if ts is not None]
+    if updated:
+        headers["Last-Modified"] = formatdate(max(updated), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, validators: Dict[str, str]) -> bool:
+    """
+    True if the request's If-None-Match matches the current ETag.
+
+    Weak comparison; ETags of compressed representations ("<etag>-gzip")
+    match their identity ETag.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = validators["ETag"]
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if strip_encoded_etag(candidate) == etag:
+            return True
+    return False
+
+
+def not_modified(validators: Dict[str, str]) -> Response:
+    """Empty 304 response carrying the validators (and the Vary of the 200)."""
+    return Response(status_code=304, headers={**validators, "Vary": "Accept-Encoding"})
@@ -0,0 +1,145 @@
+"""
+Per-ticker latest score map (watchlist batch lookups).
+
+Holds, for every ticker, its most recent score row with name, name_ko,
+membership, close and change_pct attached (TopTickerResponse shape), so a
+batch of up to 1000 tickers resolves with one dict lookup per symbol
+instead of a GROUP BY ticker, MAX(date) subquery.
+
+The map remembers the "ticker:<T>" data version each entry was loaded at.
+When the "scores" version changes (an ingest on any worker), only the
+tickers whose "ticker:<T>" version moved are reloaded, so every worker
+applies an ingest incrementally; the full DISTINCT ON load runs once per
+worker. One request reloads while the others keep reading the current map.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import TickerScore, Ticker, StockMembership, TickerPrice
+from app.services.data_versions import data_versions
+from app.utils.signals import translate_signal
+
+
+def _load_latest(db: Session, tickers: Optional[List[str]] = None) -> Dict[str, dict]:
+    """Latest score row per ticker (DISTINCT ON ticker ORDER BY date DESC)."""
+    query = db.query(
+        TickerScore.ticker,
+        TickerScore.score,
+        TickerScore.signal,
+        Ticker.name,
+        Ticker.extra_data,
+        TickerPrice.close,
+        TickerPrice.change_pct,
+    ).outerjoin(
+        Ticker,
+        TickerScore.ticker == Ticker.ticker
+    ).outerjoin(
+        TickerPrice,
+        (TickerScore.ticker == TickerPrice.ticker) & (TickerScore.date == TickerPrice.date)
+    )
+    membership_query = db.query(StockMembership.ticker, StockMembership.index_code)
+    if tickers is not None:
+        query = query.filter(TickerScore.ticker.in_(tickers))
+        membership_query = membership_query.filter(StockMembership.ticker.in_(tickers))
+
+    rows = query.distinct(TickerScore.ticker).order_by(
+        TickerScore.ticker, TickerScore.date.desc()
+    ).all()
+
+    membership_map: Dict[str, List[str]] = {}
+    for m in membership_query.all():
+        membership_map.setdefault(m.ticker, []).append(m.index_code)
+
+    return {
+        r.ticker: {
+            "ticker": r.ticker,
+            "score": r.score,
+            "signal": translate_signal(r.signal),
+            "name": r.name,
+            "name_ko": r.extra_data.get("name_ko") if r.extra_data else None,
+            "membership": membership_map.get(r.ticker),
+            "close": r.close,
+            "change_pct": r.change_pct,
+        }
+        for r in rows
+    }
+
+
+class LatestScoreIndex:
+    """Per-worker ticker → latest entry map, versioned by "scores" and "ticker:<T>"."""
+
+    def __init__(self):
+        self._entries: Dict[str, dict] = {}
+        self._ticker_versions: Dict[str, int] = {}  # "ticker:<T>" version each ticker was loaded at
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def lookup(self, db: Session, tickers: Iterable[str]) -> Tuple[List[dict], List[str]]:
+        """
+        Resolve tickers to their latest entries.
+
+        Returns:
+            (entries in request order, tickers without score data)
+        """
+        entries = self._current(db)
+        items, missing = [], []
+        for ticker in tickers:
+            entry = entries.get(ticker)
+            if entry is None:
+                missing.append(ticker)
+            else:
+                items.append(entry)
+        return items, missing
+
+    def refresh(self, db: Session) -> None:
+        """
+        Apply a scores ingest on the ingesting worker right away (after the
+        bump, which already moved this worker's "ticker:<T>" versions).
+        """
+        with self._lock:
+            self._sync(db)
+
+    def _current(self, db: Session) -> Dict[str, dict]:
+        if self._version == data_versions.get("scores"):
+            return self._entries
+        if self._version is None:
+            self._lock.acquire()  # 첫 로드: 빈 맵을 반환하지 않도록 대기
+        elif not self._lock.acquire(blocking=False):
+            return self._entries  # 다른 요청이 갱신 중 → 현재 맵 사용
+        try:
+            self._sync(db)
+        finally:
+            self._lock.release()
+        return self._entries
+
+    def _sync(self, db: Session) -> None:
+        """Reload the tickers whose "ticker:<T>" version changed (everything on first load)."""
+        version = data_versions.get("scores")
+        if self._version == version:
+            return
+        ticker_versions = {
+            key.split(":", 1)[1]: v for key, v in data_versions.with_prefix("ticker:").items()
+        }
+        if self._version is None:
+            self._entries = _load_latest(db)
+        else:
+            changed = sorted(t for t, v in ticker_versions.items() if self._ticker_versions.get(t) != v)
+            if changed:
+                loaded = _load_latest(db, changed)
+                updated = dict(self._entries)
+                for ticker in changed:
+                    if ticker in loaded:
+                        updated[ticker] = loaded[ticker]
+                    else:
+                        updated.pop(ticker, None)
+                self._entries = updated
+        self._ticker_versions = ticker_versions
+        self._version = version
+
+    def stats(self) -> dict:
+        return {"tickers": len(self._entries), "version": self._version}
+
+
+latest_scores = LatestScoreIndex()
@@ -0,0 +1,140 @@
+"""
+Score leaderboards per trading date.
+
+For each date one sorted array of every scored ticker (score DESC, NULLS
+FIRST as in Postgres) is built with name, name_ko, membership, close and
+change_pct already attached, plus one filtered array per index code. Top-N
+is a prefix slice and bottom-N a reversed suffix slice (score ASC, NULLS
+LAST), so /scores/top and /scores/insights cost O(N) per request.
+
+Leaderboards are built right after a scores ingest, and lazily by any
+worker whose copy is older than the "scores:<date>" data version.
+"""
+import threading
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import TickerScore, Ticker, StockMembership, TickerPrice
+from app.services.data_versions import data_versions, scores_date_key
+from app.utils.lru_cache import TTLLRUCache
+from app.utils.signals import translate_signal
+
+# Index codes with a prebuilt array (others are filtered on first use)
+LEADERBOARD_INDEXES = ("SP500", "DOW30", "NASDAQ100")
+
+
+class DateLeaderboards:
+    """Sorted score arrays of one date: all tickers + per index code."""
+
+    def __init__(self, target_date: date, entries: List[dict]):
+        self.date = target_date
+        self.entries = entries
+        self.by_ticker = {e["ticker"]: e for e in entries}
+        self._by_index: Dict[str, List[dict]] = {}
+        self._lock = threading.Lock()
+        for index in LEADERBOARD_INDEXES:
+            self.board(index)
+
+    def board(self, index: Optional[str]) -> List[dict]:
+        if not index:
+            return self.entries
+        board = self._by_index.get(index)
+        if board is None:
+            with self._lock:
+                board = [e for e in self.entries if e["membership"] and index in e["membership"]]
+                self._by_index[index] = board
+        return board
+
+    def top(self, n: int, index: Optional[str] = None) -> List[dict]:
+        """Highest scores first (ORDER BY score DESC LIMIT n)."""
+        return self.board(index)[:n]
+
+    def bottom(self, n: int, index: Optional[str] = None) -> List[dict]:
+        """Lowest scores first (ORDER BY score ASC LIMIT n)."""
+        return self.board(index)[-n:][::-1]
+
+
+def _load_entries(db: Session, target_date: date) -> List[dict]:
+    """Two queries: scores of the date (+ names, prices) and memberships."""
+    rows = db.query(
+        TickerScore.ticker,
+        TickerScore.score,
+        TickerScore.signal,
+        Ticker.name,
+        Ticker.extra_data,  # JSONB metadata (contains name_ko)
+        TickerPrice.close,
+        TickerPrice.change_pct,
+    ).outerjoin(
+        Ticker,
+        TickerScore.ticker == Ticker.ticker
+    ).outerjoin(
+        TickerPrice,
+        (TickerScore.ticker == TickerPrice.ticker) & (TickerScore.date == TickerPrice.date)
+    ).filter(
+        TickerScore.date == target_date
+    ).all()
+
+    membership_map: Dict[str, List[str]] = {}
+    for m in db.query(StockMembership.ticker, StockMembership.index_code).all():
+        membership_map.setdefault(m.ticker, []).append(m.index_code)
+
+    entries = [
+        {
+            "ticker": r.ticker,
+            "score": r.score,
+            "signal": translate_signal(r.signal),
+            "name": r.name,
+            "name_ko": r.extra_data.get("name_ko") if r.extra_data else None,
+            "membership": membership_map.get(r.ticker),
+            "close": r.close,
+            "change_pct": r.change_pct,
+        }
+        for r in rows
+    ]
+    # score DESC NULLS FIRST, ticker as tie-breaker
+    entries.sort(key=lambda e: e["ticker"])
+    entries.sort(key=lambda e: (e["score"] is None, e["score"] or 0.0), reverse=True)
+    return entries
+
+
+class LeaderboardStore:
+    """Per-worker leaderboards keyed by date, versioned by scores:<date>."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._boards = TTLLRUCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, target_date: date) -> DateLeaderboards:
+        version = data_versions.get(scores_date_key(target_date))
+        cached = self._boards.get(target_date)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._lock:
+            cached = self._boards.get(target_date)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            return self._build(db, target_date, version)
+
+    def materialize(self, db: Session, target_date: date) -> None:
+        """Rebuild a date's leaderboards (after scores ingest)."""
+        version = data_versions.get(scores_date_key(target_date))
+        with self._lock:
+            self._build(db, target_date, version)
+
+    def _build(self, db: Session, target_date: date, version: int) -> DateLeaderboards:
+        boards = DateLeaderboards(target_date, _load_entries(db, target_date))
+        self._boards.set(target_date, (version, boards))
+        return boards
+
+    def stats(self) -> dict:
+        return self._boards.stats()
+
+
+leaderboards = LeaderboardStore(
+    max_entries=32,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
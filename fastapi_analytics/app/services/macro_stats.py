@@ -0,0 +1,80 @@
+"""
+Rolling-window macro statistics, stored on the macro_indicators row.
+
+For each (indicator_code, date) row:
+- high/avg/low over the trailing 90 days  (high_3m, avg_3m, low_3m)
+- high/avg/low over the trailing 365 days (high_1y, avg_1y, low_1y)
+- percentile_1y: percent rank (0–100) of the value within the trailing
+  365 days, i.e. share of the other values in the window below it
+
+Windows include the row's own date, matching the former per-request
+90-day MAX/AVG/MIN query. ingest_macro_indicators refreshes the rows
+whose windows contain the ingested date, so every row — including past
+ones served by /macro/history — carries its own stats.
+"""
+from datetime import date, timedelta
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Rows on/after the ingested date whose 1-year window can contain it
+_WINDOW_DAYS = 365
+
+_REFRESH_SQL = """
+    UPDATE analytics.macro_indicators m SET
+        high_3m = s.high_3m, avg_3m = s.avg_3m, low_3m = s.low_3m,
+        high_1y = s.high_1y, avg_1y = s.avg_1y, low_1y = s.low_1y,
+        percentile_1y = (
+            SELECT ROUND((100.0 * COUNT(*) FILTER (WHERE h.value < m.value)
+                          / NULLIF(COUNT(*) - 1, 0))::numeric, 1)
+            FROM analytics.macro_indicators h
+            WHERE h.indicator_code = m.indicator_code
+              AND h.date BETWEEN m.date - 365 AND m.date
+        )
+    FROM (
+        SELECT
+            indicator_code, date,
+            ROUND(MAX(value) OVER w3::numeric, 4) AS high_3m,
+            ROUND(AVG(value) OVER w3::numeric, 4) AS avg_3m,
+            ROUND(MIN(value) OVER w3::numeric, 4) AS low_3m,
+            ROUND(MAX(value) OVER w1y::numeric, 4) AS high_1y,
+            ROUND(AVG(value) OVER w1y::numeric, 4) AS avg_1y,
+            ROUND(MIN(value) OVER w1y::numeric, 4) AS low_1y
+        FROM analytics.macro_indicators
+        WHERE indicator_code = ANY(:codes)
+          AND date BETWEEN :window_from AND :to_date
+        WINDOW
+            w3 AS (PARTITION BY indicator_code ORDER BY date
+                   RANGE BETWEEN INTERVAL '90 days' PRECEDING AND CURRENT ROW),
+            w1y AS (PARTITION BY indicator_code ORDER BY date
+                    RANGE BETWEEN INTERVAL '365 days' PRECEDING AND CURRENT ROW)
+    ) s
+    WHERE m.indicator_code = s.indicator_code
+      AND m.date = s.date
+      AND m.date BETWEEN :from_date AND :to_date
+"""
+
+
+def refresh_macro_stats(db: Session, codes: Iterable[str], ingested_date: date) -> int:
+    """
+    Recompute stored stats of the rows affected by an ingest date.
+
+    Args:
+        codes: Indicator/signal codes written for ingested_date
+        ingested_date: Date whose values changed
+
+    Returns:
+        Number of rows updated (caller commits)
+    """
+    codes = list(codes)
+    if not codes:
+        return 0
+    to_date = ingested_date + timedelta(days=_WINDOW_DAYS)
+    result = db.execute(text(_REFRESH_SQL), {
+        "codes": codes,
+        "window_from": ingested_date - timedelta(days=_WINDOW_DAYS),
+        "from_date": ingested_date,
+        "to_date": to_date,
+    })
+    return result.rowcount
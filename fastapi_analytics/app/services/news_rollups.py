@@ -0,0 +1,167 @@
+"""
+Incrementally maintained news rollups.
+
+ingest_news records, per upserted article, a delta for the bucket it falls
+in: +1 for a new article, and -old/+new for an updated one, so that
+an article that changes hour or sentiment moves between buckets. The
+deltas are applied with one UPSERT per bucket in the ingest transaction,
+so rollups and raw news commit together.
+
+Rollups:
+- analytics.ticker_news_hourly  (ticker, hour_bucket) → mention bubble
+- analytics.ticker_news_daily   (ticker, date)        → chart sentiment stats, /news/summary
+"""
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Hourly buckets kept (mention bubble looks back at most 72 hours)
+HOURLY_RETENTION_DAYS = 7
+
+
+def hour_bucket(published_at: datetime) -> datetime:
+    """Naive UTC hour (matches date_trunc('hour', published_at) on the stored column)."""
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at.replace(minute=0, second=0, microsecond=0)
+
+
+class NewsRollupDeltas:
+    """Accumulates per-bucket deltas during one ingest batch."""
+
+    def __init__(self):
+        # (ticker, hour) → [mentions, sentiment_sum, bullish, bearish]
+        self.hourly: Dict[Tuple[str, datetime], list] = defaultdict(lambda: [0, 0, 0, 0])
+        # (ticker, news date) → [bullish, neutral, bearish, sentiment_sum, articles]
+        self.daily: Dict[Tuple[str, date], list] = defaultdict(lambda: [0, 0, 0, 0, 0])
+
+    def add(self, ticker: str, news_date: date, published_at: datetime, sentiment_score: int,
+            sentiment_grade: str, sign: int = 1) -> None:
+        """Count an article (sign=+1) or remove its previous version (sign=-1)."""
+        delta = self.hourly[(ticker, hour_bucket(published_at))]
+        delta[0] += sign
+        delta[1] += sign * (sentiment_score or 0)
+        delta[2] += sign * (sentiment_grade == "bullish")
+        delta[3] += sign * (sentiment_grade == "bearish")
+
+        delta = self.daily[(ticker, news_date)]
+        delta[0] += sign * (sentiment_grade == "bullish")
+        delta[1] += sign * (sentiment_grade == "neutral")
+        delta[2] += sign * (sentiment_grade == "bearish")
+        delta[3] += sign * (sentiment_score or 0)
+        delta[4] += sign
+
+    def apply(self, db: Session) -> None:
+        """UPSERT accumulated deltas (caller commits)."""
+        hourly_rows = [
+            {
+                "ticker": ticker, "hour_bucket": hour,
+                "mentions": d[0], "sentiment_sum": d[1], "bullish": d[2], "bearish": d[3],
+            }
+            for (ticker, hour), d in self.hourly.items()
+            if any(d)
+        ]
+        if hourly_rows:
+            db.execute(text("""
+                INSERT INTO analytics.ticker_news_hourly
+                    (ticker, hour_bucket, mention_count, sentiment_sum, bullish_count, bearish_count, updated_at)
+                VALUES (:ticker, :hour_bucket, :mentions, :sentiment_sum, :bullish, :bearish, NOW())
+                ON CONFLICT (ticker, hour_bucket) DO UPDATE SET
+                    mention_count = analytics.ticker_news_hourly.mention_count + EXCLUDED.mention_count,
+                    sentiment_sum = analytics.ticker_news_hourly.sentiment_sum + EXCLUDED.sentiment_sum,
+                    bullish_count = analytics.ticker_news_hourly.bullish_count + EXCLUDED.bullish_count,
+                    bearish_count = analytics.ticker_news_hourly.bearish_count + EXCLUDED.bearish_count,
+                    updated_at = NOW()
+            """), hourly_rows)
+
+        daily_rows = [
+            {
+                "ticker": ticker, "date": news_date,
+                "bullish": d[0], "neutral": d[1], "bearish": d[2], "sentiment_sum": d[3],
+                "articles": d[4],
+            }
+            for (ticker, news_date), d in self.daily.items()
+            if any(d)
+        ]
+        if daily_rows:
+            db.execute(text("""
+                INSERT INTO analytics.ticker_news_daily
+                    (ticker, date, article_count, bullish_count, neutral_count, bearish_count, sentiment_sum, updated_at)
+                VALUES (:ticker, :date, :articles, :bullish, :neutral, :bearish, :sentiment_sum, NOW())
+                ON CONFLICT (ticker, date) DO UPDATE SET
+                    article_count = analytics.ticker_news_daily.article_count + EXCLUDED.article_count,
+                    bullish_count = analytics.ticker_news_daily.bullish_count + EXCLUDED.bullish_count,
+                    neutral_count = analytics.ticker_news_daily.neutral_count + EXCLUDED.neutral_count,
+                    bearish_count = analytics.ticker_news_daily.bearish_count + EXCLUDED.bearish_count,
+                    sentiment_sum = analytics.ticker_news_daily.sentiment_sum + EXCLUDED.sentiment_sum,
+                    updated_at = NOW()
+            """), daily_rows)
+
+
+def cleanup_rollups(db: Session) -> None:
+    """Drop expired hourly buckets and daily rows past news retention (caller commits)."""
+    db.execute(text(
+        "DELETE FROM analytics.ticker_news_hourly "
+        f"WHERE hour_bucket < NOW() AT TIME ZONE 'UTC' - INTERVAL '{HOURLY_RETENTION_DAYS} days'"
+    ))
+    db.execute(text(
+        "DELETE FROM analytics.ticker_news_daily "
+        "WHERE date < CURRENT_DATE - INTERVAL '3 years'"
+    ))
+
+
+def rebuild_daily_counts(db: Session, tickers: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute ticker_news_daily from ticker_news (backfill / repair).
+
+    Args:
+        tickers: Limit to these tickers (default: all)
+
+    Returns:
+        Number of (ticker, date) rows written (caller commits)
+    """
+    ticker_filter = ""
+    params = {}
+    if tickers is not None:
+        ticker_filter = "WHERE ticker = ANY(:tickers)"
+        params["tickers"] = [t.upper() for t in tickers]
+
+    db.execute(text(f"DELETE FROM analytics.ticker_news_daily {ticker_filter}"), params)
+    result = db.execute(text(f"""
+        INSERT INTO analytics.ticker_news_daily
+            (ticker, date, article_count, bullish_count, neutral_count, bearish_count, sentiment_sum, updated_at)
+        SELECT
+            ticker,
+            date,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE sentiment_grade = 'bullish'),
+            COUNT(*) FILTER (WHERE sentiment_grade = 'neutral'),
+            COUNT(*) FILTER (WHERE sentiment_grade = 'bearish'),
+            COALESCE(SUM(sentiment_score), 0),
+            NOW()
+        FROM analytics.ticker_news
+        {ticker_filter}
+        GROUP BY ticker, date
+    """), params)
+    return result.rowcount
+
+
+def sentiment_counts(db: Session, ticker: str, since: date) -> Dict[date, dict]:
+    """Daily counter rows of a ticker since a date: {date: {bullish, neutral, bearish, sentiment_sum}}."""
+    rows = db.execute(text("""
+        SELECT date, bullish_count, neutral_count, bearish_count, sentiment_sum
+        FROM analytics.ticker_news_daily
+        WHERE ticker = :ticker AND date >= :since
+    """), {"ticker": ticker, "since": since}).fetchall()
+    return {
+        r.date: {
+            "bullish": r.bullish_count,
+            "neutral": r.neutral_count,
+            "bearish": r.bearish_count,
+            "sentiment_sum": r.sentiment_sum,
+        }
+        for r in rows
+    }
@@ -0,0 +1,307 @@
+"""
+Per-user real-time P&L cache (/portfolio/summary without a date).
+
+Each cached user book holds the user's HOLDING positions as arrays
+(ticker, shares, avg_price), cumulative realized P&L and the latest AI
+summary fields, plus the computed summary. A ticker → user ids reverse
+index records who holds what, so a price ingest revalues only the users
+holding an ingested ticker — all of them in one vectorized pass over the
+concatenated positions.
+
+Invalidation:
+- holdings / transactions / Mac mini summary upload → "portfolio:<user_id>"
+  data version bump. Reads check that one version row directly (PK lookup)
+  rather than the periodically refreshed snapshot, so a write on any worker
+  is visible to the user's next read on every worker.
+- scores ingest → revalue(ingested tickers) on the ingesting worker when it
+  is exactly one "scores" version behind (otherwise it missed an ingest and
+  reprices every book); other workers reprice every cached book once when
+  the "scores" version changes (prices may lag by DATA_VERSION_REFRESH_SECONDS)
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import UserPortfolio, PortfolioSummary, TickerPrice
+from app.services.data_versions import data_versions, portfolio_key
+
+logger = logging.getLogger(__name__)
+
+
+class _UserBook:
+    """One user's positions and non-price summary fields."""
+
+    __slots__ = ("version", "tickers", "shares", "avg_price", "realized_pnl", "extras", "summary")
+
+    def __init__(self, version: int, tickers: List[str], shares: np.ndarray, avg_price: np.ndarray,
+                 realized_pnl: float, extras: dict):
+        self.version = version
+        self.tickers = tickers
+        self.shares = shares
+        self.avg_price = avg_price
+        self.realized_pnl = realized_pnl
+        self.extras = extras  # ai_summary, ai_recommendations, periods, trade_history
+        self.summary: Optional[dict] = None
+
+
+def _load_book(db: Session, user_id: int, version: int) -> _UserBook:
+    """Positions (shares > 0), realized P&L (SELL transactions) and latest AI fields."""
+    holdings = db.query(
+        UserPortfolio.ticker, UserPortfolio.shares, UserPortfolio.avg_price,
+    ).filter(
+        UserPortfolio.user_id == user_id,
+        UserPortfolio.type == 'HOLDING',
+    ).order_by(UserPortfolio.ticker).all()
+    holdings = [h for h in holdings if (h.shares or 0) > 0]
+
+    # 누적 실현손익 — user_transactions가 원본 (더 신뢰)
+    realized_sum = db.execute(text(
+        "SELECT COALESCE(SUM(realized_pnl), 0) "
+        "FROM analytics.user_transactions "
+        "WHERE user_id = :uid AND type = 'SELL' AND realized_pnl IS NOT NULL"
+    ), {"uid": user_id}).scalar() or 0
+
+    # AI 데이터 보충 (맥미니가 넣은 최신 레코드)
+    ai_row = db.query(PortfolioSummary).filter(
+        PortfolioSummary.user_id == user_id,
+        PortfolioSummary.ai_summary.isnot(None),
+        PortfolioSummary.ai_summary != '',
+    ).order_by(PortfolioSummary.date.desc()).first()
+
+    latest_row = db.query(PortfolioSummary).filter(
+        PortfolioSummary.user_id == user_id,
+    ).order_by(PortfolioSummary.date.desc()).first()
+
+    return _UserBook(
+        version=version,
+        tickers=[h.ticker for h in holdings],
+        shares=np.array([float(h.shares) for h in holdings], dtype=np.float64),
+        avg_price=np.array([float(h.avg_price or 0) for h in holdings], dtype=np.float64),
+        realized_pnl=round(float(realized_sum), 2),
+        extras={
+            "ai_summary": ai_row.ai_summary if ai_row else None,
+            "ai_recommendations": ai_row.ai_recommendations if ai_row else None,
+            "periods": latest_row.periods if latest_row else None,
+            "trade_history": latest_row.trade_history if latest_row else None,
+        },
+    )
+
+
+def _load_prices(db: Session, tickers: Iterable[str]) -> Dict[str, Tuple[float, float]]:
+    """Latest (close, change_pct) per ticker (DISTINCT ON ticker ORDER BY date DESC)."""
+    tickers = sorted(set(tickers))
+    if not tickers:
+        return {}
+    rows = db.query(
+        TickerPrice.ticker, TickerPrice.close, TickerPrice.change_pct,
+    ).filter(
+        TickerPrice.ticker.in_(tickers),
+    ).distinct(TickerPrice.ticker).order_by(
+        TickerPrice.ticker, TickerPrice.date.desc(),
+    ).all()
+    return {r.ticker: (r.close or 0.0, r.change_pct or 0.0) for r in rows}
+
+
+def _revalue(books: List[_UserBook], prices: Dict[str, Tuple[float, float]]) -> None:
+    """Recompute the summaries of all given books in one pass over their positions."""
+    if not books:
+        return
+
+    counts = np.array([len(b.tickers) for b in books])
+    tickers = [t for b in books for t in b.tickers]
+    shares = np.concatenate([b.shares for b in books])
+    avg = np.concatenate([b.avg_price for b in books])
+    quotes = np.array([prices.get(t, (0.0, 0.0)) for t in tickers], dtype=np.float64).reshape(-1, 2)
+    price, change_pct = quotes[:, 0], quotes[:, 1]
+
+    value = price * shares
+    cost = avg * shares
+    pnl = value - cost
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 전일 종가 = price / (1 + change_pct / 100)
+        growth = 1 + change_pct / 100
+        day = np.where(growth != 0, (price - price / growth) * shares, 0.0)
+        pnl_pct = np.where(cost > 0, pnl / cost * 100, 0.0)
+
+    # 사용자별 합계 (포지션 0개인 사용자는 0)
+    user_index = np.repeat(np.arange(len(books)), counts)
+    total_value = np.bincount(user_index, weights=value, minlength=len(books))
+    total_cost = np.bincount(user_index, weights=cost, minlength=len(books))
+    day_pnl = np.bincount(user_index, weights=day, minlength=len(books))
+
+    detail_pnl = np.round(pnl, 2).tolist()
+    detail_pct = np.round(pnl_pct, 2).tolist()
+    shares_list, avg_list, price_list = shares.tolist(), avg.tolist(), price.tolist()
+
+    start = 0
+    for i, book in enumerate(books):
+        end = start + counts[i]
+        tv, tc, dp = float(total_value[i]), float(total_cost[i]), float(day_pnl[i])
+        total_pnl = tv - tc
+        book.summary = {
+            "total_value": round(tv, 2),
+            "total_cost": round(tc, 2),
+            "total_pnl": round(total_pnl, 2),
+            "total_pnl_pct": round(total_pnl / tc * 100, 2) if tc > 0 else 0,
+            "day_pnl": round(dp, 2),
+            "day_pnl_pct": round(dp / (tv - dp) * 100, 2) if (tv - dp) > 0 else 0,
+            "holdings_detail": [
+                {
+                    "ticker": tickers[j], "shares": shares_list[j],
+                    "avg_price": avg_list[j], "current_price": price_list[j],
+                    "pnl": detail_pnl[j], "pnl_pct": detail_pct[j],
+                }
+                for j in range(start, end)
+            ] or None,
+            "realized_pnl": book.realized_pnl,
+            **book.extras,
+        }
+        start = end
+
+
+class PortfolioPnLCache:
+    """
+    Per-worker user_id → book LRU with a ticker → holders reverse index.
+
+    DB reads happen outside the lock; the lock only guards swapping books
+    and prices in (and the in-memory revaluation that goes with it).
+    """
+
+    def __init__(self, max_users: int):
+        self.max_users = max(1, max_users)
+        self._books: "OrderedDict[int, _UserBook]" = OrderedDict()
+        self._holders: Dict[str, Set[int]] = {}
+        self._prices: Dict[str, Tuple[float, float]] = {}
+        self._prices_version: Optional[int] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def summary(self, db: Session, user_id: int) -> dict:
+        """Current P&L summary fields of a user (PortfolioSummaryResponse minus date)."""
+        # 사용자 버전은 테이블에서 직접 확인 (다른 워커의 보유/거래 변경 즉시 반영)
+        version = data_versions.fetch(db, portfolio_key(user_id))
+        self._sync_prices(db)
+        with self._lock:
+            book = self._books.get(user_id)
+            if book is not None and book.version == version:
+                self._books.move_to_end(user_id)
+                self.hits += 1
+                return book.summary
+            self.misses += 1
+            prices_version = self._prices_version
+
+        book = _load_book(db, user_id, version)
+        with self._lock:
+            missing = [t for t in book.tickers if t not in self._prices]
+        loaded = _load_prices(db, missing)
+
+        with self._lock:
+            for ticker, quote in loaded.items():
+                self._prices.setdefault(ticker, quote)
+            _revalue([book], self._prices)
+            self._store(user_id, book)
+            if self._prices_version != prices_version:
+                # 가격 로드 중 수집이 끼어듦 → 다음 요청에서 전체 재평가
+                self._prices_version = None
+            return book.summary
+
+    def revalue(self, db: Session, tickers: Iterable[str], version: Optional[int]) -> int:
+        """
+        Reprice the cached users holding any of the tickers (after scores ingest).
+
+        version: "scores" version produced by this ingest's bump (None if the
+        bump failed). Only when this worker's prices are at version - 1 are
+        the ingested tickers enough; otherwise it missed another ingest and
+        every cached book is repriced.
+        """
+        tickers = {t.upper() for t in tickers}
+        with self._lock:
+            incremental = (
+                version is not None and self._prices_version is not None
+                and self._prices_version == version - 1
+            )
+            held = [t for t in tickers if t in self._holders] if incremental else list(self._holders)
+
+        loaded = _load_prices(db, held)
+
+        with self._lock:
+            self._prices.update(loaded)
+            if incremental:
+                user_ids = set().union(*(self._holders.get(t, ()) for t in held))
+                books = [self._books[uid] for uid in user_ids]
+            else:
+                books = list(self._books.values())
+            _revalue(books, self._prices)
+            self._prices_version = version if version is not None else data_versions.get("scores")
+            return len(books)
+
+    def invalidate(self, db: Session, user_ids: Iterable[int]) -> None:
+        """Drop the users' books here and bump their versions for other workers (after commit)."""
+        user_ids = sorted(set(user_ids))
+        with self._lock:
+            for user_id in user_ids:
+                self._drop(user_id)
+        try:
+            data_versions.bump(db, [portfolio_key(uid) for uid in user_ids])
+        except Exception as e:
+            logger.warning(f"Portfolio P&L version bump failed for users {user_ids}: {e}")
+            db.rollback()
+
+    def _sync_prices(self, db: Session) -> None:
+        """Reprice every cached book once per "scores" version (ingest on another worker)."""
+        version = data_versions.get("scores")
+        with self._lock:
+            if self._prices_version == version:
+                return
+            tickers = list(self._holders)
+
+        loaded = _load_prices(db, tickers)
+
+        with self._lock:
+            if self._prices_version == version:
+                return  # 다른 요청이 먼저 재평가
+            self._prices.update(loaded)
+            _revalue(list(self._books.values()), self._prices)
+            self._prices_version = version
+
+    def _store(self, user_id: int, book: _UserBook) -> None:
+        self._drop(user_id)
+        self._books[user_id] = book
+        for ticker in book.tickers:
+            self._holders.setdefault(ticker, set()).add(user_id)
+        while len(self._books) > self.max_users:
+            self._drop(next(iter(self._books)))
+
+    def _drop(self, user_id: int) -> None:
+        book = self._books.pop(user_id, None)
+        if book is None:
+            return
+        for ticker in book.tickers:
+            holders = self._holders.get(ticker)
+            if holders is not None:
+                holders.discard(user_id)
+                if not holders:
+                    del self._holders[ticker]
+                    self._prices.pop(ticker, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "users": len(self._books),
+            "max_users": self.max_users,
+            "tickers": len(self._holders),
+            "prices_version": self._prices_version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+portfolio_pnl = PortfolioPnLCache(settings.PORTFOLIO_PNL_MAX_USERS)
@@ -0,0 +1,189 @@
+"""
+Response cache for read-heavy public endpoints.
+
+Stores pre-serialized JSON bodies so a hit skips both the queries and
+pydantic serialization. Two tiers:
+
+- In-process: size-bounded LRU (RESPONSE_CACHE_MAX_ENTRIES per namespace)
+- Shared (optional): Redis at CACHE_REDIS_URL, shared by all workers/hosts
+
+Callers put the relevant data version(s) into the key (see
+app.services.data_versions), so entries never need explicit invalidation;
+the TTL only bounds memory held by superseded versions.
+"""
+import logging
+from typing import Dict, Hashable, Optional, Protocol
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.utils.compression import compress, encoded_etag, negotiate_encoding
+from app.utils.lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+_shared_client = None
+_shared_checked = False
+
+
+def _get_shared_client():
+    """Lazily connect to the optional Redis tier (None when not configured)."""
+    global _shared_client, _shared_checked
+    if _shared_checked:
+        return _shared_client
+    _shared_checked = True
+
+    if not settings.CACHE_REDIS_URL:
+        return None
+    try:
+        import redis
+    except ImportError:
+        logger.warning("CACHE_REDIS_URL is set but the redis package is not installed; shared cache tier disabled")
+        return None
+
+    _shared_client = redis.Redis.from_url(
+        settings.CACHE_REDIS_URL,
+        socket_timeout=0.1,
+        socket_connect_timeout=0.1,
+    )
+    return _shared_client
+
+
+class ResponseCache:
+    """
+    Two-tier cache of serialized response bodies for one namespace.
+
+    Args:
+        namespace: Key prefix in the shared tier (e.g. "charts")
+        max_entries: In-process LRU capacity
+        ttl_seconds: Expiry for both tiers
+    """
+
+    def __init__(self, namespace: str, max_entries: int, ttl_seconds: int):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._local = TTLLRUCache(max_entries, ttl_seconds)
+        self.shared_hits = 0
+        self.shared_errors = 0
+        _caches[namespace] = self
+
+    def get(self, key: str) -> Optional[bytes]:
+        body = self._local.get(key)
+        if body is not None:
+            return body
+
+        client = _get_shared_client()
+        if client is None:
+            return None
+        try:
+            body = client.get(f"{self.namespace}:{key}")
+        except Exception as e:
+            self.shared_errors += 1
+            logger.debug(f"Shared cache get failed ({self.namespace}): {e}")
+            return None
+        if body is not None:
+            self.shared_hits += 1
+            self._local.set(key, body)
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        self._local.set(key, body)
+
+        client = _get_shared_client()
+        if client is None:
+            return
+        try:
+            client.setex(f"{self.namespace}:{key}", self.ttl_seconds, body)
+        except Exception as e:
+            self.shared_errors += 1
+            logger.debug(f"Shared cache set failed ({self.namespace}): {e}")
+
+    def get_encoded(self, key: str, body: bytes, encoding: str) -> bytes:
+        """
+        Compressed variant of a cached body ("gzip"/"br").
+
+        Compressed once per entry and stored next to it, so popular entries
+        are not recompressed for every client.
+        """
+        variant_key = f"{key}|{encoding}"
+        encoded = self.get(variant_key)
+        if encoded is None:
+            encoded = compress(body, encoding)
+            self.set(variant_key, encoded)
+        return encoded
+
+    def clear(self) -> None:
+        """Drop the in-process tier (shared entries age out via TTL)."""
+        self._local.clear()
+
+    def stats(self) -> dict:
+        stats = self._local.stats()
+        stats["shared_enabled"] = _get_shared_client() is not None
+        stats["shared_hits"] = self.shared_hits
+        stats["shared_errors"] = self.shared_errors
+        return stats
+
+
+_caches: Dict[str, ResponseCache] = {}
+
+
+class EncodedVariants(Protocol):
+    """Anything that keeps compressed variants next to its cached bodies."""
+
+    def get_encoded(self, key: Hashable, body: bytes, encoding: str) -> bytes: ...
+
+
+def cached_json_response(
+    request: Request, cache: EncodedVariants, key: Hashable, body: bytes, validators: Dict[str, str],
+) -> Response:
+    """
+    JSON response for a cached body, using the cache's precompressed variant
+    when the client accepts gzip/br (CompressionMiddleware passes it through).
+
+    Every variant carries Vary: Accept-Encoding, identity ones included, so
+    shared caches never hand an uncompressed body keyed without it to a
+    client that negotiated gzip/br (or vice versa).
+    """
+    headers = {**validators, "Vary": "Accept-Encoding"}
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding and len(body) >= settings.COMPRESSION_MIN_SIZE:
+        headers.update({
+            "ETag": encoded_etag(validators["ETag"], encoding),
+            "Content-Encoding": encoding,
+        })
+        return Response(
+            content=cache.get_encoded(key, body, encoding),
+            media_type="application/json",
+            headers=headers,
+        )
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def all_cache_stats() -> Dict[str, dict]:
+    """Stats for every registered response cache (for /health/cache)."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+chart_cache = ResponseCache(
+    "charts",
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+indices_cache = ResponseCache(
+    "indices",
+    max_entries=256,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+macro_chart_cache = ResponseCache(
+    "macro_charts",
+    max_entries=256,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+calendar_cache = ResponseCache(
+    "calendar",
+    max_entries=256,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
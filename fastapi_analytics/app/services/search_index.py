@@ -0,0 +1,246 @@
+"""
+In-process ticker search index.
+
+Built from analytics.tickers plus the set of scored tickers (the search
+universe is "tickers that have scores", as before). Every ticker is
+indexed under its symbol, English name, Korean name and the choseong
+(initial consonants) of its Korean name, e.g. 삼성전자 → ㅅㅅㅈㅈ.
+
+Lookup: 1- and 2-character grams → candidate ids (postings intersection),
+verified with a substring check, then ranked
+
+    0 exact symbol  1 symbol prefix  2 name prefix  3 substring
+
+and by popularity within a tier (watchlist/holding count, then latest
+trading value). Entry ids are assigned in popularity order, so ranking is
+a bucket per tier in id order. Results are memoized per (query, limit);
+single-character queries (largest candidate sets) are computed at build.
+
+The index is rebuilt when the "tickers" data version changes (ticker
+metadata ingest / new scored tickers) or after SEARCH_INDEX_MAX_AGE_SECONDS
+so popularity stays current.
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.services.data_versions import data_versions
+from app.services.watermarks import watermarks
+from app.utils.lru_cache import TTLLRUCache
+
+# Hangul syllable → initial consonant (choseong), 19 in Unicode order
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 588  # 21 vowels × 28 finals
+
+# Memoized (query, limit) results per index build
+_RESULT_CACHE_ENTRIES = 4096
+_DEFAULT_LIMIT = 20  # /tickers/search default; 1-char queries are prewarmed with it
+
+# Scored tickers via loose index scan on the (ticker, date) primary key,
+# instead of DISTINCT over the whole multi-year ticker_scores table
+_SCORED_TICKERS_SQL = """
+    WITH RECURSIVE t AS (
+        (SELECT ticker FROM analytics.ticker_scores ORDER BY ticker LIMIT 1)
+        UNION ALL
+        SELECT (
+            SELECT s.ticker FROM analytics.ticker_scores s
+            WHERE s.ticker > t.ticker ORDER BY s.ticker LIMIT 1
+        )
+        FROM t WHERE t.ticker IS NOT NULL
+    )
+    SELECT ticker FROM t WHERE ticker IS NOT NULL
+"""
+
+
+def to_choseong(name: str) -> str:
+    """삼성전자 → ㅅㅅㅈㅈ (non-Hangul characters are kept as-is)."""
+    chars = []
+    for ch in name:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            chars.append(_CHOSEONG[(code - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _normalize(value: Optional[str]) -> str:
+    return value.strip().lower() if value else ""
+
+
+class TickerSearchIndex:
+    """Immutable index over one snapshot of the ticker universe."""
+
+    def __init__(self, records: List[dict]):
+        # records are pre-sorted by popularity (id = popularity rank)
+        self.records = records
+        self.symbols: List[str] = []
+        self.symbol_set: Set[str] = set()
+        self.names: List[List[str]] = []  # name keys: English, Korean, choseong
+        self.postings: Dict[str, Set[int]] = {}
+        self._results = TTLLRUCache(_RESULT_CACHE_ENTRIES)
+
+        for entry_id, record in enumerate(records):
+            symbol = _normalize(record["ticker"])
+            names = [
+                key for key in (
+                    _normalize(record["name"]),
+                    _normalize(record["name_ko"]),
+                    to_choseong(_normalize(record["name_ko"])),
+                ) if key
+            ]
+            self.symbols.append(symbol)
+            self.symbol_set.add(symbol)
+            self.names.append(names)
+            for key in [symbol] + names:
+                for n in (1, 2):
+                    for i in range(len(key) - n + 1):
+                        self.postings.setdefault(key[i:i + n], set()).add(entry_id)
+
+        # First keystroke has the largest candidate sets → answer from cache
+        for gram in [g for g in self.postings if len(g) == 1]:
+            self.search(gram, _DEFAULT_LIMIT)
+
+    def _candidates(self, q: str) -> Set[int]:
+        if len(q) == 1:
+            return self.postings.get(q, set())
+        grams = {q[i:i + 2] for i in range(len(q) - 1)}
+        sets = sorted((self.postings.get(g, set()) for g in grams), key=len)
+        candidates = set(sets[0])
+        for s in sets[1:]:
+            candidates &= s
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query: str, limit: int) -> List[dict]:
+        q = _normalize(query)
+        if not q:
+            return []
+        cached = self._results.get((q, limit))
+        if cached is not None:
+            return cached
+
+        tiers: List[List[int]] = [[], [], [], []]
+        for entry_id in sorted(self._candidates(q)):
+            symbol = self.symbols[entry_id]
+            names = self.names[entry_id]
+            if symbol == q:
+                tiers[0].append(entry_id)
+            elif symbol.startswith(q):
+                tiers[1].append(entry_id)
+            elif any(name.startswith(q) for name in names):
+                tiers[2].append(entry_id)
+            elif q in symbol or any(q in name for name in names):
+                tiers[3].append(entry_id)
+
+        results = []
+        for tier in tiers:
+            for entry_id in tier:
+                if len(results) == limit:
+                    break
+                results.append(self.records[entry_id])
+        self._results.set((q, limit), results)
+        return results
+
+    def result_stats(self) -> dict:
+        return self._results.stats()
+
+
+def _load_records(db: Session) -> List[dict]:
+    """Scored tickers with metadata, ordered by popularity."""
+    scored = [row[0] for row in db.execute(text(_SCORED_TICKERS_SQL)).fetchall()]
+    if not scored:
+        return []
+
+    meta = {
+        row.ticker: row
+        for row in db.execute(text("""
+            SELECT ticker, name, category, metadata->>'name_ko' AS name_ko
+            FROM analytics.tickers
+            WHERE ticker = ANY(:tickers)
+        """), {"tickers": scored}).fetchall()
+    }
+    followers = dict(db.execute(text("""
+        SELECT ticker, COUNT(*) FROM analytics.user_portfolios GROUP BY ticker
+    """)).fetchall())
+
+    trading_values = {}
+    latest_price_date = watermarks.latest("prices")
+    if latest_price_date is not None:
+        trading_values = dict(db.execute(text("""
+            SELECT ticker, trading_value FROM analytics.ticker_prices
+            WHERE date = :d AND trading_value IS NOT NULL
+        """), {"d": latest_price_date}).fetchall())
+
+    records = []
+    for ticker in scored:
+        row = meta.get(ticker)
+        records.append({
+            "ticker": ticker,
+            "name": row.name if row else None,
+            "name_ko": row.name_ko if row else None,
+            "category": row.category if row else None,
+        })
+    records.sort(key=lambda r: (
+        -followers.get(r["ticker"], 0),
+        -(trading_values.get(r["ticker"]) or 0.0),
+        r["ticker"],
+    ))
+    return records
+
+
+class SearchIndexStore:
+    """Per-worker search index, rebuilt on "tickers" version change or max age."""
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._index: Optional[TickerSearchIndex] = None
+        self._version: Optional[int] = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def search(self, db: Session, query: str, limit: int) -> List[dict]:
+        return self._current(db).search(query, limit)
+
+    def unknown(self, tickers: Iterable[str]) -> List[str]:
+        """Tickers not in the loaded index (empty if no index is loaded yet)."""
+        index = self._index
+        if index is None:
+            return []
+        return [t for t in tickers if t.lower() not in index.symbol_set]
+
+    def _is_stale(self, version: int) -> bool:
+        return (
+            self._index is None
+            or self._version != version
+            or time.monotonic() - self._built_at > self.max_age_seconds
+        )
+
+    def _current(self, db: Session) -> TickerSearchIndex:
+        version = data_versions.get("tickers")
+        if not self._is_stale(version):
+            return self._index
+        with self._lock:
+            if self._is_stale(version):
+                self._index = TickerSearchIndex(_load_records(db))
+                self._version = version
+                self._built_at = time.monotonic()
+            return self._index
+
+    def stats(self) -> dict:
+        index = self._index
+        return {
+            "tickers": len(index.records) if index else 0,
+            "grams": len(index.postings) if index else 0,
+            "version": self._version,
+            "results": index.result_stats() if index else None,
+        }
+
+
+search_index = SearchIndexStore(settings.SEARCH_INDEX_MAX_AGE_SECONDS)
@@ -0,0 +1,59 @@
+"""
+Cached ticker metadata (name_ko, sector) for read paths.
+
+analytics.tickers is small and changes only on ticker metadata ingest, so
+each worker keeps a ticker → metadata map, reloaded when the "tickers"
+data version changes. Used instead of joining tickers for sector filters
+and name_ko lookups.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.data_versions import data_versions
+
+
+class TickerMetadataCache:
+    """Per-worker ticker → {"name", "name_ko", "sector"} map, versioned by "tickers"."""
+
+    def __init__(self):
+        self._meta: Dict[str, dict] = {}
+        self._by_sector: Dict[str, List[str]] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, ticker: str) -> Optional[dict]:
+        return self._current(db)[0].get(ticker)
+
+    def tickers_in_sectors(self, db: Session, sectors: Iterable[str]) -> List[str]:
+        by_sector = self._current(db)[1]
+        return [t for sector in sectors for t in by_sector.get(sector, [])]
+
+    def _current(self, db: Session):
+        version = data_versions.get("tickers")
+        if self._version != version:
+            with self._lock:
+                if self._version != version:
+                    self._load(db)
+                    self._version = version
+        return self._meta, self._by_sector
+
+    def _load(self, db: Session) -> None:
+        rows = db.execute(text("""
+            SELECT ticker, name, metadata->>'name_ko' AS name_ko, sector
+            FROM analytics.tickers
+        """)).fetchall()
+        meta, by_sector = {}, {}
+        for row in rows:
+            meta[row.ticker] = {"name": row.name, "name_ko": row.name_ko, "sector": row.sector}
+            if row.sector:
+                by_sector.setdefault(row.sector, []).append(row.ticker)
+        self._meta, self._by_sector = meta, by_sector
+
+    def stats(self) -> dict:
+        return {"tickers": len(self._meta), "version": self._version}
+
+
+ticker_metadata = TickerMetadataCache()
@@ -0,0 +1,182 @@
+"""
+Django token → user_id cache for app.auth.
+
+Every authenticated request used to look its token up in
+public.authtoken_token. Lookups are now served from two per-worker
+TTLLRUCaches:
+
+- valid token   → user_id, kept AUTH_TOKEN_CACHE_TTL_SECONDS
+- invalid token → None (negative entry), kept AUTH_TOKEN_NEGATIVE_TTL_SECONDS
+  in a separate, smaller LRU (AUTH_TOKEN_NEGATIVE_CACHE_MAX_ENTRIES), so a
+  flood of random tokens cannot evict valid ones
+
+A background thread LISTENs on the "authtoken_invalidated" channel, which a
+trigger on public.authtoken_token notifies with the key of every deleted
+(logout, regenerate) or re-keyed token, and evicts that key immediately.
+While the listener is disconnected notifications may be lost, so the whole
+cache is cleared on reconnect; the TTL bounds staleness in the meantime.
+
+A NOTIFY can arrive between a lookup's SELECT and its cache insert. Each
+in-flight lookup records the token's invalidation generation first, and the
+result is only cached if no invalidation for that token happened meanwhile.
+A TTL of 0 disables the respective (positive / negative) caching.
+"""
+import logging
+import select
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import engine
+from app.utils.lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "authtoken_invalidated"
+
+_MISSING = object()
+_LISTEN_POLL_SECONDS = 5.0
+_LISTEN_RETRY_SECONDS = 10.0
+
+
+class TokenCache:
+    """Per-worker token LRUs (valid / negative) with NOTIFY invalidation."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float,
+                 negative_max_entries: int, negative_ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._cache = TTLLRUCache(max_entries, ttl_seconds)
+        self._negative = TTLLRUCache(negative_max_entries, negative_ttl_seconds)
+        # token → [lookups in flight, invalidation generation]
+        self._pending: Dict[str, List[int]] = {}
+        self._pending_lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._listening = False
+        self.negative_hits = 0
+        self.invalidations = 0
+
+    def resolve(self, db: Session, token: str) -> Optional[int]:
+        """user_id of a token, or None when the token does not exist."""
+        user_id = self._cache.get(token)
+        if user_id is not None:
+            return user_id
+        if self._negative.get(token, _MISSING) is not _MISSING:
+            self.negative_hits += 1
+            return None
+
+        generation = self._begin_lookup(token)
+        try:
+            result = db.execute(
+                text("SELECT user_id FROM public.authtoken_token WHERE key = :token"),
+                {"token": token},
+            ).fetchone()
+        except Exception:
+            self._end_lookup(token, generation, None, cache=False)
+            raise
+
+        user_id = result[0] if result else None
+        self._end_lookup(token, generation, user_id, cache=True)
+        return user_id
+
+    def invalidate(self, token: str) -> None:
+        with self._pending_lock:
+            pending = self._pending.get(token)
+            if pending is not None:
+                pending[1] += 1
+            self._cache.delete(token)
+            self._negative.delete(token)
+        self.invalidations += 1
+
+    def _invalidate_all(self) -> None:
+        with self._pending_lock:
+            for pending in self._pending.values():
+                pending[1] += 1
+            self._cache.clear()
+            self._negative.clear()
+
+    def _begin_lookup(self, token: str) -> int:
+        """Register an in-flight lookup; returns the token's current invalidation generation."""
+        with self._pending_lock:
+            pending = self._pending.setdefault(token, [0, 0])
+            pending[0] += 1
+            return pending[1]
+
+    def _end_lookup(self, token: str, generation: int, user_id: Optional[int], cache: bool) -> None:
+        """Cache the result unless the token was invalidated since _begin_lookup."""
+        with self._pending_lock:
+            pending = self._pending[token]
+            pending[0] -= 1
+            if pending[0] == 0:
+                del self._pending[token]
+            if not cache or pending[1] != generation:
+                return
+            # TTL 0 disables caching (TTLLRUCache itself treats 0 as "no expiry")
+            if user_id is not None:
+                if self.ttl_seconds > 0:
+                    self._cache.set(token, user_id)
+            elif self.negative_ttl_seconds > 0:
+                self._negative.set(token, None)
+
+    # ----------------------------
+    # LISTEN authtoken_invalidated (daemon thread, one connection per worker)
+    # ----------------------------
+    def start_listener(self) -> None:
+        if self._listener is not None:
+            return
+        self._listener = threading.Thread(target=self._listen_forever, name="token-cache-listener", daemon=True)
+        self._listener.start()
+
+    def _listen_forever(self) -> None:
+        while True:
+            try:
+                self._listen()
+            except Exception as e:
+                logger.warning(f"Token invalidation listener disconnected (retrying in {_LISTEN_RETRY_SECONDS:.0f}s): {e}")
+            self._listening = False
+            time.sleep(_LISTEN_RETRY_SECONDS)
+
+    def _listen(self) -> None:
+        # 풀에서 분리한 전용 연결 (요청 처리용 풀 슬롯을 점유하지 않음)
+        pooled = engine.raw_connection()
+        pooled.detach()
+        conn = pooled.dbapi_connection
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            # 연결이 끊긴 동안의 알림은 유실 → 캐시 전체 폐기 (진행 중 조회 포함)
+            self._invalidate_all()
+            self._listening = True
+            logger.info(f"Token cache listening on {NOTIFY_CHANNEL}")
+
+            while True:
+                if select.select([conn], [], [], _LISTEN_POLL_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    self.invalidate(conn.notifies.pop(0).payload)
+        finally:
+            conn.close()
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        stats.update({
+            "negative": self._negative.stats(),
+            "negative_hits": self.negative_hits,
+            "invalidations": self.invalidations,
+            "listening": self._listening,
+        })
+        return stats
+
+
+token_cache = TokenCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    negative_max_entries=settings.AUTH_TOKEN_NEGATIVE_CACHE_MAX_ENTRIES,
+    negative_ttl_seconds=settings.AUTH_TOKEN_NEGATIVE_TTL_SECONDS,
+)
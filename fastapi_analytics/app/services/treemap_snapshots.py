@@ -0,0 +1,254 @@
+"""
+Treemap snapshots per (date, index, exclude_etf).
+
+A snapshot holds every ticker of a trading date in treemap order
+(trading_value DESC, NULLS FIRST as in Postgres) with its raw sector and
+latest Peter Lynch classification, plus the sector groups of the full set.
+The endpoint serves sector / classification / limit views by slicing the
+snapshot; each sliced view is serialized once and memoized on the snapshot.
+
+Snapshots are built right after a scores ingest for the ingested date
+(all index filters), and lazily by any worker whose snapshot is older than
+the "scores:<date>" data version.
+"""
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, List, Optional
+
+import orjson
+from sqlalchemy import func, desc
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import TickerPrice, Ticker, TickerScore, StockMembership, StockClassification
+from app.services.data_versions import data_versions, scores_date_key
+from app.utils.compression import compress
+from app.utils.lru_cache import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+# Index filters materialized after each scores ingest (None = all tickers)
+TREEMAP_INDEXES = (None, "SP500", "DOW30", "NASDAQ100")
+
+# Views memoized per snapshot (distinct sector/classification/limit combos)
+_VIEWS_PER_SNAPSHOT = 64
+
+# ETF name detection keywords (for tickers with NULL sector)
+_ETF_NAME_KEYWORDS = (
+    'ETF', 'FUND', 'TRUST',
+    'PROSHARES', 'DIREXION', 'ISHARES', 'SPDR',
+    'VANGUARD', 'VANECK', 'GLOBAL X', 'KRANESHARES',
+    'STATE STREET', 'INVESCO', 'SCHWAB', 'AMPLIFY', 'JPMORGAN',
+)
+
+
+def detect_sector(sector: Optional[str], name: Optional[str]) -> str:
+    # Always check ETF keywords in name first (even if sector exists)
+    if name:
+        name_upper = name.upper()
+        if any(kw in name_upper for kw in _ETF_NAME_KEYWORDS):
+            return "ETF"
+    if sector:
+        return sector
+    return "Unknown"
+
+
+def group_sectors(items: Iterable[dict]) -> List[dict]:
+    """Group treemap items by sector with count / avg change / total value."""
+    sector_map = defaultdict(list)
+    for item in items:
+        sector_map[item["sector"]].append(item)
+
+    sectors = []
+    for sector_name, sector_items in sorted(sector_map.items()):
+        change_values = [i["change_pct"] for i in sector_items if i["change_pct"] is not None]
+        trading_values = [i["trading_value"] for i in sector_items if i["trading_value"] is not None]
+
+        sectors.append({
+            "sector": sector_name,
+            "ticker_count": len(sector_items),
+            "avg_change_pct": sum(change_values) / len(change_values) if change_values else None,
+            "total_trading_value": sum(trading_values) if trading_values else None,
+            "items": sector_items,
+        })
+    return sectors
+
+
+class TreemapSnapshot:
+    """
+    All tickers of one (date, index) in treemap order.
+
+    rows: (item, raw_sector, classification) tuples. The limit is applied
+    before ETF exclusion, as the original query did (LIMIT in SQL, ETF
+    filter in Python).
+    """
+
+    def __init__(self, target_date: date, rows: List[tuple], exclude_etf: bool):
+        self.date = target_date
+        self.rows = rows
+        self.exclude_etf = exclude_etf
+        self.sectors = group_sectors(self._visible(item for item, _, _ in rows))
+        self._views = TTLLRUCache(_VIEWS_PER_SNAPSHOT)
+
+    def _visible(self, items: Iterable[dict]) -> Iterable[dict]:
+        if not self.exclude_etf:
+            return items
+        return (item for item in items if item["sector"] != "ETF")
+
+    def view(self, sector: Optional[str], classification: Optional[str], limit: int) -> bytes:
+        """Serialized TreemapResponse body for a filtered view."""
+        key = (sector, classification, limit)
+        body = self._views.get(key)
+        if body is not None:
+            return body
+
+        if sector is None and classification is None and limit >= len(self.rows):
+            # Full snapshot: sector aggregates are precomputed
+            sectors = self.sectors
+        else:
+            cls_upper = classification.upper() if classification else None
+            selected = [
+                item for item, raw_sector, cls in self.rows
+                if (sector is None or raw_sector == sector)
+                and (cls_upper is None or cls == cls_upper)
+            ][:limit]
+            sectors = group_sectors(self._visible(selected))
+
+        body = orjson.dumps({
+            "date": self.date,
+            "total_tickers": sum(s["ticker_count"] for s in sectors),
+            "sectors": sectors,
+        })
+        self._views.set(key, body)
+        return body
+
+    def get_encoded(self, key: tuple, body: bytes, encoding: str) -> bytes:
+        """Compressed variant of a view body, kept next to the view."""
+        variant_key = (*key, encoding)
+        encoded = self._views.get(variant_key)
+        if encoded is None:
+            encoded = compress(body, encoding)
+            self._views.set(variant_key, encoded)
+        return encoded
+
+
+def _load_rows(db: Session, target_date: date, index: Optional[str]) -> List[tuple]:
+    """One query per (date, index): prices + ticker + score + latest classification."""
+    cls_subq = (
+        db.query(
+            StockClassification.ticker,
+            func.max(StockClassification.date).label("max_date"),
+        )
+        .group_by(StockClassification.ticker)
+        .subquery()
+    )
+    latest_cls = (
+        db.query(StockClassification.ticker, StockClassification.category)
+        .join(
+            cls_subq,
+            (StockClassification.ticker == cls_subq.c.ticker) &
+            (StockClassification.date == cls_subq.c.max_date),
+        )
+        .subquery()
+    )
+
+    query = (
+        db.query(
+            TickerPrice.ticker,
+            TickerPrice.close,
+            TickerPrice.volume,
+            TickerPrice.change_pct,
+            TickerPrice.trading_value,
+            Ticker.name,
+            Ticker.extra_data,
+            Ticker.sector,
+            Ticker.sub_industry,
+            TickerScore.score,
+            TickerScore.signal,
+            latest_cls.c.category,
+        )
+        .outerjoin(Ticker, TickerPrice.ticker == Ticker.ticker)
+        .outerjoin(
+            TickerScore,
+            (TickerPrice.ticker == TickerScore.ticker) & (TickerPrice.date == TickerScore.date),
+        )
+        .outerjoin(latest_cls, TickerPrice.ticker == latest_cls.c.ticker)
+        .filter(TickerPrice.date == target_date)
+    )
+
+    if index:
+        query = query.join(
+            StockMembership,
+            (TickerPrice.ticker == StockMembership.ticker) &
+            (StockMembership.index_code == index)
+        )
+
+    query = query.order_by(desc(TickerPrice.trading_value).nulls_first(), TickerPrice.ticker)
+
+    rows = []
+    for row in query.all():
+        name_ko = (row.extra_data or {}).get('name_ko') if row.extra_data else None
+        item = {
+            "ticker": row.ticker,
+            "name": row.name,
+            "name_ko": name_ko,
+            "sector": detect_sector(row.sector, row.name),
+            "sub_industry": row.sub_industry,
+            "change_pct": row.change_pct,
+            "trading_value": row.trading_value,
+            "close": row.close,
+            "volume": row.volume,
+            "score": row.score,
+            "signal": row.signal,
+        }
+        rows.append((item, row.sector, row.category))
+    return rows
+
+
+class TreemapSnapshotStore:
+    """Per-worker snapshots keyed by (date, index, exclude_etf), versioned by scores:<date>."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._snapshots = TTLLRUCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, target_date: date, index: Optional[str], exclude_etf: bool) -> TreemapSnapshot:
+        version = data_versions.get(scores_date_key(target_date))
+        cached = self._snapshots.get((target_date, index, exclude_etf))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with self._lock:
+            cached = self._snapshots.get((target_date, index, exclude_etf))
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            return self._build(db, target_date, index, version)[exclude_etf]
+
+    def materialize(self, db: Session, target_date: date) -> None:
+        """Build all (index, exclude_etf) snapshots of a date (after scores ingest)."""
+        version = data_versions.get(scores_date_key(target_date))
+        with self._lock:
+            for index in TREEMAP_INDEXES:
+                self._build(db, target_date, index, version)
+
+    def _build(self, db: Session, target_date: date, index: Optional[str], version: int) -> dict:
+        rows = _load_rows(db, target_date, index)
+        built = {}
+        for exclude_etf in (True, False):
+            snapshot = TreemapSnapshot(target_date, rows, exclude_etf)
+            # Prime the default view (no filters, limit=500)
+            snapshot.view(None, None, 500)
+            self._snapshots.set((target_date, index, exclude_etf), (version, snapshot))
+            built[exclude_etf] = snapshot
+        return built
+
+    def stats(self) -> dict:
+        return self._snapshots.stats()
+
+
+treemap_snapshots = TreemapSnapshotStore(
+    max_entries=64,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
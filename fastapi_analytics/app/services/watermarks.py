@@ -0,0 +1,128 @@
+"""
+Data freshness watermarks (latest date per dataset).
+
+Read paths used to resolve "latest" with SELECT MAX(date) over the large
+tables on every request. Ingest handlers now advance a watermark per
+dataset in analytics.data_watermarks, and readers take it from a per-worker
+snapshot refreshed every DATA_VERSION_REFRESH_SECONDS.
+
+A dataset without a row is seeded once from its source query (the
+migration seeds all of them, so this is only a fallback).
+"""
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# dataset → source query for lazy seeding (same filters as the read paths)
+DATASETS = {
+    "prices": "SELECT MAX(date) FROM analytics.ticker_prices",
+    "prices_trading_value": "SELECT MAX(date) FROM analytics.ticker_prices WHERE trading_value IS NOT NULL",
+    "scores": "SELECT MAX(date) FROM analytics.ticker_scores",
+    "indicators": "SELECT MAX(date) FROM analytics.ticker_indicators",
+    "macro": "SELECT MAX(date) FROM analytics.macro_indicators WHERE source != 'SIGNAL'",
+    "macro_signals": "SELECT MAX(date) FROM analytics.macro_indicators WHERE source = 'SIGNAL'",
+    "indices": "SELECT MAX(date) FROM analytics.market_indices",
+}
+
+
+class WatermarkRegistry:
+    """Latest date per dataset with a periodically refreshed local snapshot."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._dates: Dict[str, date] = {}
+        self._seeded: set = set()
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def latest(self, dataset: str) -> Optional[date]:
+        """Latest date of a dataset (None if it has no data)."""
+        self._maybe_refresh()
+        latest = self._dates.get(dataset)
+        if latest is None and dataset not in self._seeded:
+            latest = self._seed(dataset)
+        return latest
+
+    def advance(self, db: Session, dates: Mapping[str, Optional[date]]) -> None:
+        """
+        Move watermarks forward (never backward) and commit.
+
+        Call after the ingest transaction itself has been committed.
+        """
+        updated = {}
+        for dataset, new_date in dates.items():
+            if new_date is None:
+                continue
+            updated[dataset] = db.execute(text("""
+                INSERT INTO analytics.data_watermarks (dataset, latest_date, updated_at)
+                VALUES (:dataset, :latest_date, NOW())
+                ON CONFLICT (dataset) DO UPDATE SET
+                    latest_date = GREATEST(analytics.data_watermarks.latest_date, EXCLUDED.latest_date),
+                    updated_at = NOW()
+                RETURNING latest_date
+            """), {"dataset": dataset, "latest_date": new_date}).scalar()
+        db.commit()
+
+        with self._lock:
+            self._dates.update(updated)
+
+    def _seed(self, dataset: str) -> Optional[date]:
+        query = DATASETS.get(dataset)
+        if query is None:
+            raise KeyError(f"Unknown watermark dataset: {dataset}")
+
+        db = SessionLocal()
+        try:
+            latest = db.execute(text(query)).scalar()
+            if latest is not None:
+                db.execute(text("""
+                    INSERT INTO analytics.data_watermarks (dataset, latest_date, updated_at)
+                    VALUES (:dataset, :latest_date, NOW())
+                    ON CONFLICT (dataset) DO UPDATE SET
+                        latest_date = GREATEST(analytics.data_watermarks.latest_date, EXCLUDED.latest_date)
+                """), {"dataset": dataset, "latest_date": latest})
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Watermark seed failed for {dataset}: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+        with self._lock:
+            self._seeded.add(dataset)
+            if latest is not None:
+                self._dates[dataset] = latest
+        return latest
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            # Set first so a failing DB is not retried on every request
+            self._loaded_at = time.monotonic()
+            db = SessionLocal()
+            try:
+                rows = db.execute(text(
+                    "SELECT dataset, latest_date FROM analytics.data_watermarks"
+                )).fetchall()
+                self._dates = {dataset: latest for dataset, latest in rows}
+            except Exception as e:
+                logger.warning(f"Watermark refresh failed (keeping last snapshot): {e}")
+            finally:
+                db.close()
+
+
+watermarks = WatermarkRegistry(settings.DATA_VERSION_REFRESH_SECONDS)
@@ -0,0 +1,35 @@
+"""
+Columnar (array-of-series) response format.
+
+Turns a list of row dicts into {"date": [...], "close": [...], ...} so chart
+clients can feed arrays straight into their widgets. Series that are null on
+every row are dropped; partially-null series keep their nulls so that every
+array stays index-aligned with "date".
+"""
+from typing import Iterable, List, Optional
+
+FORMAT_PATTERN = "^(rows|columnar)$"
+
+
+def to_columnar(rows: List[dict], fields: Optional[Iterable[str]] = None) -> dict:
+    """
+    Transpose row dicts into aligned series.
+
+    Args:
+        rows: Row dicts in display order (all with the same keys)
+        fields: Keys to emit (default: keys of the first row)
+
+    Returns:
+        {"date": [...], <field>: [...], ...} without all-null series
+    """
+    if not rows:
+        return {"date": []}
+    if fields is None:
+        fields = rows[0].keys()
+
+    columns = {}
+    for field in fields:
+        series = [row.get(field) for row in rows]
+        if field == "date" or any(v is not None for v in series):
+            columns[field] = series
+    return columns
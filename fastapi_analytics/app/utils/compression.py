@@ -0,0 +1,152 @@
+"""
+Response compression (gzip / brotli) negotiated by Accept-Encoding.
+
+- CompressionMiddleware compresses complete (non-streaming) responses of
+  compressible content types that are at least COMPRESSION_MIN_SIZE bytes.
+- Routes serving bodies from an internal cache (charts, indices, macro
+  charts, calendar, treemap views) compress once per encoding and keep the
+  variant next to the cache entry (response_cache.cached_json_response);
+  such responses already carry Content-Encoding and are passed through.
+
+Brotli is used only when the brotli package is installed; gzip is always
+available. A compressed representation gets its own strong ETag
+("<etag>-<encoding>"), as required for strong validators.
+"""
+import gzip
+import logging
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "text/",
+    "image/svg+xml",
+)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header.
+
+    Prefers br over gzip; honours q=0 exclusions. Returns None for identity.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong ETag of the compressed representation: "abc" → "abc-gzip"."""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def strip_encoded_etag(etag: str) -> str:
+    """Inverse of encoded_etag (for If-None-Match comparison)."""
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)] + '"'
+    return etag
+
+
+def _is_compressible(headers: MutableHeaders, status: int, body: bytes) -> bool:
+    if status < 200 or status in (204, 304):
+        return False
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    if not content_type.startswith(COMPRESSIBLE_TYPES):
+        return False
+    return len(body) >= settings.COMPRESSION_MIN_SIZE
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware: gzip/brotli for complete responses.
+
+    Streaming responses (more_body on the first chunk, e.g. static files)
+    are passed through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            start["headers"] = list(start.get("headers", []))
+            headers = MutableHeaders(raw=start["headers"])
+
+            if message.get("more_body", False) or not _is_compressible(headers, start["status"], body):
+                await send(start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], encoding)
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
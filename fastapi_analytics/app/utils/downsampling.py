@@ -0,0 +1,130 @@
+"""
+Shape-preserving downsampling for chart series (NumPy-vectorized).
+
+Lines — LTTB (Largest-Triangle-Three-Buckets, Steinarsson 2013): keeps the
+first and last points and, for each of the (threshold - 2) buckets in
+between, the point forming the largest triangle with the previously kept
+point and the average of the next bucket. Peaks and troughs survive,
+unlike plain every-n-th sampling. Bucket averages are computed for all
+buckets at once; only the (threshold - 2) argmax steps are sequential,
+each over a NumPy slice.
+
+Candles — OHLC bucket aggregation: consecutive rows are merged into at most
+max_points candles (open = first, high = max, low = min, close = last,
+volume = sum); other fields take the bucket's last row, so a candle is
+labelled with the last date it covers.
+"""
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+
+def _as_float(values: Iterable) -> np.ndarray:
+    """Python values → float array (None → NaN)."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Indices of the points LTTB keeps (ascending).
+
+    Args:
+        xs: Monotonic x values (e.g. date ordinals)
+        ys: y values, same length as xs (None/NaN points are not kept)
+        threshold: Target number of points (>= 3 to downsample)
+
+    Returns:
+        All indices if the series already has <= threshold points
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    y_all = _as_float(ys)
+    valid = np.flatnonzero(~np.isnan(y_all))
+    if len(valid) <= threshold:
+        return valid.tolist()
+
+    x = _as_float(xs)[valid]
+    y = y_all[valid]
+    n = len(valid)
+
+    # Bucket edges: first/last point are buckets of their own
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    starts, ends = edges[:-1], edges[1:]
+
+    # Average of each bucket, then "next bucket" average (last bucket → last point)
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[:-1], starts) / counts
+    avg_y = np.add.reduceat(y[:-1], starts) / counts
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0  # previously kept point
+    for i in range(threshold - 2):
+        start, end = starts[i], ends[i]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[i]) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y[i] - ay))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+
+    return valid[kept].tolist()
+
+
+def ohlc_buckets(
+    rows: List[dict],
+    max_points: int,
+    open_field: str = "open",
+    high_field: str = "high",
+    low_field: str = "low",
+    close_field: str = "close",
+    sum_fields: Sequence[str] = ("volume",),
+) -> List[dict]:
+    """
+    Merge consecutive dict rows into at most max_points OHLC candles.
+
+    Missing values (None) are ignored by max/min/sum; a bucket without any
+    value for a field gets None. Fields absent from the rows (sparse
+    fieldsets) stay absent. Rows are not modified.
+    """
+    n = len(rows)
+    if max_points >= n or max_points < 1:
+        return rows
+
+    starts = np.unique(np.linspace(0, n, max_points + 1).astype(np.int64)[:-1])
+    last = np.append(starts[1:], n) - 1
+
+    def column(field: str) -> np.ndarray:
+        return _as_float(r.get(field) for r in rows)
+
+    present_fields = rows[0].keys()
+    prices = {}
+    # Bucket (first row) open is kept even if None, like the source candle
+    if open_field in present_fields:
+        prices[open_field] = column(open_field)[starts]
+    if high_field in present_fields:
+        prices[high_field] = np.fmax.reduceat(column(high_field), starts)
+    if low_field in present_fields:
+        prices[low_field] = np.fmin.reduceat(column(low_field), starts)
+    if close_field in present_fields:
+        prices[close_field] = column(close_field)[last]
+    sums = {}
+    for field in sum_fields:
+        if field not in present_fields:
+            continue
+        values = column(field)
+        present = np.add.reduceat(~np.isnan(values), starts)
+        sums[field] = (np.add.reduceat(np.nan_to_num(values), starts), present)
+
+    result = []
+    for b, row_index in enumerate(last.tolist()):
+        candle = dict(rows[row_index])
+        for field, values in prices.items():
+            candle[field] = None if np.isnan(values[b]) else float(values[b])
+        for field, (totals, present) in sums.items():
+            candle[field] = int(totals[b]) if present[b] else None
+        result.append(candle)
+    return result
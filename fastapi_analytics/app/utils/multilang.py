@@ -0,0 +1,51 @@
+"""
+Multilingual text packed as 'ko|||en|||zh|||ja|||es'.
+
+Mac mini ingest stores news summaries/labels, AI analysis text, calendar
+titles and portfolio advice in this packed form. Read paths that take a
+`lang=` parameter project each field down to one language (en fallback);
+without `lang` the packed value is returned unchanged for older clients.
+
+Splits are memoized: the same stored strings are served to many requests,
+so each (packed, lang) pair is parsed once per worker.
+"""
+from functools import lru_cache
+from typing import Iterable, Optional
+
+# 다국어 언패킹 순서: ko=0, en=1, zh=2, ja=3, es=4
+LANG_ORDER = ["ko", "en", "zh", "ja", "es"]
+LANG_PATTERN = "^(ko|en|zh|ja|es)$"
+
+_SEPARATOR = "|||"
+_UNPACK_CACHE_ENTRIES = 8192  # values are up to a few KB each
+
+
+@lru_cache(maxsize=_UNPACK_CACHE_ENTRIES)
+def unpack_multilang(packed: str, lang: str) -> str:
+    """'ko|||en|||zh|||ja|||es' → 해당 언어 문자열, 없으면 en fallback"""
+    parts = packed.split(_SEPARATOR)
+    idx = LANG_ORDER.index(lang) if lang in LANG_ORDER else 1  # default en
+    if idx < len(parts) and parts[idx].strip():
+        return parts[idx].strip()
+    return parts[1].strip() if len(parts) > 1 else parts[0].strip()  # en fallback
+
+
+def localize(value: Optional[str], lang: Optional[str]) -> Optional[str]:
+    """Project a packed value to `lang`; unchanged when lang is None or value is empty."""
+    if lang is None or not value:
+        return value
+    return unpack_multilang(value, lang)
+
+
+def localize_fields(row: dict, fields: Iterable[str], lang: Optional[str]) -> dict:
+    """Project the given packed fields of a dict row in place (absent fields stay absent)."""
+    if lang is not None:
+        for field in fields:
+            if field in row:
+                row[field] = localize(row[field], lang)
+    return row
+
+
+def unpack_stats() -> dict:
+    info = unpack_multilang.cache_info()
+    return {"entries": info.currsize, "hits": info.hits, "misses": info.misses}
@@ -0,0 +1,67 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is the sort key of the last row of a page, JSON-encoded and
+base64url'd so clients treat it as opaque: page N costs the same index
+range scan as page 1, unlike OFFSET.
+
+Totals: exact COUNT(*) is opt-in (include_total=true). By default the
+planner's row estimate (EXPLAIN) is returned instead, which needs no scan.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Query, Session
+
+
+def encode_cursor(*values: Any) -> str:
+    """Sort key values → opaque cursor (datetimes as ISO strings)."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Opaque cursor → list of `size` raw values (HTTP 400 if malformed)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(400, "Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+
+
+def estimate_count(db: Session, query: Query) -> Optional[int]:
+    """
+    Planner row estimate for a query (EXPLAIN, no execution).
+
+    Returns None if the estimate cannot be obtained.
+    """
+    conn = db.connection()
+    compiled = query.statement.compile(
+        dialect=conn.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    try:
+        # Savepoint so a failed EXPLAIN does not abort the request's transaction
+        with conn.begin_nested():
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+    except Exception:
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
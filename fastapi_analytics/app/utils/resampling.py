@@ -0,0 +1,73 @@
+"""
+Calendar resampling and alignment of daily series (NumPy-vectorized).
+
+Periods are labelled by their first day:
+    D → the date, W → Monday of the (ISO) week, M → 1st of the month
+
+Each series is aggregated per period (last value or mean), then all series
+are aligned on the sorted union of their period labels; a series without
+a value in a period gets None there.
+"""
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FREQ_PATTERN = "^(D|W|M)$"
+AGG_PATTERN = "^(last|mean)$"
+
+
+def period_starts(dates: Sequence[date], freq: str) -> np.ndarray:
+    """Dates → datetime64[D] label of the period each falls in."""
+    days = np.array(dates, dtype="datetime64[D]")
+    if freq == "W":
+        # 1970-01-01 (day 0) is a Thursday → weekday (Mon=0) = (day + 3) % 7
+        return days - (days.astype(np.int64) + 3) % 7
+    if freq == "M":
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    return days
+
+
+def resample(
+    dates: Sequence[date], values: Sequence[float], freq: str, agg: str = "last",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Aggregate one date-sorted series per period.
+
+    Returns:
+        (period labels as datetime64[D], aggregated float values)
+    """
+    if not len(dates):
+        return np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+
+    labels = period_starts(dates, freq)
+    values = np.array(values, dtype=np.float64)
+    starts = np.concatenate(([0], np.flatnonzero(labels[1:] != labels[:-1]) + 1))
+    if agg == "mean":
+        counts = np.diff(np.append(starts, len(values)))
+        aggregated = np.add.reduceat(values, starts) / counts
+    else:
+        aggregated = values[np.append(starts[1:], len(values)) - 1]
+    return labels[starts], aggregated
+
+
+def align_series(
+    series: Dict[str, Tuple[np.ndarray, np.ndarray]], decimals: int = 4,
+) -> Tuple[List[str], Dict[str, List[Optional[float]]]]:
+    """
+    Align resampled series on the union of their labels.
+
+    Returns:
+        (ISO date index, {series_id: values aligned with the index})
+    """
+    non_empty = [labels for labels, _ in series.values() if len(labels)]
+    if not non_empty:
+        return [], {series_id: [] for series_id in series}
+
+    index = np.unique(np.concatenate(non_empty))
+    columns = {}
+    for series_id, (labels, values) in series.items():
+        column = np.full(len(index), np.nan)
+        column[np.searchsorted(index, labels)] = np.round(values, decimals)
+        columns[series_id] = [None if np.isnan(v) else v for v in column.tolist()]
+    return np.datetime_as_string(index, unit="D").tolist(), columns
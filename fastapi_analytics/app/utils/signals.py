@@ -0,0 +1,34 @@
+"""
+Score signal codes shared by the scores endpoints and leaderboards.
+"""
+
+
+# Signal translation mapping (Korean → English)
+SIGNAL_MAPPING = {
+    "🔥강력매수": "BUY",
+    "매수권고": "BUY",
+    "보유": "HOLD",
+    "중립": "HOLD",
+    "매도권고": "SELL",
+    "🔥강력매도": "SELL",
+}
+
+
+def translate_signal(korean_signal: str | None) -> str | None:
+    """
+    Translate Korean signals to English codes for API response.
+
+    Internal logic codes (stable):
+    - "BUY": Strong buy signal
+    - "SELL": Strong sell signal
+    - "HOLD": Neutral or hold signal
+
+    Args:
+        korean_signal: Korean signal from Mac mini DB (e.g., "🔥강력매수")
+
+    Returns:
+        English code: "BUY", "SELL", "HOLD", or None
+    """
+    if korean_signal is None:
+        return None
+    return SIGNAL_MAPPING.get(korean_signal, "HOLD")
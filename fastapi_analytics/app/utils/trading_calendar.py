@@ -6,8 +6,7 @@ Provides functions to validate trading days and exclude weekends/holidays.
 from datetime import date, timedelta
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.models import TickerScore
+from app.services.watermarks import watermarks
 
 
 # US Stock Market Holidays for 2026
@@ -77,12 +76,12 @@ def get_latest_trading_date(db: Session, check_all_tables: bool = False) -> Opti
     """
     Get the most recent trading day from the database.
 
-    Queries the database for the latest date with ticker data,
-    then walks backward to find the most recent valid trading day
+    Resolves the latest date with ticker data from the ingest-maintained
+    watermarks (no MAX(date) scan), then walks backward to find the most recent valid trading day
     (skipping weekends and holidays).
 
     Args:
-        db: SQLAlchemy database session
+        db: SQLAlchemy database session (kept for callers; dates come from watermarks)
         check_all_tables: If True, checks ticker_prices, ticker_scores, and ticker_indicators
                          to find the maximum date across all tables. If False, only checks
                          ticker_scores (default behavior for backward compatibility).
@@ -93,15 +92,12 @@ def get_latest_trading_date(db: Session, check_all_tables: bool = False) -> Opti
     Example:
         If DB has data for 2026-02-07 (Saturday), this will return 2026-02-06 (Friday)
     """
-    # Import models at function scope (needed for both if/else branches)
-    from app.models import TickerPrice, TickerScore, TickerIndicator
-
-    # Get latest date from database
+    # Get latest date from watermarks
     if check_all_tables:
         # ⭐ Phase 3: Check ALL tables to prevent data loss when tables have different latest dates
-        latest_price = db.query(func.max(TickerPrice.date)).scalar()
-        latest_score = db.query(func.max(TickerScore.date)).scalar()
-        latest_indicator = db.query(func.max(TickerIndicator.date)).scalar()
+        latest_price = watermarks.latest("prices")
+        latest_score = watermarks.latest("scores")
+        latest_indicator = watermarks.latest("indicators")
 
         # Get maximum date across all tables
         all_dates = [d for d in [latest_price, latest_score, latest_indicator] if d is not None]
@@ -111,7 +107,7 @@ def get_latest_trading_date(db: Session, check_all_tables: bool = False) -> Opti
         latest_date = max(all_dates)
     else:
         # Default behavior: only check ticker_scores (backward compatibility)
-        latest_date = db.query(func.max(TickerScore.date)).scalar()
+        latest_date = watermarks.latest("scores")
 
     if latest_date is None:
         return None
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Backfill analytics.ticker_daily_wide from the normalized chart tables.
+
+Usage:
+    python backfill_daily_wide.py                 # all tickers, last 3 years
+    python backfill_daily_wide.py AAPL MSFT       # specific tickers
+"""
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import text
+
+from app.database import SessionLocal
+from app.services.daily_wide import refresh_daily_wide
+
+BATCH_SIZE = 50  # tickers per transaction
+
+
+def backfill_daily_wide(tickers=None):
+    """Rebuild wide rows for the given tickers (default: every ticker with prices or scores)"""
+    db = SessionLocal()
+    try:
+        if not tickers:
+            tickers = [r[0] for r in db.execute(text("""
+                SELECT ticker FROM analytics.ticker_prices
+                UNION
+                SELECT ticker FROM analytics.ticker_scores
+                ORDER BY 1
+            """)).fetchall()]
+        tickers = [t.upper() for t in tickers]
+
+        # Normalized tables only keep 3 years (ingest cleanup)
+        to_date = date.today()
+        from_date = to_date - timedelta(days=3 * 366)
+
+        print(f"📊 Backfilling ticker_daily_wide for {len(tickers)} tickers ({from_date} ~ {to_date})")
+
+        total_rows = 0
+        for i in range(0, len(tickers), BATCH_SIZE):
+            batch = tickers[i:i + BATCH_SIZE]
+            total_rows += refresh_daily_wide(db, batch, from_date, to_date)
+            db.commit()
+            print(f"  ✓ {min(i + BATCH_SIZE, len(tickers))}/{len(tickers)} tickers")
+
+        print(f"✅ Backfill complete: {total_rows} rows upserted")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_daily_wide(sys.argv[1:])
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Backfill analytics.ticker_news_daily from analytics.ticker_news.
+
+Usage:
+    python backfill_news_daily.py                 # all tickers
+    python backfill_news_daily.py AAPL MSFT       # specific tickers (repair)
+"""
+import sys
+
+from app.database import SessionLocal
+from app.services.news_rollups import rebuild_daily_counts
+
+
+def backfill_news_daily(tickers=None):
+    """Recompute daily sentiment counters (default: every ticker with news)"""
+    db = SessionLocal()
+    try:
+        scope = f"{len(tickers)} tickers" if tickers else "all tickers"
+        print(f"📊 Backfilling ticker_news_daily for {scope}")
+
+        rows = rebuild_daily_counts(db, tickers or None)
+        db.commit()
+
+        print(f"✅ Backfill complete: {rows} (ticker, date) rows written")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    backfill_news_daily(sys.argv[1:])
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark: pydantic + FastAPI JSON encoding vs plain dicts + orjson.
+
+Uses synthetic rows shaped like the real query results (no DB needed) for the
+three largest responses:
+- /market/treemap        (2000 TreemapItems)
+- /charts/{ticker}       (90 ChartDataPoints with multilingual AI text)
+- /scores/top?limit=500  (500 TopTickerResponses)
+
+"before" = build pydantic models, validate against response_model and dump
+           with mode="json" + json.dumps (what FastAPI does for a model return)
+"after"  = build dicts straight from rows + orjson.dumps (current code path)
+
+Usage:
+    python bench_serialization.py [iterations]
+"""
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import List
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.schemas import (
+    TreemapResponse, TreemapSector, TreemapItem,
+    CompleteChartResponse, ChartDataPoint,
+    TopTickerResponse,
+)
+
+random.seed(42)
+TODAY = date(2026, 10, 16)
+SECTORS = [
+    "Information Technology", "Health Care", "Financials", "Consumer Discretionary",
+    "Communication Services", "Industrials", "Consumer Staples", "Energy",
+    "Utilities", "Real Estate", "Materials",
+]
+LONG_TEXT = "시장 분석 요약: 실적 개선과 수급 호조로 단기 상승 모멘텀 유지. " * 20
+
+
+def _fastapi_encode(adapter: TypeAdapter, content) -> bytes:
+    """FastAPI default path: validate → dump_python(mode='json') → json.dumps."""
+    value = adapter.validate_python(content)
+    data = adapter.dump_python(value, mode="json")
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+# ============================
+# Synthetic rows
+# ============================
+def _treemap_rows(n=2000):
+    return [
+        SimpleNamespace(
+            ticker=f"T{i:04d}", name=f"Company {i}", name_ko=f"회사 {i}",
+            sector=SECTORS[i % len(SECTORS)], sub_industry="Sub Industry",
+            change_pct=random.uniform(-5, 5), trading_value=random.uniform(1e6, 1e10),
+            close=random.uniform(10, 500), volume=random.randint(1_000, 50_000_000),
+            score=random.uniform(0, 100), signal="BUY",
+        )
+        for i in range(n)
+    ]
+
+
+def _chart_rows(n=90):
+    rows = []
+    for i in range(n):
+        row = {f: random.uniform(0, 100) for f in ChartDataPoint.model_fields}
+        row.update(
+            date=TODAY - timedelta(days=n - i), volume=random.randint(1_000, 50_000_000),
+            signal="BUY", ai_summary=LONG_TEXT, ai_final_comment=LONG_TEXT,
+            ai_bullish_reasons=["실적 개선", "수급 호조"], ai_bearish_reasons=["밸류에이션 부담"],
+            ai_analysis_ko=LONG_TEXT, ai_analysis_en=LONG_TEXT, ai_analysis_zh=LONG_TEXT,
+            ai_analysis_ja=LONG_TEXT, ai_analysis_es=LONG_TEXT,
+            ai_expert_prediction="bullish", ai_expert_key_factors=["AI", "Cloud"],
+        )
+        rows.append(row)
+    return rows
+
+
+def _top_rows(n=500):
+    return [
+        SimpleNamespace(
+            ticker=f"T{i:04d}", score=100 - i * 0.1, signal="BUY", name=f"Company {i}",
+            name_ko=f"회사 {i}", membership=["SP500"], close=random.uniform(10, 500),
+            change_pct=random.uniform(-5, 5),
+        )
+        for i in range(n)
+    ]
+
+
+# ============================
+# Before / after builders
+# ============================
+def treemap_before(rows):
+    items = [TreemapItem(**vars(r)) for r in rows]
+    sectors = [
+        TreemapSector(sector=s, ticker_count=len(group), items=group)
+        for s in SECTORS for group in [[i for i in items if i.sector == s]]
+    ]
+    model = TreemapResponse(date=TODAY, total_tickers=len(items), sectors=sectors)
+    return _fastapi_encode(TypeAdapter(TreemapResponse), model)
+
+
+def treemap_after(rows):
+    sector_map = {}
+    for r in rows:
+        sector_map.setdefault(r.sector, []).append(dict(vars(r)))
+    sectors = [
+        {"sector": s, "ticker_count": len(items), "avg_change_pct": None,
+         "total_trading_value": None, "items": items}
+        for s, items in sector_map.items()
+    ]
+    return orjson.dumps({"date": TODAY, "total_tickers": len(rows), "sectors": sectors})
+
+
+def chart_before(rows):
+    model = CompleteChartResponse(ticker="AAPL", data=[ChartDataPoint(**r) for r in rows])
+    return _fastapi_encode(TypeAdapter(CompleteChartResponse), model)
+
+
+def chart_after(rows):
+    chart = dict.fromkeys(CompleteChartResponse.model_fields)
+    chart.update(ticker="AAPL", data=[dict(r) for r in rows])
+    return orjson.dumps(chart)
+
+
+def top_before(rows):
+    models = [TopTickerResponse(**vars(r)) for r in rows]
+    return _fastapi_encode(TypeAdapter(List[TopTickerResponse]), models)
+
+
+def top_after(rows):
+    return orjson.dumps([dict(vars(r)) for r in rows])
+
+
+def _time(fn, rows, iterations):
+    fn(rows)  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = fn(rows)
+    return (time.perf_counter() - start) / iterations * 1000, len(body)
+
+
+def main(iterations: int):
+    cases = [
+        ("/market/treemap (2000)", _treemap_rows(), treemap_before, treemap_after),
+        ("/charts/{ticker} (90)", _chart_rows(), chart_before, chart_after),
+        ("/scores/top (500)", _top_rows(), top_before, top_after),
+    ]
+
+    print(f"📊 Serialization benchmark ({iterations} iterations each)\n")
+    print(f"{'endpoint':<26}{'before ms':>12}{'after ms':>12}{'speedup':>10}{'bytes':>12}")
+    for name, rows, before, after in cases:
+        before_ms, _ = _time(before, rows, iterations)
+        after_ms, size = _time(after, rows, iterations)
+        print(f"{name:<26}{before_ms:>12.3f}{after_ms:>12.3f}{before_ms / after_ms:>9.1f}x{size:>12,}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
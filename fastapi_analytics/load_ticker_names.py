@@ -58,6 +58,15 @@ def load_ticker_names(csv_path: str):
                 })
                 inserted_count += 1
 
+        # Rebuild the API's in-memory search index (data version "tickers")
+        conn.execute(text("""
+            INSERT INTO analytics.data_versions (key, version, updated_at)
+            VALUES ('tickers', 1, NOW())
+            ON CONFLICT (key) DO UPDATE SET
+                version = analytics.data_versions.version + 1,
+                updated_at = NOW()
+        """))
+
         conn.commit()
         print(f"✅ Inserted {inserted_count} new tickers")
         print(f"✅ Updated {updated_count} existing tickers")
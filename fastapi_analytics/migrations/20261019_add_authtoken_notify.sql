@@ -0,0 +1,24 @@
+-- Migration: NOTIFY on Django auth token deletion
+-- Date: 2026-10-19
+-- Description: FastAPI workers cache token → user_id (app.services.token_cache) and
+-- LISTEN on "authtoken_invalidated". This trigger on public.authtoken_token (owned by
+-- Django) notifies the key of every deleted or re-keyed token so logouts and token
+-- regeneration take effect immediately instead of after the cache TTL.
+
+CREATE OR REPLACE FUNCTION analytics.notify_authtoken_invalidated()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('authtoken_invalidated', OLD.key);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_authtoken_invalidated ON public.authtoken_token;
+
+CREATE TRIGGER trg_authtoken_invalidated
+    AFTER DELETE OR UPDATE OF key, user_id ON public.authtoken_token
+    FOR EACH ROW
+    EXECUTE FUNCTION analytics.notify_authtoken_invalidated();
+
+-- Verify
+SELECT tgname, tgenabled FROM pg_trigger WHERE tgname = 'trg_authtoken_invalidated';
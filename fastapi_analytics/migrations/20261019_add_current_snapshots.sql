@@ -0,0 +1,85 @@
+-- Migration: Add current calendar / classification snapshot tables
+-- Date: 2026-10-19
+-- Description: Latest ticker_calendar and stock_classifications row per ticker plus
+-- per-category classification counters, maintained by ingest_scores. The upcoming
+-- earnings fallback and /market/classifications/* read these instead of
+-- GROUP BY ticker, MAX(date) subqueries over the multi-year tables.
+
+CREATE TABLE IF NOT EXISTS analytics.ticker_calendar_current (
+    ticker                 VARCHAR(10) PRIMARY KEY,
+    date                   DATE NOT NULL,          -- ticker_calendar.date of the copied row
+    next_earnings_date     DATE,
+    next_earnings_date_end DATE,
+    earnings_confirmed     BOOLEAN DEFAULT FALSE,
+    d_day                  INTEGER,
+    ex_dividend_date       DATE,
+    dividend_date          DATE,
+    earnings_high          DOUBLE PRECISION,
+    earnings_low           DOUBLE PRECISION,
+    earnings_avg           DOUBLE PRECISION,
+    revenue_high           DOUBLE PRECISION,
+    revenue_low            DOUBLE PRECISION,
+    revenue_avg            DOUBLE PRECISION,
+    updated_at             TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_ticker_calendar_current_earnings
+    ON analytics.ticker_calendar_current (next_earnings_date);
+
+CREATE TABLE IF NOT EXISTS analytics.stock_classifications_current (
+    ticker       VARCHAR(10) PRIMARY KEY,
+    date         DATE NOT NULL,                    -- stock_classifications.date of the copied row
+    category     VARCHAR(20) NOT NULL,
+    category_ko  VARCHAR(20) NOT NULL,
+    category_en  VARCHAR(20) NOT NULL,
+    confidence   DOUBLE PRECISION DEFAULT 0.0,
+    reason_ko    TEXT,
+    reason_en    TEXT,
+    metrics_json TEXT,
+    updated_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_stock_classifications_current_category
+    ON analytics.stock_classifications_current (category, confidence DESC);
+
+CREATE TABLE IF NOT EXISTS analytics.classification_counts (
+    category     VARCHAR(20) PRIMARY KEY,
+    ticker_count INTEGER NOT NULL DEFAULT 0,
+    updated_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Backfill
+INSERT INTO analytics.ticker_calendar_current (
+    ticker, date, next_earnings_date, next_earnings_date_end, earnings_confirmed, d_day,
+    ex_dividend_date, dividend_date, earnings_high, earnings_low, earnings_avg,
+    revenue_high, revenue_low, revenue_avg
+)
+SELECT DISTINCT ON (ticker)
+    ticker, date, next_earnings_date, next_earnings_date_end, earnings_confirmed, d_day,
+    ex_dividend_date, dividend_date, earnings_high, earnings_low, earnings_avg,
+    revenue_high, revenue_low, revenue_avg
+FROM analytics.ticker_calendar
+ORDER BY ticker, date DESC
+ON CONFLICT (ticker) DO NOTHING;
+
+INSERT INTO analytics.stock_classifications_current (
+    ticker, date, category, category_ko, category_en, confidence,
+    reason_ko, reason_en, metrics_json
+)
+SELECT DISTINCT ON (ticker)
+    ticker, date, category, category_ko, category_en, confidence,
+    reason_ko, reason_en, metrics_json
+FROM analytics.stock_classifications
+ORDER BY ticker, date DESC
+ON CONFLICT (ticker) DO NOTHING;
+
+INSERT INTO analytics.classification_counts (category, ticker_count)
+SELECT category, COUNT(*)
+FROM analytics.stock_classifications_current
+GROUP BY category
+ON CONFLICT (category) DO UPDATE SET
+    ticker_count = EXCLUDED.ticker_count,
+    updated_at = NOW();
+
+-- Verify
+SELECT category, ticker_count FROM analytics.classification_counts ORDER BY category;
@@ -0,0 +1,10 @@
+-- Migration: Add data_versions table (response cache invalidation)
+-- Date: 2026-10-19
+-- Ingest handlers bump a per-key version (e.g. "ticker:AAPL", "scores", "news");
+-- API workers fold the version into cache keys so a bump invalidates stale entries.
+
+CREATE TABLE IF NOT EXISTS analytics.data_versions (
+    key         VARCHAR(100) PRIMARY KEY,
+    version     BIGINT NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
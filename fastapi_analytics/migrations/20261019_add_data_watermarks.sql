@@ -0,0 +1,30 @@
+-- Migration: Add data_watermarks table (latest date per dataset)
+-- Date: 2026-10-19
+-- Ingest advances the watermark; read paths resolve "latest" from it instead of
+-- running SELECT MAX(date) over the large tables on every request.
+
+CREATE TABLE IF NOT EXISTS analytics.data_watermarks (
+    dataset     VARCHAR(50) PRIMARY KEY,   -- "prices", "scores", "indicators", "macro", ...
+    latest_date DATE NOT NULL,
+    updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Seed from existing data (no-op for datasets that are already tracked)
+INSERT INTO analytics.data_watermarks (dataset, latest_date)
+SELECT dataset, latest_date FROM (
+    SELECT 'prices' AS dataset, (SELECT MAX(date) FROM analytics.ticker_prices) AS latest_date
+    UNION ALL
+    SELECT 'prices_trading_value', (SELECT MAX(date) FROM analytics.ticker_prices WHERE trading_value IS NOT NULL)
+    UNION ALL
+    SELECT 'scores', (SELECT MAX(date) FROM analytics.ticker_scores)
+    UNION ALL
+    SELECT 'indicators', (SELECT MAX(date) FROM analytics.ticker_indicators)
+    UNION ALL
+    SELECT 'macro', (SELECT MAX(date) FROM analytics.macro_indicators WHERE source != 'SIGNAL')
+    UNION ALL
+    SELECT 'macro_signals', (SELECT MAX(date) FROM analytics.macro_indicators WHERE source = 'SIGNAL')
+    UNION ALL
+    SELECT 'indices', (SELECT MAX(date) FROM analytics.market_indices)
+) seed
+WHERE latest_date IS NOT NULL
+ON CONFLICT (dataset) DO NOTHING;
@@ -0,0 +1,51 @@
+-- Migration: Add rolling-window stats columns to macro_indicators
+-- Date: 2026-10-19
+-- Description: 90-day and 1-year high/avg/low plus 1-year percentile rank per
+-- (indicator_code, date), refreshed by ingest_macro_indicators. /macro/indicators,
+-- /macro/signals and /macro/history read them from the row instead of running a
+-- 90-day GROUP BY per request. Backfills every existing row.
+
+ALTER TABLE analytics.macro_indicators
+    ADD COLUMN IF NOT EXISTS high_3m DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS avg_3m DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS low_3m DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS high_1y DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS avg_1y DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS low_1y DOUBLE PRECISION,
+    ADD COLUMN IF NOT EXISTS percentile_1y DOUBLE PRECISION;
+
+-- Backfill (same windows as app/services/macro_stats.py)
+UPDATE analytics.macro_indicators m SET
+    high_3m = s.high_3m, avg_3m = s.avg_3m, low_3m = s.low_3m,
+    high_1y = s.high_1y, avg_1y = s.avg_1y, low_1y = s.low_1y,
+    percentile_1y = (
+        SELECT ROUND((100.0 * COUNT(*) FILTER (WHERE h.value < m.value)
+                      / NULLIF(COUNT(*) - 1, 0))::numeric, 1)
+        FROM analytics.macro_indicators h
+        WHERE h.indicator_code = m.indicator_code
+          AND h.date BETWEEN m.date - 365 AND m.date
+    )
+FROM (
+    SELECT
+        indicator_code, date,
+        ROUND(MAX(value) OVER w3::numeric, 4) AS high_3m,
+        ROUND(AVG(value) OVER w3::numeric, 4) AS avg_3m,
+        ROUND(MIN(value) OVER w3::numeric, 4) AS low_3m,
+        ROUND(MAX(value) OVER w1y::numeric, 4) AS high_1y,
+        ROUND(AVG(value) OVER w1y::numeric, 4) AS avg_1y,
+        ROUND(MIN(value) OVER w1y::numeric, 4) AS low_1y
+    FROM analytics.macro_indicators
+    WINDOW
+        w3 AS (PARTITION BY indicator_code ORDER BY date
+               RANGE BETWEEN INTERVAL '90 days' PRECEDING AND CURRENT ROW),
+        w1y AS (PARTITION BY indicator_code ORDER BY date
+                RANGE BETWEEN INTERVAL '365 days' PRECEDING AND CURRENT ROW)
+) s
+WHERE m.indicator_code = s.indicator_code
+  AND m.date = s.date;
+
+-- Verify
+SELECT indicator_code, date, value, high_3m, avg_3m, low_3m, percentile_1y
+FROM analytics.macro_indicators
+ORDER BY date DESC, indicator_code
+LIMIT 10;
@@ -0,0 +1,26 @@
+-- Migration: Add keyset pagination indexes to analytics.ticker_news
+-- Date: 2026-10-19
+-- Description: /news/latest, /news/ and /news/hot-topics page with a cursor on
+-- (published_at, id) instead of OFFSET; these indexes serve each page as a range scan.
+
+-- /news/latest (all tickers)
+CREATE INDEX IF NOT EXISTS idx_ticker_news_published_id
+    ON analytics.ticker_news (published_at DESC, id DESC);
+
+-- /news/?ticker=
+CREATE INDEX IF NOT EXISTS idx_ticker_news_ticker_published_id
+    ON analytics.ticker_news (ticker, published_at DESC, id DESC);
+
+-- /news/hot-topics (priority ASC NULLS LAST, published_at DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_ticker_news_hot_topic_keyset
+    ON analytics.ticker_news (hot_topic_priority ASC NULLS LAST, published_at DESC, id DESC)
+    WHERE is_hot_topic = TRUE;
+
+-- Fresh statistics for the planner row estimates returned as total
+ANALYZE analytics.ticker_news;
+
+-- Verify
+SELECT indexname, indexdef
+FROM pg_indexes
+WHERE schemaname = 'analytics' AND tablename = 'ticker_news'
+  AND indexname LIKE 'idx_ticker_news_%';
@@ -0,0 +1,68 @@
+-- Migration: Add ticker_daily_wide table (denormalized chart rows)
+-- Date: 2026-10-19
+-- One row per (ticker, date) holding every ChartDataPoint field, so /charts and
+-- /prices range reads are a single index range scan instead of a 7-table merge.
+-- Maintained by /internal/ingest/scores; fill existing history with
+--   python backfill_daily_wide.py
+
+CREATE TABLE IF NOT EXISTS analytics.ticker_daily_wide (
+    ticker                  VARCHAR(50) NOT NULL,
+    date                    DATE NOT NULL,
+    has_price               BOOLEAN NOT NULL DEFAULT FALSE,  -- ticker_prices row exists
+
+    -- ticker_prices
+    open                    DOUBLE PRECISION,
+    high                    DOUBLE PRECISION,
+    low                     DOUBLE PRECISION,
+    close                   DOUBLE PRECISION,
+    volume                  BIGINT,
+
+    -- ticker_scores
+    score                   DOUBLE PRECISION,
+    signal                  VARCHAR(20),
+
+    -- ticker_targets
+    target_price            DOUBLE PRECISION,
+    stop_loss               DOUBLE PRECISION,
+
+    -- ticker_indicators
+    rsi                     DOUBLE PRECISION,
+    mfi                     DOUBLE PRECISION,
+    macd                    DOUBLE PRECISION,
+    macd_signal             DOUBLE PRECISION,
+    macd_hist               DOUBLE PRECISION,
+    bb_width                DOUBLE PRECISION,
+    bb_upper                DOUBLE PRECISION,
+    bb_lower                DOUBLE PRECISION,
+    bb_middle               DOUBLE PRECISION,
+
+    -- ticker_institutions
+    inst_ownership          DOUBLE PRECISION,
+    foreign_ownership       DOUBLE PRECISION,
+    insider_ownership       DOUBLE PRECISION,
+    inst_chg_1d             DOUBLE PRECISION,
+    inst_chg_5d             DOUBLE PRECISION,
+    foreign_chg_1d          DOUBLE PRECISION,
+    foreign_chg_5d          DOUBLE PRECISION,
+
+    -- ticker_shorts
+    short_ratio             DOUBLE PRECISION,
+    short_percent_float     DOUBLE PRECISION,
+
+    -- ticker_ai_analysis
+    ai_probability          DOUBLE PRECISION,
+    ai_summary              VARCHAR(4000),
+    ai_bullish_reasons      JSONB,
+    ai_bearish_reasons      JSONB,
+    ai_final_comment        VARCHAR(4000),
+    ai_analysis_ko          TEXT,
+    ai_analysis_en          TEXT,
+    ai_analysis_zh          TEXT,
+    ai_analysis_ja          TEXT,
+    ai_analysis_es          TEXT,
+    ai_expert_prediction    VARCHAR(20),
+    ai_expert_key_factors   JSONB,
+
+    updated_at              TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (ticker, date)
+);
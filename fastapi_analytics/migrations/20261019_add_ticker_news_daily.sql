@@ -0,0 +1,44 @@
+-- Migration: Add ticker_news_daily sentiment counter table
+-- Date: 2026-10-19
+-- Description: Per-ticker daily article count, bullish/neutral/bearish counts and sentiment sum,
+-- maintained incrementally by ingest_news. Chart sentiment stats (7d / 30d) and
+-- /news/summary sum at most 30 rows instead of scanning ticker_news.
+-- Repair / re-run later with: python backfill_news_daily.py
+
+CREATE TABLE IF NOT EXISTS analytics.ticker_news_daily (
+    ticker        VARCHAR(10) NOT NULL,
+    date          DATE NOT NULL,               -- ticker_news.date (collection date)
+    article_count INTEGER NOT NULL DEFAULT 0,  -- all articles (any sentiment_grade)
+    bullish_count INTEGER NOT NULL DEFAULT 0,
+    neutral_count INTEGER NOT NULL DEFAULT 0,
+    bearish_count INTEGER NOT NULL DEFAULT 0,
+    sentiment_sum BIGINT NOT NULL DEFAULT 0,
+    updated_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (ticker, date)
+);
+
+-- Backfill from existing news (same aggregation as news_rollups.rebuild_daily_counts)
+INSERT INTO analytics.ticker_news_daily
+    (ticker, date, article_count, bullish_count, neutral_count, bearish_count, sentiment_sum, updated_at)
+SELECT
+    ticker,
+    date,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE sentiment_grade = 'bullish'),
+    COUNT(*) FILTER (WHERE sentiment_grade = 'neutral'),
+    COUNT(*) FILTER (WHERE sentiment_grade = 'bearish'),
+    COALESCE(SUM(sentiment_score), 0),
+    NOW()
+FROM analytics.ticker_news
+GROUP BY ticker, date
+ON CONFLICT (ticker, date) DO UPDATE SET
+    article_count = EXCLUDED.article_count,
+    bullish_count = EXCLUDED.bullish_count,
+    neutral_count = EXCLUDED.neutral_count,
+    bearish_count = EXCLUDED.bearish_count,
+    sentiment_sum = EXCLUDED.sentiment_sum,
+    updated_at = NOW();
+
+-- Verify
+SELECT COUNT(*) AS rows, SUM(article_count) AS articles, MIN(date), MAX(date)
+FROM analytics.ticker_news_daily;
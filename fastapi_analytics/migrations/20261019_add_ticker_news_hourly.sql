@@ -0,0 +1,43 @@
+-- Migration: Add ticker_news_hourly rollup table
+-- Date: 2026-10-19
+-- Description: Per-ticker hourly news mention counts and sentiment sums, maintained
+-- incrementally by ingest_news. /news/mention-bubble sums at most 72 buckets per
+-- ticker instead of grouping raw ticker_news rows.
+
+CREATE TABLE IF NOT EXISTS analytics.ticker_news_hourly (
+    ticker        VARCHAR(10) NOT NULL,
+    hour_bucket   TIMESTAMP NOT NULL,          -- date_trunc('hour', published_at)
+    mention_count INTEGER NOT NULL DEFAULT 0,
+    sentiment_sum BIGINT NOT NULL DEFAULT 0,
+    bullish_count INTEGER NOT NULL DEFAULT 0,
+    bearish_count INTEGER NOT NULL DEFAULT 0,
+    updated_at    TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (ticker, hour_bucket)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ticker_news_hourly_bucket
+    ON analytics.ticker_news_hourly (hour_bucket);
+
+-- Backfill the retention window (7 days) from existing news
+INSERT INTO analytics.ticker_news_hourly
+    (ticker, hour_bucket, mention_count, sentiment_sum, bullish_count, bearish_count)
+SELECT
+    ticker,
+    date_trunc('hour', published_at),
+    COUNT(*),
+    SUM(sentiment_score),
+    COUNT(*) FILTER (WHERE sentiment_grade = 'bullish'),
+    COUNT(*) FILTER (WHERE sentiment_grade = 'bearish')
+FROM analytics.ticker_news
+WHERE published_at >= date_trunc('hour', NOW() AT TIME ZONE 'UTC') - INTERVAL '7 days'
+GROUP BY ticker, date_trunc('hour', published_at)
+ON CONFLICT (ticker, hour_bucket) DO UPDATE SET
+    mention_count = EXCLUDED.mention_count,
+    sentiment_sum = EXCLUDED.sentiment_sum,
+    bullish_count = EXCLUDED.bullish_count,
+    bearish_count = EXCLUDED.bearish_count,
+    updated_at = NOW();
+
+-- Verify
+SELECT COUNT(*) AS buckets, MIN(hour_bucket), MAX(hour_bucket)
+FROM analytics.ticker_news_hourly;
@@ -0,0 +1,14 @@
+-- Migration: Add ticker_static_sections table (pre-rendered chart snapshot sections)
+-- Date: 2026-10-19
+-- Stores the serialized slow-changing sections of CompleteChartResponse per ticker
+-- (profile, key_metrics, financials, dividends, calendar, earnings_history,
+--  defense_lines, recommendations, institutional_holders, classification).
+-- Rebuilt by /internal/ingest/scores; /charts/{ticker} splices the JSON blob in
+-- and only queries the date-ranged series live.
+
+CREATE TABLE IF NOT EXISTS analytics.ticker_static_sections (
+    ticker      VARCHAR(50) PRIMARY KEY,
+    body        TEXT NOT NULL,          -- JSON object with the 10 static sections
+    built_on    DATE NOT NULL,          -- calendar.earnings_days_remaining is relative to this day
+    updated_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);